@@ -0,0 +1,199 @@
+"""Synthetic tables and the benchmark cases that run on them.
+
+Each case is a function that takes the input frame and returns a zero-argument callable. Any
+setup (e.g., creating the `GT` object to format or render) happens in the case function, so that
+only the returned callable is timed.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Any, Callable
+
+import numpy as np
+
+from great_tables import GT, loc, style
+from great_tables._scss import compile_scss
+
+BACKENDS = ("pandas", "polars", "pyarrow")
+
+N_GROUPS = 10
+
+
+def make_data(n_rows: int, n_cols: int, seed: int = 0) -> dict[str, list[Any]]:
+    """Create the columns of a synthetic table.
+
+    There are `n_cols` numeric columns (`num_0`, `num_1`, ...), along with a row label column,
+    a group column, a date column and a column of values for nanoplots.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    data: dict[str, list[Any]] = {
+        "label": [f"row_{ii}" for ii in range(n_rows)],
+        "group": [f"group_{ii % N_GROUPS}" for ii in range(n_rows)],
+    }
+
+    for jj in range(n_cols):
+        values = rng.normal(loc=1000, scale=500, size=n_rows).round(4)
+        data[f"num_{jj}"] = values.tolist()
+
+    days = rng.integers(0, 365 * 30, size=n_rows)
+    dates = np.datetime64("1990-01-01") + days.astype("timedelta64[D]")
+    data["date"] = [str(date) for date in dates]
+    data["spark"] = [
+        " ".join(str(x) for x in row) for row in rng.integers(0, 100, size=(n_rows, 8)).tolist()
+    ]
+
+    return data
+
+
+def make_frame(backend: str, data: dict[str, list[Any]]) -> Any:
+    """Convert the columns from `make_data()` to a DataFrame of the given backend."""
+
+    if backend == "pandas":
+        import pandas as pd
+
+        return pd.DataFrame(data)
+    elif backend == "polars":
+        import polars as pl
+
+        return pl.DataFrame(data)
+    elif backend == "pyarrow":
+        import pyarrow as pa
+
+        return pa.table(data)
+
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def _num_cols(df: Any) -> list[str]:
+    return [name for name in _column_names(df) if name.startswith("num_")]
+
+
+def _column_names(df: Any) -> list[str]:
+    if hasattr(df, "column_names"):
+        return list(df.column_names)
+    return list(df.columns)
+
+
+def _gt(df: Any) -> GT:
+    with warnings.catch_warnings():
+        # pyarrow support emits an "experimental" warning on every construction
+        warnings.simplefilter("ignore")
+        return GT(df, rowname_col="label", groupname_col="group", id="bench")
+
+
+def _gt_plain(df: Any) -> GT:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return GT(df, id="bench")
+
+
+# Construction ----
+
+
+def case_construct(df: Any) -> Callable[[], Any]:
+    return lambda: _gt(df)
+
+
+# Formatting ----
+# The fmt_*() methods only record the formatter, so the formatting itself is timed by building
+# the table body for HTML output.
+
+
+def _fmt_case(method: str, columns: Callable[[Any], Any], **kwargs: Any):
+    def case(df: Any) -> Callable[[], Any]:
+        gt = getattr(_gt(df), method)(columns(df), **kwargs)
+        return lambda: gt._build_data("html")
+
+    case.__name__ = f"case_{method}"
+    return case
+
+
+case_fmt_number = _fmt_case("fmt_number", _num_cols, decimals=2)
+case_fmt_integer = _fmt_case("fmt_integer", _num_cols)
+case_fmt_percent = _fmt_case("fmt_percent", _num_cols)
+case_fmt_scientific = _fmt_case("fmt_scientific", _num_cols)
+case_fmt_currency = _fmt_case("fmt_currency", _num_cols, currency="EUR")
+case_fmt_date = _fmt_case("fmt_date", lambda df: "date", date_style="wday_month_day_year")
+case_fmt_nanoplot = _fmt_case("fmt_nanoplot", lambda df: "spark")
+
+
+# Styling ----
+
+
+def case_tab_style(df: Any) -> Callable[[], Any]:
+    gt = _gt(df)
+    locations = loc.body(columns=_num_cols(df), rows=list(range(0, len(gt._stub), 2)))
+
+    return lambda: gt.tab_style(style.fill(color="lightblue"), locations)
+
+
+def case_data_color(df: Any) -> Callable[[], Any]:
+    gt = _gt(df)
+    columns = _num_cols(df)
+
+    return lambda: gt.data_color(columns=columns, palette="viridis")
+
+
+# Rendering ----
+
+
+def case_as_raw_html(df: Any) -> Callable[[], Any]:
+    gt = _gt(df).fmt_number(_num_cols(df), decimals=2)
+    return lambda: gt.as_raw_html()
+
+
+def case_as_raw_html_styled(df: Any) -> Callable[[], Any]:
+    gt = (
+        _gt(df)
+        .fmt_number(_num_cols(df), decimals=2)
+        .data_color(columns=_num_cols(df)[:1], palette="viridis")
+    )
+    return lambda: gt.as_raw_html()
+
+
+def case_as_raw_html_inline_css(df: Any) -> Callable[[], Any]:
+    gt = _gt(df).fmt_number(_num_cols(df), decimals=2)
+    return lambda: gt.as_raw_html(inline_css=True)
+
+
+def case_as_latex(df: Any) -> Callable[[], Any]:
+    # LaTeX output doesn't support a table stub yet
+    gt = _gt_plain(df).fmt_number(_num_cols(df), decimals=2)
+    return lambda: gt.as_latex()
+
+
+def case_compile_scss(df: Any) -> Callable[[], Any]:
+    gt = _gt(df)
+    return lambda: compile_scss(gt, id="bench", all_important=False)
+
+
+# Steps that the (experimental) pyarrow backend doesn't support yet. These are skipped, while
+# any other case that raises an error is reported as a failure.
+UNSUPPORTED: set[tuple[str, str]] = {
+    ("fmt_date", "pyarrow"),
+    ("fmt_nanoplot", "pyarrow"),
+    ("data_color", "pyarrow"),
+    ("as_raw_html_styled", "pyarrow"),
+}
+
+
+CASES: dict[str, Callable[[Any], Callable[[], Any]]] = {
+    "construct": case_construct,
+    "fmt_number": case_fmt_number,
+    "fmt_integer": case_fmt_integer,
+    "fmt_percent": case_fmt_percent,
+    "fmt_scientific": case_fmt_scientific,
+    "fmt_currency": case_fmt_currency,
+    "fmt_date": case_fmt_date,
+    "fmt_nanoplot": case_fmt_nanoplot,
+    "tab_style": case_tab_style,
+    "data_color": case_data_color,
+    "as_raw_html": case_as_raw_html,
+    "as_raw_html_styled": case_as_raw_html_styled,
+    "as_raw_html_inline_css": case_as_raw_html_inline_css,
+    "as_latex": case_as_latex,
+    "compile_scss": case_compile_scss,
+}
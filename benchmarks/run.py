@@ -0,0 +1,331 @@
+"""Run the Great Tables benchmarks and optionally compare them against a saved baseline.
+
+Examples
+--------
+Record a baseline, make some changes, and then check for regressions:
+
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json
+
+Run it as a module from the root of the repository, so that `benchmarks` is importable.
+
+The run exits with a non-zero status when any case fails. The comparison also does so when any
+case is slower (or uses more memory) than the baseline by more than the allowed ratio, or when a
+case in the baseline is missing from the results. Only the standard library and the optional
+DataFrame libraries are needed, so the benchmarks run offline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from functools import partial
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable
+
+from .cases import BACKENDS, CASES, UNSUPPORTED, make_data, make_frame
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    case: str
+    backend: str
+    rows: int
+    cols: int
+    min: float
+    median: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> tuple[str, str, int, int]:
+        return (self.case, self.backend, self.rows, self.cols)
+
+
+def time_callable(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> list[float]:
+    """Return the wall times (in seconds) of calling `fn` `repeat` times."""
+
+    for _ in range(warmup):
+        fn()
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    """Return the peak number of bytes allocated while calling `fn` once."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def run(
+    cases: list[str],
+    backends: list[str],
+    rows: list[int],
+    cols: list[int],
+    repeat: int,
+    memory: bool = True,
+) -> tuple[list[BenchResult], list[str]]:
+    """Run the cases, and return their results along with a message for each case that failed."""
+
+    results = []
+    failures = []
+
+    for backend in backends:
+        for n_rows in rows:
+            for n_cols in cols:
+                df = make_frame(backend, make_data(n_rows, n_cols))
+
+                for case in cases:
+                    name = f"{case}[{backend}, {n_rows}x{n_cols}]"
+
+                    if (case, backend) in UNSUPPORTED:
+                        print(f"{name:<50} skipped: not supported by {backend}", flush=True)
+                        continue
+
+                    try:
+                        fn = CASES[case](df)
+                        times = time_callable(fn, repeat=repeat)
+                        peak = peak_memory(fn) if memory else 0
+                    except Exception as e:
+                        # carry on with the other cases, but fail the run at the end
+                        msg = f"{name}: failed: {type(e).__name__}: {e}"
+                        print(f"{name:<50} failed: {type(e).__name__}: {e}", flush=True)
+                        failures.append(msg)
+                        continue
+
+                    res = BenchResult(
+                        case=case,
+                        backend=backend,
+                        rows=n_rows,
+                        cols=n_cols,
+                        min=min(times),
+                        median=statistics.median(times),
+                        peak_bytes=peak,
+                    )
+                    print(_format_result(res), flush=True)
+                    results.append(res)
+
+    return results, failures
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: list[BenchResult],
+    max_ratio: float,
+    max_memory_ratio: float,
+    min_seconds: float,
+) -> list[str]:
+    """Return a message for each result that regressed against the baseline.
+
+    Times are compared using the minimum over repeats, which is the least noisy estimate. Cases
+    whose baseline time is below `min_seconds` are only checked for memory, since timer noise
+    dominates at that scale. Cases in the baseline that are missing from the results (e.g.,
+    because they now fail) are regressions too, while new cases are not checked.
+    """
+
+    by_key = {res.key: res for res in results}
+    regressions = []
+
+    for base in baseline:
+        label = "{}[{}, {}x{}]".format(*base.key)
+
+        res = by_key.get(base.key)
+        if res is None:
+            regressions.append(f"{label}: missing from the results")
+            continue
+
+        if base.min >= min_seconds and res.min > base.min * max_ratio:
+            regressions.append(
+                f"{label}: time {base.min:.4f}s -> {res.min:.4f}s ({res.min / base.min:.2f}x)"
+            )
+
+        if base.peak_bytes and res.peak_bytes > base.peak_bytes * max_memory_ratio:
+            regressions.append(
+                f"{label}: peak memory {_mb(base.peak_bytes)} -> {_mb(res.peak_bytes)}"
+                f" ({res.peak_bytes / base.peak_bytes:.2f}x)"
+            )
+
+    return regressions
+
+
+def best_of(*runs: list[BenchResult]) -> list[BenchResult]:
+    """Combine runs of the same cases, keeping the fastest time and lowest peak memory of each."""
+
+    best: dict[tuple[str, str, int, int], BenchResult] = {}
+
+    for results in runs:
+        for res in results:
+            prev = best.get(res.key)
+            if prev is None:
+                best[res.key] = res
+            else:
+                fastest = prev if prev.min <= res.min else res
+                best[res.key] = replace(fastest, peak_bytes=min(prev.peak_bytes, res.peak_bytes))
+
+    return list(best.values())
+
+
+def load_results(path: str | Path) -> list[BenchResult]:
+    content = json.loads(Path(path).read_text())
+    return [BenchResult(**entry) for entry in content["results"]]
+
+
+def save_results(path: str | Path, results: list[BenchResult]) -> None:
+    content = {"meta": _environment(), "results": [asdict(res) for res in results]}
+    Path(path).write_text(json.dumps(content, indent=2))
+
+
+def _environment() -> dict[str, str]:
+    import great_tables
+
+    env = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "great_tables": great_tables.__version__,
+    }
+
+    for mod_name in ["numpy", "pandas", "polars", "pyarrow"]:
+        if find_spec(mod_name) is not None:
+            env[mod_name] = __import__(mod_name).__version__
+
+    return env
+
+
+def _mb(n_bytes: int) -> str:
+    return f"{n_bytes / 1024**2:.1f}MB"
+
+
+def _format_result(res: BenchResult) -> str:
+    name = f"{res.case}[{res.backend}, {res.rows}x{res.cols}]"
+    mem = f"  peak {_mb(res.peak_bytes)}" if res.peak_bytes else ""
+    return f"{name:<50} min {res.min:8.4f}s  median {res.median:8.4f}s{mem}"
+
+
+def _int_list(x: str) -> list[int]:
+    return [int(el) for el in x.split(",")]
+
+
+def _str_list(x: str) -> list[str]:
+    return x.split(",")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--cases", type=_str_list, default=list(CASES))
+    parser.add_argument(
+        "--backends",
+        type=_str_list,
+        default=[backend for backend in BACKENDS if find_spec(backend) is not None],
+    )
+    parser.add_argument("--rows", type=_int_list, default=[1_000, 10_000])
+    parser.add_argument("--cols", type=_int_list, default=[10])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip the (slower) tracemalloc pass."
+    )
+    parser.add_argument("--save", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Compare against results saved with --save.")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=1.25,
+        help="Allowed slowdown relative to the baseline (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--max-memory-ratio",
+        type=float,
+        default=1.25,
+        help="Allowed increase in peak memory relative to the baseline (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.05,
+        help="Baseline times below this are too noisy to compare (default: %(default)s).",
+    )
+
+    args = parser.parse_args(argv)
+
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown cases: {sorted(unknown)}. Choose from {list(CASES)}.")
+
+    run_selected = partial(
+        run,
+        cases=args.cases,
+        backends=args.backends,
+        rows=args.rows,
+        cols=args.cols,
+        repeat=args.repeat,
+        memory=not args.no_memory,
+    )
+
+    results, failures = run_selected()
+
+    if args.save:
+        save_results(args.save, results)
+
+    if failures:
+        print("\nFailed cases:\n")
+        print("\n".join(f"  * {msg}" for msg in failures))
+
+    if args.compare:
+        # only the cases that were selected for this run are expected in the results
+        selected = (set(args.cases), set(args.backends), set(args.rows), set(args.cols))
+        baseline = [
+            base
+            for base in load_results(args.compare)
+            if all(value in choices for value, choices in zip(base.key, selected))
+        ]
+
+        check = partial(
+            compare,
+            baseline=baseline,
+            max_ratio=args.max_ratio,
+            max_memory_ratio=args.max_memory_ratio,
+            min_seconds=args.min_seconds,
+        )
+
+        regressions = check(results)
+
+        if regressions:
+            # a busy machine can slow down a whole run, so confirm the regressions with a second
+            # run (keeping the best result of each case) before reporting them
+            print("\nPossible regressions against the baseline, running the cases again.\n")
+            rerun_results, _ = run_selected()
+            regressions = check(best_of(results, rerun_results))
+
+        if regressions:
+            print("\nRegressions against the baseline:\n")
+            print("\n".join(f"  * {msg}" for msg in regressions))
+            return 1
+
+        print("\nNo regressions against the baseline.")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,8 +8,10 @@ del _v
 # Main gt imports ----
 
 from .gt import GT
-from . import vals, loc, style
+from . import vals, loc, style, config
 from ._styles import FromColumn as from_column
+from ._export import shared_css
+from ._profile import profile_render
 from ._helpers import (
     letters,
     LETTERS,
@@ -40,9 +42,12 @@ __all__ = (
     "nanoplot_options",
     "random_id",
     "from_column",
+    "shared_css",
+    "profile_render",
     "vals",
     "loc",
     "style",
+    "config",
 )
 
 
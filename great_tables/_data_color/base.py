@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-from great_tables._locations import resolve_cols_c, resolve_rows_i, RowSelectExpr
+from great_tables._locations import resolve_cols_c, resolve_rows_pos, RowSelectExpr
 from great_tables._tbl_data import DataFrameLike, is_na, SelectExpr
 from great_tables.loc import body
 from great_tables.style import fill, text
@@ -213,8 +213,7 @@ def data_color(
     else:
         columns_resolved = resolve_cols_c(data=self, expr=columns)
 
-    row_res = resolve_rows_i(self, rows)
-    row_pos = [name_pos[1] for name_pos in row_res]
+    row_pos = resolve_rows_pos(self, rows)
 
     gt_obj = self
 
@@ -274,12 +273,12 @@ def data_color(
 
                 gt_obj = gt_obj.tab_style(
                     style=[text(color=fgnd_color), fill(color=color_val)],
-                    locations=body(columns=col, rows=[i]),
+                    locations=body(columns=col, rows=[int(i)]),
                 )
 
             else:
                 gt_obj = gt_obj.tab_style(
-                    style=fill(color=color_val), locations=body(columns=col, rows=[i])
+                    style=fill(color=color_val), locations=body(columns=col, rows=[int(i)])
                 )
     return gt_obj
 
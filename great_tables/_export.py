@@ -7,15 +7,14 @@ import webbrowser
 from functools import partial
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, TextIO
 
 from css_inline import inline, inline_fragment
 from typing_extensions import TypeAlias
 
-from ._helpers import random_id
-from ._scss import compile_scss
+from ._scss import compile_scss, compile_shared_css
 from ._utils import _try_import
-from ._utils_render_latex import _render_as_latex
+from ._utils_render_latex import _render_as_latex, _write_latex
 
 if TYPE_CHECKING:
     # Note that as_raw_html uses methods on the GT class, not just data
@@ -132,6 +131,7 @@ def as_raw_html(
     inline_css: bool = False,
     make_page: bool = False,
     all_important: bool = False,
+    shared_css: bool = False,
 ) -> str:
     """
     Get the HTML content of a GT object.
@@ -152,6 +152,13 @@ def as_raw_html(
     make_page
         An option to wrap the table in a complete HTML page. This is useful when you want to display
         the table in a web browser.
+    all_important
+        An option to add `!important` to all CSS declarations of the table.
+    shared_css
+        An option to leave out the CSS that is the same for all tables. Only the CSS for options
+        that differ from their defaults is included with the table. This greatly reduces the size
+        of pages that contain many tables, but the shared CSS (obtained with `shared_css()`) must
+        then be included once in the page. This can't be combined with `inline_css=True`.
 
     Returns
     -------
@@ -216,18 +223,33 @@ def as_raw_html(
     ```{python}
     gt_tbl.as_raw_html(inline_css=True)
     ```
+
+    When a page holds many tables, it's wasteful for each of them to carry a full stylesheet. With
+    `shared_css=True`, the table's HTML only holds the CSS that is specific to it.
+
+    ```{python}
+    gt_tbl.as_raw_html(shared_css=True)
+    ```
+
+    The CSS that is common to all tables is then obtained once from `shared_css()` and placed
+    in the page (e.g., inside a `<style>` element in the page's `<head>`).
     """
+    if inline_css and shared_css:
+        raise ValueError("The `inline_css=` and `shared_css=` options can't both be `True`.")
+
     built_table = self._build_data(context="html")
 
     if not inline_css:
         html_table = built_table._render_as_html(
             make_page=make_page,
             all_important=all_important,
+            shared_css=shared_css,
         )
 
         return html_table
 
-    table_html = built_table._render_as_html(
+    # The same ID is used for the rendered table and for the CSS that's inlined into it
+    table_html, id = built_table._render_as_html_with_id(
         make_page=make_page,
         all_important=all_important,
     )
@@ -236,14 +258,6 @@ def as_raw_html(
         inlined = inline(html=table_html)
 
     else:
-        # Obtain the `table_id` value from the Options (might be set, might be None)
-        table_id = self._options.table_id.value
-
-        if table_id is None:
-            id = random_id()
-        else:
-            id = table_id
-
         # Compile the SCSS as CSS
         table_css = str(compile_scss(self, id=id, compress=False, all_important=all_important))
 
@@ -252,6 +266,43 @@ def as_raw_html(
     return inlined
 
 
+def shared_css(all_important: bool = False) -> str:
+    """
+    Get the CSS shared by tables rendered with `shared_css=True`.
+
+    Tables rendered with `GT.as_raw_html(shared_css=True)` don't carry their own full stylesheet.
+    Instead, the CSS that is common to all tables should be included once in the page (or document)
+    that contains them. This function returns that CSS.
+
+    Parameters
+    ----------
+    all_important
+        An option to add `!important` to all CSS declarations.
+
+    Returns
+    -------
+    str
+        The CSS common to all tables, as a string.
+
+    Examples
+    --------
+    Let's put a few tables in one HTML page, all using the same stylesheet.
+
+    ```{python}
+    from great_tables import GT, exibble, shared_css
+
+    tables = [
+        GT(exibble[["num", "char"]].head(2)).as_raw_html(shared_css=True),
+        GT(exibble[["fctr", "date"]].head(2)).as_raw_html(shared_css=True),
+    ]
+
+    page = f"<style>{shared_css()}</style>" + "".join(tables)
+    ```
+    """
+
+    return compile_shared_css(all_important=all_important)
+
+
 def as_latex(self: GT, use_longtable: bool = False, tbl_pos: str | None = None) -> str:
     """
     Output a GT object as LaTeX
@@ -344,6 +395,90 @@ def as_latex(self: GT, use_longtable: bool = False, tbl_pos: str | None = None)
     return latex_table
 
 
+def write_latex(
+    self: GT,
+    stream: str | Path | TextIO,
+    use_longtable: bool = False,
+    tbl_pos: str | None = None,
+    encoding: str = "utf-8",
+    chunk_size: int = 1000,
+) -> None:
+    """
+    Write a GT object as LaTeX to a file or stream
+
+    The `write_latex()` method writes the same LaTeX fragment that `as_latex()` returns, but it
+    does so a chunk of rows at a time. The LaTeX for the table body is never assembled into one
+    large string, which keeps memory use down when writing tables with many thousands of rows
+    (especially with `use_longtable=True`, which allows the table to span multiple pages).
+
+    :::{.callout-warning}
+    `write_latex()` is still experimental.
+    :::
+
+    Parameters
+    ----------
+    stream
+        Where to write the LaTeX. This can be a file path (as a string or a `pathlib.Path`
+        object), or an object with a `write()` method that takes strings (e.g., a file opened in
+        text mode, or an `io.StringIO` object).
+    use_longtable
+        An option to use the `longtable` environment in LaTeX output. This is useful for tables that
+        span multiple pages and don't require precise positioning.
+    tbl_pos
+        The position of the table in the LaTeX output when `use_longtable=False`. See `as_latex()`
+        for the valid values.
+    encoding
+        The encoding used when `stream=` is a file path. Defaults to `"utf-8"`.
+    chunk_size
+        The number of body rows to write at a time.
+
+    Returns
+    -------
+    None
+        The LaTeX is written to `stream=` and the method returns `None`.
+
+    Limitations
+    -----------
+    The same limitations apply as for `as_latex()`.
+
+    Examples
+    --------
+    Let's write a table with a few hundred rows of the `sza` dataset to a `.tex` file, using the
+    `longtable` environment.
+
+    ```python
+    from great_tables import GT
+    from great_tables.data import sza
+
+    GT(sza).fmt_number(columns="sza", decimals=1).write_latex("sza.tex", use_longtable=True)
+    ```
+
+    The LaTeX can also be written to an open file (or any other stream), which is useful when the
+    table is one part of a larger document.
+
+    ```python
+    with open("report.tex", "w") as f:
+        f.write("\\\\section{Solar Zenith Angles}\\n")
+        GT(sza).write_latex(f, use_longtable=True)
+    ```
+    """
+
+    if chunk_size < 1:
+        raise ValueError("`chunk_size=` must be a positive integer.")
+
+    built_table = self._build_data(context="latex")
+
+    if isinstance(stream, (str, Path)):
+        with open(stream, "w", encoding=encoding) as f:
+            _write_latex(
+                built_table, f, use_longtable=use_longtable, tbl_pos=tbl_pos, chunk_size=chunk_size
+            )
+    else:
+        _write_latex(
+            built_table, stream, use_longtable=use_longtable, tbl_pos=tbl_pos, chunk_size=chunk_size
+        )
+
+
 # Create a list of all selenium webdrivers
 WebDrivers: TypeAlias = Literal[
     "chrome",
@@ -575,6 +710,7 @@ def write_raw_html(
     newline: str | None = None,
     make_page: bool = False,
     all_important: bool = False,
+    shared_css: bool = False,
 ) -> None:
     """
     Write the table to an HTML file.
@@ -596,6 +732,13 @@ def write_raw_html(
         largely supported in email clients over using CSS in a `<style>` block.
     newline
         The newline character to use when writing the file. Defaults to `os.linesep`.
+    make_page
+        An option to wrap the table in a complete HTML page.
+    all_important
+        An option to add `!important` to all CSS declarations of the table.
+    shared_css
+        An option to leave out the CSS that is the same for all tables (see `GT.as_raw_html()`).
+
     Returns
     -------
     None
@@ -604,7 +747,11 @@ def write_raw_html(
     import os
 
     html_content = as_raw_html(
-        gt, inline_css=inline_css, make_page=make_page, all_important=all_important
+        gt,
+        inline_css=inline_css,
+        make_page=make_page,
+        all_important=all_important,
+        shared_css=shared_css,
     )
 
     newline = newline if newline is not None else os.linesep
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Callable, ClassVar, Literal, TypedDict, T
 
 import babel
 import faicons
+import numpy as np
 from babel.dates import format_date, format_datetime, format_time
 from typing_extensions import TypeAlias
 
@@ -22,20 +23,22 @@ from ._locale import (
     _get_flags_data,
     _get_locales_data,
 )
-from ._locations import resolve_cols_c, resolve_rows_i
+from ._locations import resolve_cols_c, resolve_rows_pos
 from ._tbl_data import (
     Agnostic,
     DataFrameLike,
     PlExpr,
     SelectExpr,
     _get_column_dtype,
+    flatten_list_column,
     is_na,
     is_series,
     to_list,
+    to_numeric_array,
 )
 from ._text import _md_html, escape_pattern_str_latex
 from ._utils import _str_detect, _str_replace, is_valid_http_schema
-from ._utils_nanoplots import _generate_nanoplot
+from ._utils_nanoplots import _array_extremes, _generate_nanoplot
 
 if TYPE_CHECKING:
     from ._types import GTSelf
@@ -136,17 +139,16 @@ def fmt(
     if isinstance(fns, Callable):
         fns = FormatFns(default=fns)
 
-    row_res = resolve_rows_i(self, rows)
-    row_pos = [name_pos[1] for name_pos in row_res]
+    row_pos = resolve_rows_pos(self, rows)
 
     col_res = resolve_cols_c(self, columns)
 
     formatter = FormatInfo(fns, col_res, row_pos)
 
     if is_substitution:
-        return self._replace(_substitutions=[*self._substitutions, formatter])
+        return self._replace(_substitutions=self._substitutions + [formatter])
 
-    return self._replace(_formats=[*self._formats, formatter])
+    return self._replace(_formats=self._formats + [formatter])
 
 
 def fmt_number(
@@ -289,15 +291,55 @@ def fmt_number(
     Take a look at the functional version of this method:
     [`val_fmt_number()`](`great_tables._formats_vals.val_fmt_number`).
     """
-    locale = _resolve_locale(self, locale=locale)
+
+    pf_format = make_fmt_number_fn(
+        self._tbl_schema,
+        decimals=decimals,
+        n_sigfig=n_sigfig,
+        drop_trailing_zeros=drop_trailing_zeros,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        use_seps=use_seps,
+        accounting=accounting,
+        scale_by=scale_by,
+        compact=compact,
+        pattern=pattern,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign=force_sign,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_number_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    decimals: int,
+    n_sigfig: int | None,
+    drop_trailing_zeros: bool,
+    drop_trailing_dec_mark: bool,
+    use_seps: bool,
+    accounting: bool,
+    scale_by: float,
+    compact: bool,
+    pattern: str,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign: bool,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_number()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Use locale-based marks if a locale ID is provided
     sep_mark = _get_locale_sep_mark(default=sep_mark, use_seps=use_seps, locale=locale)
     dec_mark = _get_locale_dec_mark(default=dec_mark, locale=locale)
 
-    pf_format = partial(
+    return partial(
         fmt_number_context,
-        data=self,
+        dispatch_on=dispatch_on,
         decimals=decimals,
         n_sigfig=n_sigfig,
         drop_trailing_zeros=drop_trailing_zeros,
@@ -312,12 +354,10 @@ def fmt_number(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_number_context(
     x: float | None,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     decimals: int,
     n_sigfig: int | None,
     drop_trailing_zeros: bool,
@@ -332,7 +372,7 @@ def fmt_number_context(
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Scale `x` value by a defined `scale_by` value
@@ -496,14 +536,43 @@ def fmt_integer(
     [`val_fmt_integer()`](`great_tables._formats_vals.val_fmt_integer`).
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_integer_fn(
+        self._tbl_schema,
+        use_seps=use_seps,
+        scale_by=scale_by,
+        accounting=accounting,
+        compact=compact,
+        pattern=pattern,
+        sep_mark=sep_mark,
+        force_sign=force_sign,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_integer_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    use_seps: bool,
+    scale_by: float,
+    accounting: bool,
+    compact: bool,
+    pattern: str,
+    sep_mark: str,
+    force_sign: bool,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_integer()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Use locale-based marks if a locale ID is provided
     sep_mark = _get_locale_sep_mark(default=sep_mark, use_seps=use_seps, locale=locale)
 
-    pf_format = partial(
+    return partial(
         fmt_integer_context,
-        data=self,
+        dispatch_on=dispatch_on,
         use_seps=use_seps,
         scale_by=scale_by,
         accounting=accounting,
@@ -513,12 +582,10 @@ def fmt_integer(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_integer_context(
     x: float | None,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     use_seps: bool,
     scale_by: float,
     accounting: bool,
@@ -528,7 +595,7 @@ def fmt_integer_context(
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Scale `x` value by a defined `scale_by` value
@@ -723,19 +790,56 @@ def fmt_scientific(
     a single numerical value (or a list of them).
     """
 
+    pf_format = make_fmt_scientific_fn(
+        self._tbl_schema,
+        decimals=decimals,
+        n_sigfig=n_sigfig,
+        drop_trailing_zeros=drop_trailing_zeros,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        scale_by=scale_by,
+        exp_style=exp_style,
+        pattern=pattern,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign_m=force_sign_m,
+        force_sign_n=force_sign_n,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_scientific_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    decimals: int,
+    n_sigfig: int | None,
+    drop_trailing_zeros: bool,
+    drop_trailing_dec_mark: bool,
+    scale_by: float,
+    exp_style: str,
+    pattern: str,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign_m: bool,
+    force_sign_n: bool,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_scientific()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
+
     # Set a default value for `use_seps`; these separators are only used for very
     # large exponent values
     use_seps = True
 
-    locale = _resolve_locale(self, locale=locale)
-
     # Use locale-based marks if a locale ID is provided
     sep_mark = _get_locale_sep_mark(default=sep_mark, use_seps=use_seps, locale=locale)
     dec_mark = _get_locale_dec_mark(default=dec_mark, locale=locale)
 
-    pf_format = partial(
+    return partial(
         fmt_scientific_context,
-        data=self,
+        dispatch_on=dispatch_on,
         decimals=decimals,
         n_sigfig=n_sigfig,
         drop_trailing_zeros=drop_trailing_zeros,
@@ -749,13 +853,11 @@ def fmt_scientific(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 # Generate a function that will operate on single `x` values in the table body
 def fmt_scientific_context(
     x: float | None,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     decimals: int,
     n_sigfig: int | None,
     drop_trailing_zeros: bool,
@@ -769,7 +871,7 @@ def fmt_scientific_context(
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Scale `x` value by a defined `scale_by` value
@@ -1005,7 +1107,46 @@ def fmt_percent(
     single numerical value (or a list of them).
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_percent_fn(
+        self._tbl_schema,
+        decimals=decimals,
+        drop_trailing_zeros=drop_trailing_zeros,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        scale_values=scale_values,
+        use_seps=use_seps,
+        accounting=accounting,
+        pattern=pattern,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign=force_sign,
+        placement=placement,
+        incl_space=incl_space,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_percent_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    decimals: int,
+    drop_trailing_zeros: bool,
+    drop_trailing_dec_mark: bool,
+    scale_values: bool,
+    use_seps: bool,
+    accounting: bool,
+    pattern: str,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign: bool,
+    placement: str,
+    incl_space: bool,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_percent()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Use locale-based marks if a locale ID is provided
     sep_mark = _get_locale_sep_mark(default=sep_mark, use_seps=use_seps, locale=locale)
@@ -1016,9 +1157,9 @@ def fmt_percent(
     else:
         scale_by = 1.0
 
-    pf_format = partial(
+    return partial(
         fmt_percent_context,
-        data=self,
+        dispatch_on=dispatch_on,
         decimals=decimals,
         drop_trailing_zeros=drop_trailing_zeros,
         drop_trailing_dec_mark=drop_trailing_dec_mark,
@@ -1033,12 +1174,10 @@ def fmt_percent(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_percent_context(
     x: float | None,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     decimals: int,
     drop_trailing_zeros: bool,
     drop_trailing_dec_mark: bool,
@@ -1053,7 +1192,7 @@ def fmt_percent_context(
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Scale `x` value by a defined `scale_by` value
@@ -1263,7 +1402,48 @@ def fmt_currency(
     single numerical value (or a list of them).
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_currency_fn(
+        self._tbl_schema,
+        currency=currency,
+        use_subunits=use_subunits,
+        decimals=decimals,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        use_seps=use_seps,
+        accounting=accounting,
+        scale_by=scale_by,
+        pattern=pattern,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign=force_sign,
+        placement=placement,
+        incl_space=incl_space,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_currency_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    currency: str | None,
+    use_subunits: bool,
+    decimals: int | None,
+    drop_trailing_dec_mark: bool,
+    use_seps: bool,
+    accounting: bool,
+    scale_by: float,
+    pattern: str,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign: bool,
+    placement: str,
+    incl_space: bool,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_currency()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Use locale-based marks if a locale ID is provided
     sep_mark = _get_locale_sep_mark(default=sep_mark, use_seps=use_seps, locale=locale)
@@ -1285,9 +1465,9 @@ def fmt_currency(
         currency=currency_resolved, decimals=decimals, use_subunits=use_subunits
     )
 
-    pf_format = partial(
+    return partial(
         fmt_currency_context,
-        data=self,
+        dispatch_on=dispatch_on,
         currency=currency_resolved,
         decimals=decimals,
         drop_trailing_dec_mark=drop_trailing_dec_mark,
@@ -1302,12 +1482,10 @@ def fmt_currency(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_currency_context(
     x: float | None,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     currency: str,
     decimals: int,
     drop_trailing_dec_mark: bool,
@@ -1322,7 +1500,7 @@ def fmt_currency_context(
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Scale `x` value by a defined `scale_by` value
@@ -1452,27 +1630,41 @@ def fmt_roman(
     numerical value (or a list of them).
     """
 
+    pf_format = make_fmt_roman_fn(
+        self._tbl_schema,
+        case=case,
+        pattern=pattern,
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_roman_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    case: str,
+    pattern: str,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_roman()`."""
+
     # Check that the `case` value is valid and only consists of the string 'upper' or 'lower'
     _validate_case(case=case)
 
-    pf_format = partial(
+    return partial(
         fmt_roman_context,
-        data=self,
+        dispatch_on=dispatch_on,
         case=case,
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_roman_context(
     x: float,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     case: str,
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Get the absolute value of `x` so that negative values are handled
@@ -1644,7 +1836,44 @@ def fmt_bytes(
     numerical value (or a list of them).
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_bytes_fn(
+        self._tbl_schema,
+        standard=standard,
+        decimals=decimals,
+        n_sigfig=n_sigfig,
+        drop_trailing_zeros=drop_trailing_zeros,
+        drop_trailing_dec_mark=drop_trailing_dec_mark,
+        use_seps=use_seps,
+        pattern=pattern,
+        sep_mark=sep_mark,
+        dec_mark=dec_mark,
+        force_sign=force_sign,
+        incl_space=incl_space,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_bytes_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    standard: str,
+    decimals: int,
+    n_sigfig: int | None,
+    drop_trailing_zeros: bool,
+    drop_trailing_dec_mark: bool,
+    use_seps: bool,
+    pattern: str,
+    sep_mark: str,
+    dec_mark: str,
+    force_sign: bool,
+    incl_space: bool,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_bytes()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Use locale-based marks if a locale ID is provided
     sep_mark = _get_locale_sep_mark(default=sep_mark, use_seps=use_seps, locale=locale)
@@ -1664,9 +1893,9 @@ def fmt_bytes(
         base = 1024
         byte_units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB", "ZiB", "YiB"]
 
-    pf_format = partial(
+    return partial(
         fmt_bytes_context,
-        data=self,
+        dispatch_on=dispatch_on,
         base=base,
         byte_units=byte_units,
         decimals=decimals,
@@ -1681,12 +1910,10 @@ def fmt_bytes(
         pattern=pattern,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_bytes_context(
     x: float,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     base: int,
     byte_units: list[str],
     decimals: int,
@@ -1701,7 +1928,7 @@ def fmt_bytes_context(
     pattern: str,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # Truncate all byte values by casting to an integer; this is done because bytes
@@ -1873,31 +2100,48 @@ def fmt_date(
     numerical value (or a list of them).
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_date_fn(
+        self._tbl_schema,
+        date_style=date_style,
+        pattern=pattern,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_date_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    date_style: DateStyle,
+    pattern: str,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_date()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Get the date format string based on the `date_style` value
     date_format_str = _get_date_format(date_style=date_style)
 
-    pf_format = partial(
+    return partial(
         fmt_date_context,
-        data=self,
+        dispatch_on=dispatch_on,
         date_format_str=date_format_str,
         pattern=pattern,
         locale=locale,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_date_context(
     x: Any,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     date_format_str: str,
     pattern: str,
     locale: str | None,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # If `x` is a string, we assume it is an ISO date string and convert it to a date object
@@ -2019,31 +2263,48 @@ def fmt_time(
     numerical value (or a list of them).
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_time_fn(
+        self._tbl_schema,
+        time_style=time_style,
+        pattern=pattern,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_time_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    time_style: TimeStyle,
+    pattern: str,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_time()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Get the time format string based on the `time_style` value
     time_format_str = _get_time_format(time_style=time_style)
 
-    pf_format = partial(
+    return partial(
         fmt_time_context,
-        data=self,
+        dispatch_on=dispatch_on,
         time_format_str=time_format_str,
         pattern=pattern,
         locale=locale,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_time_context(
     x: Any,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     time_format_str: str,
     pattern: str,
     locale: str | None,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # If `x` is a string, assume it is an ISO time string and convert it to a time object
@@ -2181,7 +2442,30 @@ def fmt_datetime(
     ```
     """
 
-    locale = _resolve_locale(self, locale=locale)
+    pf_format = make_fmt_datetime_fn(
+        self._tbl_schema,
+        date_style=date_style,
+        time_style=time_style,
+        sep=sep,
+        pattern=pattern,
+        locale=_resolve_locale(self, locale=locale),
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_datetime_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    date_style: DateStyle,
+    time_style: TimeStyle,
+    sep: str,
+    pattern: str,
+    locale: str | None,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_datetime()`.
+
+    The `locale=` must already be resolved (see `_resolve_locale()`).
+    """
 
     # Get the date format string based on the `date_style` value
     date_format_str = _get_date_format(date_style=date_style)
@@ -2189,9 +2473,9 @@ def fmt_datetime(
     # Get the time format string based on the `time_style` value
     time_format_str = _get_time_format(time_style=time_style)
 
-    pf_format = partial(
+    return partial(
         fmt_datetime_context,
-        data=self,
+        dispatch_on=dispatch_on,
         date_format_str=date_format_str,
         time_format_str=time_format_str,
         sep=sep,
@@ -2199,12 +2483,10 @@ def fmt_datetime(
         locale=locale,
     )
 
-    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
-
 
 def fmt_datetime_context(
     x: Any,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     date_format_str: str,
     time_format_str: str,
     sep: str,
@@ -2212,7 +2494,7 @@ def fmt_datetime_context(
     locale: str | None,
     context: str,
 ) -> str:
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     # From the date and time format strings, create a datetime format string
@@ -2312,23 +2594,33 @@ def fmt_markdown(
     single string value (or a list of them).
     """
 
-    pf_format = partial(
-        fmt_markdown_context,
-        data=self,
+    pf_format = make_fmt_markdown_fn(
+        self._tbl_schema,
     )
 
     return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
 
 
+def make_fmt_markdown_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_markdown()`."""
+
+    return partial(
+        fmt_markdown_context,
+        dispatch_on=dispatch_on,
+    )
+
+
 def fmt_markdown_context(
     x: Any,
-    data: GTData,
+    dispatch_on: DataFrameLike | Agnostic,
     context: str,
 ) -> str:
     if context == "latex":
         raise NotImplementedError("fmt_markdown() is not supported in LaTeX.")
 
-    if is_na(data._tbl_data, x):
+    if is_na(dispatch_on, x):
         return x
 
     x_str: str = str(x)
@@ -2479,7 +2771,7 @@ def fmt_units(
         pattern: str = pattern,
     ):
         # If the `x` value is a missing value, then return the same value
-        if is_na(self._tbl_data, x):
+        if is_na(self._tbl_schema, x):
             return x
 
         from great_tables._helpers import define_units
@@ -3158,10 +3450,12 @@ def _normalize_locale(locale: str | None = None) -> str | None:
     return supplied_locale
 
 
-def _resolve_locale(x: GTData, locale: str | None = None) -> str | None:
-    # Get the locale from the locale value set globally; note that this may also be None
-    # but a None value will eventually be resolved to the 'en' locale
-    locale = x._locale._locale if locale is None else locale
+def _resolve_locale(x: GTData | None, locale: str | None = None) -> str | None:
+    # Get the locale from the locale value set globally (there is none when formatting values
+    # without a table); note that this may also be None but a None value will eventually be
+    # resolved to the 'en' locale
+    if locale is None and x is not None:
+        locale = x._locale._locale
 
     # An 'undetermined' locale should map back to the 'en' locale
     if locale == "und":
@@ -3747,16 +4041,35 @@ def fmt_image(
             " columns and rows"
         )
 
+    pf_format = make_fmt_image_fn(
+        self._tbl_schema,
+        height=height,
+        width=width,
+        sep=sep,
+        path=path,
+        file_pattern=file_pattern,
+        encode=encode,
+    )
+
+    return fmt_by_context(self, pf_format=pf_format, columns=columns, rows=rows)
+
+
+def make_fmt_image_fn(
+    dispatch_on: DataFrameLike | Agnostic,
+    height: str | int | None,
+    width: str | int | None,
+    sep: str,
+    path: str | Path | None,
+    file_pattern: str,
+    encode: bool,
+) -> Callable[..., str]:
+    """Create the function that formats a single value for `fmt_image()`."""
+
     if height is None and width is None:
         height = "2em"
 
-    formatter = FmtImage(self._tbl_data, height, width, sep, path, file_pattern, encode)
-    return fmt(
-        self,
-        fns=FormatFns(html=formatter.to_html, latex=formatter.to_latex, default=formatter.to_html),
-        columns=columns,
-        rows=rows,
-    )
+    formatter = FmtImage(dispatch_on, height, width, sep, path, file_pattern, encode)
+    return formatter.to_context
 
 
 @dataclass
@@ -3771,6 +4084,12 @@ class FmtImage:
 
     SPAN_TEMPLATE: ClassVar = '<span style="white-space:nowrap;">{}</span>'
 
+    def to_context(self, val: Any, context: str) -> str:
+        if context == "latex":
+            return self.to_latex(val)
+
+        return self.to_html(val)
+
     def to_html(self, val: Any):
         # TODO: are we assuming val is a string? (or coercing?)
 
@@ -4047,7 +4366,7 @@ def fmt_icon(
     """
 
     formatter = FmtIcon(
-        self._tbl_data,
+        self._tbl_schema,
         height=height,
         sep=sep,
         stroke_color=stroke_color,
@@ -4253,7 +4572,7 @@ def fmt_flag(
     ```
     """
 
-    formatter = FmtFlag(self._tbl_data, height=height, sep=sep, use_title=use_title)
+    formatter = FmtFlag(self._tbl_schema, height=height, sep=sep, use_title=use_title)
 
     return fmt(
         self,
@@ -4447,6 +4766,9 @@ def fmt_nanoplot(
     the nanoplots can be selectively removed and the aesthetics of the remaining plot components can
     be modified.
 
+    Every nanoplot carries its own SVG definitions and styles. For tables with many nanoplots, use
+    `tab_options(nanoplot_shared_defs=True)` to have these placed only once in the table's HTML.
+
     Examples
     --------
     Let's create a nanoplot from a Polars DataFrame containing multiple numbers per cell. The
@@ -4629,8 +4951,13 @@ def fmt_nanoplot(
     else:
         options_plots = options
 
-    # For autoscale, we need to get the minimum and maximum from all values for the y-axis
-    if autoscale:
+    # For autoscale, we need to get the minimum and maximum from all values for the y-axis; for
+    # a numeric list column, these are taken directly from the column's flat values buffer
+    if autoscale and (flat_y_vals := flatten_list_column(data_tbl, columns)) is not None:
+        if flat_y_vals.size > 0:
+            expand_y = [np.nanmin(flat_y_vals).item(), np.nanmax(flat_y_vals).item()]
+
+    elif autoscale:
         from great_tables._utils import _flatten_list
 
         # TODO: if a column of delimiter separated strings is passed. E.g. "1 2 3 4". Does this mean
@@ -4656,6 +4983,10 @@ def fmt_nanoplot(
 
             data_vals_i = _generate_data_vals(data_vals=data_vals_i)
 
+            # An array only needs its extreme values taken, for the minimum and maximum below
+            if isinstance(data_vals_i, np.ndarray):
+                data_vals_i = _array_extremes(data_vals_i)
+
             # If not a list, then convert to a list
             if not isinstance(data_vals_i, list):
                 data_vals_i = [data_vals_i]
@@ -4686,7 +5017,7 @@ def fmt_nanoplot(
         # If the `x` value is a Pandas 'NA', then return the same value
         # We have to pass in a dataframe to this function. Everything action that
         # requires a dataframe import should go through _tbl_data.
-        if is_na(data_tbl, x):
+        if not isinstance(x, (list, np.ndarray)) and not is_series(x) and is_na(data_tbl, x):
             return x
 
         # Generate data vals from the input `x` value
@@ -4697,12 +5028,17 @@ def fmt_nanoplot(
         if isinstance(x, tuple):
             x_vals, y_vals = x
 
-            # Ensure that both objects are lists
-            if not isinstance(x_vals, list) or not isinstance(y_vals, list):
+            # Ensure that both objects are lists (or numeric arrays)
+            if not isinstance(x_vals, (list, np.ndarray)) or not isinstance(
+                y_vals, (list, np.ndarray)
+            ):
                 raise ValueError("The 'x' and 'y' values must be lists.")
 
-            # Ensure that the lists contain only numeric values (ints and floats)
-            if not all(isinstance(val, (int, float)) for val in x_vals):
+            # Ensure that the lists contain only numeric values (ints and floats); the values of an
+            # array returned by `_generate_data_vals()` are always numeric
+            if isinstance(x_vals, list) and not all(
+                isinstance(val, (int, float)) for val in x_vals
+            ):
                 raise ValueError("The 'x' values must be numeric.")
 
             # Ensure that the lengths of the x and y values are the same
@@ -4734,19 +5070,30 @@ def fmt_nanoplot(
 
 def _generate_data_vals(
     data_vals: Any, is_x_axis: bool = False
-) -> list[float] | tuple[list[float], list[float]]:
+) -> list[float] | np.ndarray | tuple[list[float], list[float]]:
     """
     Generate a list of data values from the input data.
 
+    Numeric series (e.g., the cells of a Polars list column) and NumPy arrays are returned as NumPy
+    arrays. For series, this array is a view over the series' buffer where the backend allows it.
+
     Args:
         data_vals (Any): The input data values.
 
     Returns:
-        list[Any]: A list of data values.
+        list[Any] | np.ndarray: A list (or array) of data values.
     """
 
     if is_series(data_vals):
-        data_vals = to_list(data_vals)
+        numeric_vals = to_numeric_array(data_vals)
+        data_vals = to_list(data_vals) if numeric_vals is None else numeric_vals
+
+    if isinstance(data_vals, np.ndarray):
+        # Numeric arrays are checked through their dtype rather than value-by-value
+        if data_vals.dtype.kind in "iuf":
+            return data_vals
+
+        data_vals = data_vals.tolist()
 
     if isinstance(data_vals, list):
         # If the list contains string values, determine whether they are date values
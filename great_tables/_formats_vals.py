@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 from pathlib import Path
 
 from typing_extensions import TypeAlias
 
+import numpy as np
+
 from .gt import GT, _get_column_of_values
-from ._gt_data import GTData
-from ._tbl_data import SeriesLike, to_frame
+from ._formats import (
+    _resolve_locale,
+    fmt_by_context,
+    make_fmt_bytes_fn,
+    make_fmt_currency_fn,
+    make_fmt_date_fn,
+    make_fmt_image_fn,
+    make_fmt_integer_fn,
+    make_fmt_markdown_fn,
+    make_fmt_number_fn,
+    make_fmt_percent_fn,
+    make_fmt_roman_fn,
+    make_fmt_scientific_fn,
+    make_fmt_time_fn,
+)
+from ._tbl_data import Agnostic, SeriesLike, _get_cells, n_rows, to_frame
 
 if TYPE_CHECKING:
     from ._formats import DateStyle, TimeStyle
@@ -17,6 +33,19 @@ if TYPE_CHECKING:
 X: TypeAlias = "Any | list[Any] | SeriesLike"
 
 
+def _as_series_or_list(vals: X) -> list[Any] | SeriesLike:
+    # Upgrade a single value to a list
+    if isinstance(vals, np.ndarray):
+        return vals.tolist() if vals.ndim > 0 else [vals.item()]
+    elif not isinstance(vals, (tuple, list, SeriesLike)):
+        return [vals]
+    elif isinstance(vals, tuple):
+        # anticipating a tuple may be too defensive
+        return list(vals)
+
+    return vals
+
+
 def _make_one_col_table(vals: X) -> GT:
     """
     Create a one-column table from a list of values.
@@ -31,22 +60,89 @@ def _make_one_col_table(vals: X) -> GT:
         GT: The GT object representing the one-column table.
     """
 
-    # Upgrade a single value to a list
-    if not isinstance(vals, (tuple, list, SeriesLike)):
-        vals = [vals]
-    elif isinstance(vals, tuple):
-        # anticipating a tuple may be too defensive
-        vals = list(vals)
-
     # TODO: remove pandas. if vals is not a SeriesLike, then we currently
     # convert them to a pandas Series for backwards compatibility.
-    df = to_frame(vals, name="x")
+    df = to_frame(_as_series_or_list(vals), name="x")
 
     # Convert the list to a Pandas DataFrame and then to a GTData object
     gt_obj = GT(df, auto_align=False)
     return gt_obj
 
 
+# The types of values that are formatted without putting them in a DataFrame first
+_SCALAR_TYPES = {bool, int, float, str}
+
+
+def _scalar_values(vals: list[Any]) -> list[Any] | None:
+    """
+    Return a list of plain numbers, booleans and strings as they would be stored in a table.
+
+    Integers mixed with floats become floats (just as pandas makes a column of floats from them,
+    unless an integer is too large for a 64-bit integer). Other mixes of types are kept as they
+    are, as in a column of objects. Lists of any other values (e.g., missing values or dates)
+    return `None`, since they need to be put in a DataFrame.
+    """
+
+    types = set(map(type, vals))
+
+    if not types <= _SCALAR_TYPES:
+        return None
+
+    if types == {int, float} and all(-(2**63) <= val < 2**64 for val in vals):
+        return [float(val) for val in vals]
+
+    return vals
+
+
+def _format_values(vals: X, make_fn: Callable[..., Callable[..., Any]], **kwargs: Any) -> list[str]:
+    """
+    Format values with the formatting function of a `GT.fmt_*()` method, without creating a table.
+
+    The function that formats a single value is created with `make_fn` and applied to the values
+    directly. A list of plain numbers, booleans or strings is formatted as is (with integers mixed
+    with floats formatted as floats, just as in a table). Other values are put in a one-column
+    DataFrame first. If the function doesn't return a string for every value (e.g., it passes
+    missing values through), the values are formatted in a one-column table instead, so that they
+    are displayed just as they would be in a table.
+
+    Parameters
+    ----------
+    vals
+        The values to be formatted.
+    make_fn
+        The function that creates the formatting function (e.g., `make_fmt_number_fn()`).
+    **kwargs
+        The arguments to `make_fn` (other than the data).
+
+    Returns
+    -------
+        list[str]: The formatted values.
+    """
+
+    vals_list = _as_series_or_list(vals)
+    values = _scalar_values(vals_list) if isinstance(vals_list, list) else None
+
+    if values is not None:
+        fmt_fn = make_fn(Agnostic(), **kwargs)
+    else:
+        tbl_data = to_frame(vals_list, name="x")
+        values = _get_cells(tbl_data, "x", list(range(n_rows(tbl_data))))
+
+        fmt_fn = make_fn(tbl_data, **kwargs)
+
+    vals_fmt = [fmt_fn(value, context="html") for value in values]
+
+    if all(isinstance(val_fmt, str) for val_fmt in vals_fmt):
+        return vals_fmt
+
+    gt_obj = _make_one_col_table(vals=vals)
+    gt_obj_fmt = fmt_by_context(
+        gt_obj, pf_format=make_fn(gt_obj._tbl_data, **kwargs), columns="x", rows=None
+    )
+
+    return _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
+
+
 def val_fmt_number(
     x: X,
     decimals: int = 2,
@@ -153,10 +249,9 @@ def val_fmt_number(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_number(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_number_fn,
         decimals=decimals,
         n_sigfig=n_sigfig,
         drop_trailing_zeros=drop_trailing_zeros,
@@ -169,11 +264,9 @@ def val_fmt_number(
         sep_mark=sep_mark,
         dec_mark=dec_mark,
         force_sign=force_sign,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -254,10 +347,9 @@ def val_fmt_integer(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_integer(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_integer_fn,
         use_seps=use_seps,
         accounting=accounting,
         scale_by=scale_by,
@@ -265,11 +357,9 @@ def val_fmt_integer(
         pattern=pattern,
         sep_mark=sep_mark,
         force_sign=force_sign,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -380,10 +470,9 @@ def val_fmt_scientific(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_scientific(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_scientific_fn,
         decimals=decimals,
         n_sigfig=n_sigfig,
         drop_trailing_zeros=drop_trailing_zeros,
@@ -395,11 +484,9 @@ def val_fmt_scientific(
         dec_mark=dec_mark,
         force_sign_m=force_sign_m,
         force_sign_n=force_sign_n,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -508,10 +595,9 @@ def val_fmt_percent(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_percent(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_percent_fn,
         decimals=decimals,
         drop_trailing_zeros=drop_trailing_zeros,
         drop_trailing_dec_mark=drop_trailing_dec_mark,
@@ -524,11 +610,9 @@ def val_fmt_percent(
         force_sign=force_sign,
         placement=placement,
         incl_space=incl_space,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -641,10 +725,9 @@ def val_fmt_currency(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_currency(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_currency_fn,
         currency=currency,
         use_subunits=use_subunits,
         decimals=decimals,
@@ -658,11 +741,9 @@ def val_fmt_currency(
         force_sign=force_sign,
         placement=placement,
         incl_space=incl_space,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -702,16 +783,13 @@ def val_fmt_roman(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_roman(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_roman_fn,
         case=case,
         pattern=pattern,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -812,10 +890,9 @@ def val_fmt_bytes(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_bytes(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_bytes_fn,
         standard=standard,
         decimals=decimals,
         n_sigfig=n_sigfig,
@@ -827,11 +904,9 @@ def val_fmt_bytes(
         dec_mark=dec_mark,
         force_sign=force_sign,
         incl_space=incl_space,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -907,17 +982,14 @@ def val_fmt_date(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_date(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_date_fn,
         date_style=date_style,
         pattern=pattern,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -981,17 +1053,14 @@ def val_fmt_time(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_time(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_time_fn,
         time_style=time_style,
         pattern=pattern,
-        locale=locale,
+        locale=_resolve_locale(None, locale=locale),
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -1037,14 +1106,11 @@ def val_fmt_markdown(
     ```
     """
 
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_markdown(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_markdown_fn,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
 
 
@@ -1101,10 +1167,9 @@ def val_fmt_image(
     Check out our blog post, [Rendering images anywhere in Great Tables](https://posit-dev.github.io/great-tables/blog/rendering-images/),
     which walks through how to use `vals.fmt_image()`.
     """
-    gt_obj: GTData = _make_one_col_table(vals=x)
-
-    gt_obj_fmt = gt_obj.fmt_image(
-        columns="x",
+    vals_fmt = _format_values(
+        x,
+        make_fmt_image_fn,
         height=height,
         width=width,
         sep=sep,
@@ -1113,6 +1178,4 @@ def val_fmt_image(
         encode=encode,
     )
 
-    vals_fmt = _get_column_of_values(gt=gt_obj_fmt, column_name="x", context="html")
-
     return vals_fmt
@@ -1,31 +1,41 @@
 from __future__ import annotations
 
 import copy
-import re
-from collections.abc import Sequence
-from dataclasses import dataclass, field, replace
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import FrozenInstanceError, dataclass, field, replace
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar, overload
 
+import numpy as np
 from typing_extensions import Self, TypeAlias, Union
 
 # TODO: move this class somewhere else (even gt_data could work)
 from ._styles import CellStyle
+from ._profile import profile_formatter, profile_phase
 from ._tbl_data import (
     DataFrameLike,
+    LazySource,
     TblData,
     _get_cell,
     _get_column_dtype,
-    _set_cell,
-    copy_data,
-    create_empty_frame,
+    cast_frame_to_string,
+    collect_frame,
+    create_string_frame,
     get_column_names,
+    is_lazy_frame,
+    is_na,
+    is_number_like,
     n_rows,
+    reorder,
+    select_columns,
     to_list,
     validate_frame,
 )
 from ._text import BaseText
-from ._utils import OrderedSet, _str_detect
+from ._utils import _str_detect
 
 if TYPE_CHECKING:
     from ._helpers import UnitStr
@@ -38,7 +48,7 @@ T = TypeVar("T")
 
 
 def _prep_gt(
-    data, rowname_col: str | None, groupname_col: str | None, auto_align: bool
+    data, rowname_col: str | None, groupname_col: str | None, auto_align: bool | int
 ) -> tuple[Stub, Boxhead]:
     # this function is similar to Stub._set_cols, except it differs in two ways.
     #   * it supports auto-alignment (an expensive operation)
@@ -54,7 +64,7 @@ def _prep_gt(
 
 @dataclass(frozen=True)
 class GTData:
-    _tbl_data: TblData
+    _tbl_source: TblData | LazySource
     _body: Body
     _boxhead: Boxhead
     _stub: Stub
@@ -81,18 +91,80 @@ class GTData:
 
         return new_obj
 
+    @property
+    def _tbl_data(self) -> TblData:
+        """The table data.
+
+        For a table created from a lazy query, this collects the whole query (once). Building the
+        table only collects the columns it uses, see `_collect_source()`.
+        """
+
+        source = self._tbl_source
+        if isinstance(source, LazySource):
+            return source.frame()
+
+        return source
+
+    @property
+    def _tbl_schema(self) -> TblData:
+        """The table data, for uses that only need its columns and backend (not its values).
+
+        For a table created from a lazy query, this is an empty DataFrame, so nothing is collected.
+        """
+
+        source = self._tbl_source
+        if isinstance(source, LazySource):
+            return source.schema
+
+        return source
+
+    def _collect_source(self) -> Self:
+        """Return the table, with a lazy query replaced by the columns the table uses.
+
+        These are the columns that are displayed (including the stub and row groups), and the
+        columns that are formatted or substituted.
+        """
+
+        source = self._tbl_source
+        if not isinstance(source, LazySource):
+            return self
+
+        columns = {col.var for col in self._boxhead if col.visible}
+        for info in [*self._formats, *self._substitutions]:
+            columns.update(info.cells.cols)
+
+        with profile_phase("build.collect"):
+            return self._replace(_tbl_source=source.collect(list(columns)))
+
     @classmethod
     def from_data(
         cls,
         data: TblData,
         rowname_col: str | None = None,
         groupname_col: str | None = None,
-        auto_align: bool = True,
+        auto_align: bool | int = True,
         id: str | None = None,
         locale: str | None = None,
     ):
-        data = validate_frame(data)
-        stub, boxhead = _prep_gt(data, rowname_col, groupname_col, auto_align)
+        if is_lazy_frame(data):
+            # Keep the query, and only collect the stub columns (which also give the number of
+            # rows) for now. The columns of the query are enough for the boxhead.
+            source = LazySource(data)
+            stub_cols = [col for col in (rowname_col, groupname_col) if col is not None]
+            stub_data = source.collect(stub_cols or source.columns[:1])
+
+            stub = Stub.from_data(stub_data, rowname_col=rowname_col, groupname_col=groupname_col)
+            boxhead = Boxhead(
+                source.schema,
+                auto_align=auto_align,
+                rowname_col=rowname_col,
+                groupname_col=groupname_col,
+            )
+            body = Body.from_empty(source.shape_frame(n_rows(stub_data)))
+        else:
+            source = validate_frame(collect_frame(data))
+            stub, boxhead = _prep_gt(source, rowname_col, groupname_col, auto_align)
+            body = Body.from_empty(source)
 
         if id is not None:
             options = Options(table_id=OptionsInfo(True, "table", "value", id))
@@ -100,8 +172,8 @@ class GTData:
             options = Options()
 
         return cls(
-            _tbl_data=data,
-            _body=Body.from_empty(data),
+            _tbl_source=source,
+            _body=body,
             _boxhead=boxhead,  # uses get_tbl_data()
             _stub=stub,  # uses get_tbl_data
             _spanners=Spanners([]),
@@ -109,10 +181,10 @@ class GTData:
             _stubhead=None,
             _source_notes=[],
             _footnotes=[],
-            _styles=[],
+            _styles=PersistentList(),
             _locale=Locale(locale),
-            _formats=[],
-            _substitutions=[],
+            _formats=PersistentList(),
+            _substitutions=PersistentList(),
             _options=options,
         )
 
@@ -150,48 +222,211 @@ class _Sequence(Sequence[T]):
         return (type(self) is type(other)) and (self._d == other._d)
 
 
+class PersistentList(Sequence[T]):
+    """An immutable sequence that supports cheap appends.
+
+    Each object is a view of the first `n` items of a list that it may share with other (longer)
+    versions of itself. Adding items to the most recent version extends that shared list in place,
+    which costs amortized O(1) per item rather than a copy of every existing item. Adding items to
+    an older version first copies the items it can see, so each version keeps exactly the items it
+    was created with.
+    """
+
+    __slots__ = ("_shared", "_n")
+
+    _shared: list[T]
+    _n: int
+
+    # guards the check-then-extend of a shared list, in case versions are appended to from
+    # several threads at once
+    _lock = threading.Lock()
+
+    def __init__(self, data: Iterable[T] = ()):
+        self._shared = list(data)
+        self._n = len(self._shared)
+
+    @classmethod
+    def _from_shared(cls, shared: list[T], n: int) -> Self:
+        obj = cls.__new__(cls)
+        obj._shared = shared
+        obj._n = n
+        return obj
+
+    def __add__(self, other: Iterable[T]) -> Self:
+        items = list(other)
+
+        with self._lock:
+            if len(self._shared) == self._n:
+                shared = self._shared
+            else:
+                shared = self._shared[: self._n]
+
+            shared.extend(items)
+
+        return self._from_shared(shared, self._n + len(items))
+
+    @overload
+    def __getitem__(self, ii: int) -> T: ...
+
+    @overload
+    def __getitem__(self, ii: slice) -> list[T]: ...
+
+    def __getitem__(self, ii: int | slice) -> T | list[T]:
+        if isinstance(ii, slice):
+            return self._shared[: self._n][ii]
+
+        if ii < 0:
+            ii += self._n
+        if not 0 <= ii < self._n:
+            raise IndexError(f"{type(self).__name__} index out of range")
+
+        return self._shared[ii]
+
+    def __iter__(self) -> Iterator[T]:
+        return islice(self._shared, self._n)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._shared[: self._n]!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (PersistentList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+        return NotImplemented
+
+
 # Body ----
 
 
-# TODO: it seems like this could just be a DataFrameLike object?
-# Similar to TblData now being a DataFrame, rather than its own class
-# I've left for now, and have just implemented concretes for it in
-# _tbl_data.py
 class Body:
-    body: TblData
+    """The formatted values of the table body.
+
+    Formatted values are kept per column, in lists that are only created for columns that receive
+    formatted values (cells without a formatted value are None). The table data itself is only
+    referenced (for its shape and backend), and is never copied.
+    """
+
+    _data: TblData
+    _columns: dict[str, list[Any]]
+    _frame: TblData | None
+
+    def __init__(self, data: TblData, columns: dict[str, list[Any]] | None = None):
+        self._data = data
+        self._columns = columns if columns is not None else {}
+        self._frame = None
 
-    def __init__(self, body: TblData):
-        self.body = body
+    @property
+    def body(self) -> TblData:
+        """A DataFrame of the formatted values, with missing values for unformatted cells.
+
+        This is created (with the same backend as the table data) when first accessed.
+        """
+
+        if self._frame is None:
+            self._frame = create_string_frame(self._data, self._columns)
+
+        return self._frame
+
+    def _is_missing(self, value: Any) -> bool:
+        # Formatters may return missing values (e.g., NaN) as is
+        return value is None or (not isinstance(value, str) and is_na(self._data, value))
+
+    def _get_column(self, col: str) -> list[Any]:
+        col_values = self._columns.get(col)
+        if col_values is None:
+            col_values = self._columns[col] = [None] * n_rows(self._data)
+
+        return col_values
+
+    def set_cell(self, row: int, col: str, value: Any) -> None:
+        self._get_column(col)[row] = value
+        self._frame = None
+
+    def set_cells(self, rows: Sequence[int], col: str, values: list[Any]) -> None:
+        if len(rows) == n_rows(self._data):
+            # every row is set, so the list of values becomes the column
+            self._columns[col] = list(values)
+        else:
+            col_values = self._get_column(col)
+            for row, value in zip(rows, values):
+                col_values[row] = value
 
-    def render_formats(self, data_tbl: TblData, formats: list[FormatInfo], context: Any):
+        self._frame = None
+
+    def render_formats(self, data_tbl: TblData, formats: Iterable[FormatInfo], context: Any):
         for fmt in formats:
             eval_func = getattr(fmt.func, context, fmt.func.default)
             if eval_func is None:
                 raise Exception("Internal Error")
-            for col, row in fmt.cells.resolve():
-                result = eval_func(_get_cell(data_tbl, row, col))
-                if isinstance(result, FormatterSkipElement):
-                    continue
-
-                # TODO: I think that this is very inefficient with polars, so
-                # we could either accumulate results and set them per column, or
-                # could always use a pandas DataFrame inside Body?
-                new_body = _set_cell(self.body, row, col, result)
-                if new_body is not None:
-                    # Some backends do not support inplace operations, but return a new dataframe
-                    # TODO: Consolidate the behaviour of _set_cell
-                    self.body = new_body
+
+            with profile_formatter(eval_func) as run:
+                for col, rows in fmt.cells.iter_columns():
+                    col_values = self._get_column(col)
+                    run.cells += len(rows)
+                    for row in rows:
+                        result = eval_func(_get_cell(data_tbl, row, col))
+                        if isinstance(result, FormatterSkipElement):
+                            continue
+
+                        col_values[row] = result
+
+        self._frame = None
 
         return self
 
+    def text_columns(
+        self, data_tbl: TblData, columns: list[str], rows: Sequence[int] | None = None
+    ) -> dict[str, list[Any]]:
+        """Return the values to display for each column.
+
+        These are the formatted values, with unformatted cells filled in from the table data
+        (cast to strings). Only the columns with unformatted cells are cast. If `rows` is given,
+        only those rows are returned (and cast), in that order.
+        """
+
+        if rows is None:
+            res = {col: self._columns[col] for col in columns if col in self._columns}
+        else:
+            res = {
+                col: [self._columns[col][i] for i in rows]
+                for col in columns
+                if col in self._columns
+            }
+
+        unfilled = [
+            col for col in columns if col not in res or any(map(self._is_missing, res[col]))
+        ]
+
+        if unfilled:
+            if rows is None:
+                str_data = cast_frame_to_string(select_columns(data_tbl, unfilled))
+            else:
+                str_data = cast_frame_to_string(reorder(data_tbl, list(rows), unfilled))
+
+            for col in unfilled:
+                orig_values = to_list(str_data[col])
+
+                if col in res:
+                    res[col] = [
+                        orig if self._is_missing(val) else val
+                        for val, orig in zip(res[col], orig_values)
+                    ]
+                else:
+                    res[col] = orig_values
+
+        return res
+
     def copy(self) -> Self:
-        return self.__class__(copy_data(self.body))
+        return self.__class__(
+            self._data, {col: list(col_values) for col, col_values in self._columns.items()}
+        )
 
     @classmethod
     def from_empty(cls, body: DataFrameLike):
-        empty_df = create_empty_frame(body)
-
-        return cls(empty_df)
+        return cls(body)
 
 
 # Boxhead ----
@@ -240,6 +475,36 @@ class ColInfo:
         return "center" if self.column_align is None else str(self.column_align)
 
 
+@lru_cache(maxsize=None)
+def _align_from_col_class(col_class: str) -> ColumnAlignment:
+    """Translate a (lowercase) column class to an alignment value of 'left', 'right', or 'center'."""
+
+    if col_class == "character-numeric":
+        return "right"
+    elif col_class == "object":
+        return "left"
+    elif col_class == "utf8":
+        return "left"
+    elif col_class == "string":
+        return "left"
+    elif (
+        _str_detect(col_class, "int")
+        or _str_detect(col_class, "uint")
+        or _str_detect(col_class, "float")
+    ):
+        return "right"
+    elif _str_detect(col_class, "date"):
+        return "right"
+    elif _str_detect(col_class, "bool"):
+        return "center"
+    elif col_class == "factor":
+        return "center"
+    elif col_class == "list":
+        return "center"
+    else:
+        return "center"
+
+
 class Boxhead(_Sequence[ColInfo]):
     """Map columns of the input table to their final rendered placement in the boxhead.
 
@@ -256,7 +521,7 @@ class Boxhead(_Sequence[ColInfo]):
     def __new__(
         cls,
         data: TblData | list[ColInfo],
-        auto_align: bool = True,
+        auto_align: bool | int = True,
         rowname_col: str | None = None,
         groupname_col: str | None = None,
     ) -> Self:
@@ -272,19 +537,25 @@ class Boxhead(_Sequence[ColInfo]):
             obj = obj.set_stub_cols(rowname_col, groupname_col)
 
         if not isinstance(data, list) and auto_align:
-            return obj.align_from_data(data=data)
+            # an integer (other than True) is the number of values to check in each column
+            sample_size = None if auto_align is True else auto_align
+            return obj.align_from_data(data=data, sample_size=sample_size)
 
         return obj
 
     def __init__(
         self,
         data: TblData | list[ColInfo],
-        auto_align: bool = True,
+        auto_align: bool | int = True,
         rowname_col: str | None = None,
         groupname_col: str | None = None,
     ):
         pass
 
+    def __getnewargs__(self) -> tuple[list[ColInfo]]:
+        # copies and pickles are created from the column info, rather than from the data
+        return (self._d,)
+
     def set_stub_cols(self, rowname_col: str | None, groupname_col: str | None) -> Self:
         # Note that None unsets a column
         # TODO: validate that rowname_col is in the boxhead
@@ -329,8 +600,12 @@ class Boxhead(_Sequence[ColInfo]):
     def set_cols_unhidden(self, colnames: list[str]) -> Self:
         return self._set_cols_info_type(colnames=colnames, colinfo_type=ColInfoTypeEnum.default)
 
-    def align_from_data(self, data: TblData) -> Self:
-        """Updates align attribute in entries based on data types."""
+    def align_from_data(self, data: TblData, sample_size: int | None = None) -> Self:
+        """Updates align attribute in entries based on data types.
+
+        'object' columns where all strings are 'number-like' are right aligned. If `sample_size` is
+        set, only the first `sample_size` values of these columns are checked.
+        """
 
         # TODO: validate that data columns and ColInfo list correspond
         if len(get_column_names(data)) != len(self._d):
@@ -351,56 +626,19 @@ class Boxhead(_Sequence[ColInfo]):
             if dtype == "object":
                 # Check whether all values in 'object' columns are strings that
                 # for all intents and purpose are 'number-like'
-
-                col_vals = data[col].to_list()
-
-                # Detect whether all non-NA values in the column are 'number-like'
-                # through use of a regular expression
-                number_like_matches = []
-
-                for val in col_vals:
-                    if isinstance(val, str):
-                        number_like_matches.append(re.match("^[0-9 -/:\\.]*$", val))
+                col_vals = data[col]
+                if sample_size is not None:
+                    col_vals = col_vals.head(sample_size)
 
                 # If all values in the column are 'number-like', then set the
                 # dtype to 'character-numeric'
-                if all(number_like_matches):
+                if is_number_like(col_vals):
                     dtype = "character-numeric"
 
             col_classes.append(dtype)
 
-        # Get a list of `align` values by translating the column classes
-        align: list[str] = []
-
-        for col_class in col_classes:
-            # Ensure that `col_class` is lowercase
-            col_class = str(col_class).lower()
-
-            # Translate the column classes to an alignment value of 'left', 'right', or 'center'
-            if col_class == "character-numeric":
-                align.append("right")
-            elif col_class == "object":
-                align.append("left")
-            elif col_class == "utf8":
-                align.append("left")
-            elif col_class == "string":
-                align.append("left")
-            elif (
-                _str_detect(col_class, "int")
-                or _str_detect(col_class, "uint")
-                or _str_detect(col_class, "float")
-            ):
-                align.append("right")
-            elif _str_detect(col_class, "date"):
-                align.append("right")
-            elif _str_detect(col_class, "bool"):
-                align.append("center")
-            elif col_class == "factor":
-                align.append("center")
-            elif col_class == "list":
-                align.append("center")
-            else:
-                align.append("center")
+        # Get a list of `align` values by translating the column classes (lowercased)
+        align = [_align_from_col_class(str(col_class).lower()) for col_class in col_classes]
 
         # Set the alignment for each column in the boxhead
         new_cols: list[ColInfo] = []
@@ -582,48 +820,74 @@ class Stub:
 
     Note that the order of entries in .group_rows determines final rendering order.
     When .group_rows is empty, the original data order is used.
+
+    Row information is stored column-wise (as arrays of row indices, group ids, and row names),
+    and `RowInfo` objects are only created when individual rows are accessed.
     """
 
     # TODO: the rows get reordered at various points, but are never used in rendering?
     # the html rendering uses group_rows to index into the underlying DataFrame
 
-    _d: list[RowInfo]
-    rows: list[RowInfo]
+    _rownum_i: np.ndarray
+    _group_id: np.ndarray
+    _rowname: np.ndarray
+    _rows: list[RowInfo] | None
     group_rows: GroupRows
 
     def __init__(self, rows: list[RowInfo], group_rows: GroupRows):
-        self.rows = self._d = list(rows)
+        rows = list(rows)
+
+        self._rownum_i = np.array([row.rownum_i for row in rows], dtype=np.intp)
+        self._group_id = _to_object_array([row.group_id for row in rows])
+        self._rowname = _to_object_array([row.rowname for row in rows])
+        self._rows = rows
         self.group_rows = group_rows
 
+    @classmethod
+    def _from_arrays(
+        cls,
+        rownum_i: np.ndarray,
+        group_id: np.ndarray,
+        rowname: np.ndarray,
+        group_rows: GroupRows,
+    ) -> Self:
+        new_stub = cls.__new__(cls)
+        new_stub._rownum_i = rownum_i
+        new_stub._group_id = group_id
+        new_stub._rowname = rowname
+        new_stub._rows = None
+        new_stub.group_rows = group_rows
+
+        return new_stub
+
     @classmethod
     def from_data(
         cls, data, rowname_col: str | None = None, groupname_col: str | None = None
     ) -> Self:
-        # Obtain a list of row indices from the data and initialize
+        # Obtain an array of row indices from the data and initialize
         # the `_stub` from that
-        row_indices = list(range(n_rows(data)))
+        n = n_rows(data)
+        row_indices = np.arange(n, dtype=np.intp)
 
         if groupname_col is not None:
-            group_id = to_list(data[groupname_col])
+            group_id = _to_object_array(to_list(data[groupname_col]))
         else:
-            group_id = [None] * n_rows(data)
+            group_id = np.full(n, None, dtype=object)
 
         if rowname_col is not None:
-            row_names = to_list(data[rowname_col])
+            row_names = _to_object_array(to_list(data[rowname_col]))
         else:
-            row_names = [None] * n_rows(data)
-
-        # Obtain the column names from the data and initialize the
-        # `_stub` from that
-        row_info = [RowInfo(*i) for i in zip(row_indices, group_id, row_names)]
+            row_names = np.full(n, None, dtype=object)
 
         # create groups, and ensure they're ordered by first observed
-        group_names = OrderedSet(
-            row.group_id for row in row_info if row.group_id is not None
-        ).as_list()
-        group_rows = GroupRows(data, group_key=groupname_col).reorder(group_names)
+        group_rows = GroupRows(data, group_key=groupname_col)
+        first_observed = sorted(
+            (grp for grp in group_rows if grp.group_id is not None),
+            key=lambda grp: grp.indices[0],
+        )
+        group_rows = group_rows.reorder([grp.group_id for grp in first_observed])
 
-        return cls(row_info, group_rows)
+        return cls._from_arrays(row_indices, group_id, row_names, group_rows)
 
     def _set_cols(
         self, data: TblData, boxhead: Boxhead, rowname_col: str | None, groupname_col: str | None
@@ -642,34 +906,61 @@ class Stub:
     def group_ids(self) -> RowGroups:
         return [group.group_id for group in self.group_rows]
 
+    @property
+    def rows(self) -> list[RowInfo]:
+        if self._rows is None:
+            self._rows = list(self)
+
+        return self._rows
+
+    def row_values(self, attr: Literal["rownum_i", "group_id", "rowname"]) -> list[Any]:
+        """Return the values of a single row attribute, for all rows."""
+
+        return getattr(self, f"_{attr}").tolist()
+
     def reorder_rows(self, indices) -> Self:
-        new_rows = [self.rows[ii] for ii in indices]
+        indices = np.asarray(indices, dtype=np.intp)
 
-        return self.__class__(new_rows, self.group_rows)
+        return self._from_arrays(
+            self._rownum_i[indices],
+            self._group_id[indices],
+            self._rowname[indices],
+            self.group_rows,
+        )
 
     def order_groups(self, group_order: RowGroups) -> Self:
         # TODO: validate
-        return self.__class__(self.rows, self.group_rows.reorder(group_order))
+        return self._from_arrays(
+            self._rownum_i, self._group_id, self._rowname, self.group_rows.reorder(group_order)
+        )
 
     def group_indices_map(self) -> list[tuple[int, GroupRowInfo | None]]:
-        return self.group_rows.indices_map(len(self.rows))
+        return self.group_rows.indices_map(len(self))
 
-    def __iter__(self):
-        return iter(self.rows)
+    def __iter__(self) -> Iterator[RowInfo]:
+        if self._rows is not None:
+            return iter(self._rows)
+
+        return map(
+            RowInfo, self._rownum_i.tolist(), self._group_id.tolist(), self._rowname.tolist()
+        )
 
     def __len__(self):
-        return len(self.rows)
+        return len(self._rownum_i)
 
-    def __getitem__(self, ii: int):
-        return self.rows[ii]
+    def __getitem__(self, ii: int) -> RowInfo:
+        if self._rows is not None:
+            return self._rows[ii]
+
+        return RowInfo(int(self._rownum_i[ii]), self._group_id[ii], self._rowname[ii])
 
     def _get_stub_components(self) -> list[str]:
         stub_components: list[str] = []
 
-        if any(entry.group_id is not None for entry in self.rows):
+        if np.not_equal(self._group_id, None).any():
             stub_components.append("group_id")
 
-        if any(entry.rowname is not None for entry in self.rows):
+        if np.not_equal(self._rowname, None).any():
             stub_components.append("row_id")
 
         return stub_components
@@ -723,6 +1014,19 @@ class Stub:
         return stub_layout
 
 
+def _to_object_array(values: list[Any]) -> np.ndarray:
+    """Create a 1D object array of values (which may themselves be sequences)."""
+
+    arr = np.empty(len(values), dtype=object)
+    try:
+        arr[:] = values
+    except ValueError:
+        for ii, value in enumerate(values):
+            arr[ii] = value
+
+    return arr
+
+
 # Row groups ----
 RowGroups: TypeAlias = list[str]
 
@@ -750,9 +1054,21 @@ class MISSING_GROUP:
 
 
 class GroupRows(_Sequence[GroupRowInfo]):
+    """The row groups of a table, in presentation order.
+
+    Alongside the group information, this holds a group table of the row numbers of all groups
+    (concatenated in presentation order), with offsets marking where each group starts. These
+    are computed once, when first needed.
+    """
+
     _d: list[GroupRowInfo]
+    _row_order: np.ndarray | None
+    _offsets: np.ndarray | None
+    _indices_map: list[tuple[int, GroupRowInfo]] | None
 
     def __init__(self, data: list[GroupRowInfo] | DataFrameLike, group_key: str | None = None):
+        self._row_order = self._offsets = self._indices_map = None
+
         if isinstance(data, list):
             self._d = data
 
@@ -761,11 +1077,16 @@ class GroupRows(_Sequence[GroupRowInfo]):
 
         # otherwise, instantiate from a table of data
         else:
-            from ._tbl_data import group_splits
+            from ._tbl_data import group_offsets
 
-            self._d = []
-            for group_id, ind in group_splits(data, group_key=group_key).items():
-                self._d.append(GroupRowInfo(group_id, indices=ind))
+            group_ids, row_order, offsets = group_offsets(data, group_key=group_key)
+            bounds = offsets.tolist()
+
+            self._d = [
+                GroupRowInfo(group_id, indices=row_order[start:end].tolist())
+                for group_id, start, end in zip(group_ids, bounds, bounds[1:])
+            ]
+            self._row_order, self._offsets = row_order, offsets
 
     def reorder(self, group_ids: list[str | MISSING_GROUP]) -> Self:
         # TODO: validate all group_ids are in data
@@ -779,8 +1100,43 @@ class GroupRows(_Sequence[GroupRowInfo]):
             *[self[crnt_order[g]] for g in missing_groups],
         ]
 
+        # keep the computed group table when the order is unchanged
+        if len(reordered) == len(self._d) and all(
+            new is crnt for new, crnt in zip(reordered, self._d)
+        ):
+            return self
+
         return self.__class__(reordered)
 
+    def _build_group_table(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._row_order is None or self._offsets is None:
+            sizes = [len(info.indices) for info in self._d]
+
+            self._offsets = np.concatenate([[0], np.cumsum(sizes, dtype=np.intp)])
+            self._row_order = (
+                np.concatenate([np.asarray(info.indices, dtype=np.intp) for info in self._d])
+                if self._d
+                else np.zeros(0, dtype=np.intp)
+            )
+
+        return self._row_order, self._offsets
+
+    def row_order(self, n: int) -> np.ndarray:
+        """Return the row numbers of all rows, in presentation order.
+
+        When no groupings exist, the rows are in their original order (i.e., range(n)).
+        """
+
+        if not len(self._d):
+            return np.arange(n, dtype=np.intp)
+
+        return self._build_group_table()[0]
+
+    def offsets(self) -> np.ndarray:
+        """Return the position in `row_order()` where each group starts (plus the total length)."""
+
+        return self._build_group_table()[1]
+
     def indices_map(self, n: int) -> list[tuple[int, GroupRowInfo | None]]:
         """Return pairs of row index, group label for all rows in data.
 
@@ -788,11 +1144,22 @@ class GroupRows(_Sequence[GroupRowInfo]):
         In this case, None is used to indicate there is no grouping. This is
         distinct from MISSING_GROUP (which may currently be unused?).
 
+        The pairs for grouped rows are computed once and shared across calls, so the returned
+        list should not be modified.
         """
 
         if not len(self._d):
             return [(ii, None) for ii in range(n)]
-        return [(ind, info) for info in self for ind in info.indices]
+
+        if self._indices_map is None:
+            row_order, offsets = self._build_group_table()
+            group_infos = np.empty(len(self._d), dtype=object)
+            group_infos[:] = self._d
+
+            row_groups = np.repeat(group_infos, np.diff(offsets))
+            self._indices_map = list(zip(row_order.tolist(), row_groups.tolist()))
+
+        return self._indices_map
 
 
 # Spanners ----
@@ -916,9 +1283,11 @@ class StyleInfo:
     rownum: int | None = None
     colnum: int | None = None
     styles: list[CellStyle] = field(default_factory=list)
+    # the body cells that the styles apply to (for body styles, rather than colname and rownum)
+    cells: CellRectangle | None = None
 
 
-Styles: TypeAlias = list[StyleInfo]
+Styles: TypeAlias = "PersistentList[StyleInfo]"
 
 # Locale ----
 
@@ -956,17 +1325,59 @@ class CellSubset:
     def resolve(self) -> list[tuple[str, int]]:
         raise NotImplementedError("Not implemented")
 
+    def iter_columns(self) -> Iterator[tuple[str, Sequence[int]]]:
+        raise NotImplementedError("Not implemented")
+
+    def iter_column_masks(self, n_rows: int) -> Iterator[tuple[str, np.ndarray]]:
+        raise NotImplementedError("Not implemented")
+
 
 class CellRectangle(CellSubset):
+    """Every row in `rows` of every column in `cols`.
+
+    The rows are kept as a sequence of row numbers (a `range` when all rows are selected, and
+    otherwise an array), so that the individual cells are never materialized unless `resolve()`
+    is called.
+    """
+
     cols: list[str]
-    rows: list[int]
+    rows: Sequence[int]
 
-    def __init__(self, cols: list[str], rows: list[int]):
+    def __init__(self, cols: list[str], rows: Sequence[int]):
         self.cols = cols
         self.rows = rows
 
+    def __len__(self) -> int:
+        return len(self.cols) * len(self.rows)
+
+    def _row_numbers(self) -> Sequence[int]:
+        # arrays of row numbers are converted once, so the rows are yielded as python ints
+        return self.rows.tolist() if isinstance(self.rows, np.ndarray) else self.rows
+
     def resolve(self):
-        return list((col, row) for col in self.cols for row in self.rows)
+        rows = self._row_numbers()
+        return list((col, row) for col in self.cols for row in rows)
+
+    def iter_columns(self):
+        rows = self._row_numbers()
+        for col in self.cols:
+            yield col, rows
+
+    def row_mask(self, n_rows: int) -> np.ndarray:
+        """Return a boolean array, of length `n_rows`, that is true for the selected rows."""
+
+        mask = np.zeros(n_rows, dtype=bool)
+        if isinstance(self.rows, range):
+            mask[self.rows.start : self.rows.stop : self.rows.step] = True
+        else:
+            mask[np.asarray(self.rows, dtype=np.intp)] = True
+
+        return mask
+
+    def iter_column_masks(self, n_rows: int):
+        mask = self.row_mask(n_rows)
+        for col in self.cols:
+            yield col, mask
 
 
 class FormatInfo:
@@ -978,7 +1389,7 @@ class FormatInfo:
     func: FormatFns
     cells: CellSubset
 
-    def __init__(self, func: FormatFns, cols: list[str], rows: list[int]):
+    def __init__(self, func: FormatFns, cols: list[str], rows: Sequence[int]):
         self.func = func
         self.cells = CellRectangle(cols, rows)
 
@@ -987,7 +1398,7 @@ class FormatInfo:
 # class Formats:
 #     def __init__(self):
 #         pass
-Formats = list
+Formats: TypeAlias = "PersistentList[FormatInfo]"
 
 
 # Options ----
@@ -1016,9 +1427,19 @@ class OptionsInfo:
     value: Any
 
 
-@dataclass(frozen=True)
 class Options:
+    """Container for all table options.
+
+    The default value of every option is stored once, as a class attribute below. An instance only
+    holds the options that differ from these defaults (in its `__dict__`), so that an `Options`
+    object is small and deriving a modified copy costs O(changed options). Like the other table
+    components, `Options` objects are immutable.
+    """
+
+    __slots__ = ("__dict__", "_cache")
+
     table_id: OptionsInfo = OptionsInfo(False, "table", "value", None)
+    table_id_deterministic: OptionsInfo = OptionsInfo(False, "table", "boolean", False)
     table_caption: OptionsInfo = OptionsInfo(False, "table", "value", None)
     table_width: OptionsInfo = OptionsInfo(True, "table", "px", "auto")
     table_layout: OptionsInfo = OptionsInfo(True, "table", "value", "fixed")
@@ -1222,20 +1643,65 @@ class Options:
     # page_margin_bottom: OptionsInfo = OptionsInfo(False, "page", "value", "1.0in")
     # page_header_height: OptionsInfo = OptionsInfo(False, "page", "value", "0.5in")
     # page_footer_height: OptionsInfo = OptionsInfo(False, "page", "value", "0.5in")
+    nanoplot_shared_defs: OptionsInfo = OptionsInfo(False, "nanoplot", "boolean", False)
     quarto_disable_processing: OptionsInfo = OptionsInfo(False, "quarto", "logical", False)
     quarto_use_bootstrap: OptionsInfo = OptionsInfo(False, "quarto", "logical", False)
 
+    def __init__(self, **kwargs: OptionsInfo):
+        unknown = [k for k in kwargs if k not in _OPTIONS_DEFAULTS]
+        if unknown:
+            raise TypeError(f"Unknown options: {unknown}")
+
+        # only keep the options that actually differ from their defaults
+        overrides = {k: v for k, v in kwargs.items() if v != _OPTIONS_DEFAULTS[k]}
+
+        self.__dict__.update(overrides)
+        object.__setattr__(self, "_cache", {})
+
+    def __setattr__(self, name: str, value: Any):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        # the cache is not part of an object's state, so copies (and pickles) start without one
+        return (self.__class__._from_overrides, (dict(self.__dict__),))
+
+    @classmethod
+    def _from_overrides(cls, overrides: dict[str, OptionsInfo]) -> Self:
+        return cls(**overrides)
+
+    def __repr__(self) -> str:
+        overrides = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        return f"{type(self).__name__}({overrides})"
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
     def __getitem__(self, k: str) -> Any:
         return getattr(self, k).value
 
-    def _get_all_options_keys(self) -> list[str | None]:
-        return [x.parameter for x in self._options.values()]
+    def _get_all_options(self) -> dict[str, OptionsInfo]:
+        """Return all options (including the defaulted ones), in their order of definition."""
+        return {**_OPTIONS_DEFAULTS, **self.__dict__}
+
+    def _get_all_options_keys(self) -> list[str]:
+        return list(_OPTIONS_DEFAULTS)
 
     # def _get_option_type(self, option: str) -> Any | list[str]:
     #    return self._options[option].type
 
-    def _set_option_value(self, option: str, value: Any):
-        old_info = getattr(self, option)
-        new_info = replace(old_info, value=value)
+    def _set_option_values(self, values: dict[str, Any]) -> Self:
+        """Return a new Options object, with the values of several options replaced."""
+        new_infos = {k: replace(getattr(self, k), value=v) for k, v in values.items()}
+
+        return self.__class__(**{**self.__dict__, **new_infos})
+
+    def _set_option_value(self, option: str, value: Any) -> Self:
+        return self._set_option_values({option: value})
+
 
-        return replace(self, **{option: new_info})
+_OPTIONS_DEFAULTS: dict[str, OptionsInfo] = {
+    k: v for k, v in vars(Options).items() if isinstance(v, OptionsInfo)
+}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import random
 import re
 import string
@@ -259,6 +260,26 @@ def random_id(n: int = 10) -> str:
     return "".join(random.choices(letters(), k=n))
 
 
+def _content_id(*content: str, n: int = 10) -> str:
+    """Return a deterministic, letters-only `id` derived from a hash of `content`.
+
+    This is the counterpart of `random_id()` for when the same table should always render with
+    the same ID (e.g., so the output can be cached or diffed).
+    """
+    hasher = hashlib.sha256()
+    for part in content:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+
+    # extend the digest if more letters are requested than there are bytes in a single digest
+    digest = hasher.digest()
+    while len(digest) < n:
+        digest += hashlib.sha256(digest).digest()
+
+    alphabet = letters()
+    return "".join(alphabet[byte % 26] for byte in digest[:n])
+
+
 def letters() -> list[str]:
     """Lowercase letters of the Roman alphabet
 
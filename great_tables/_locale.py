@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from csv import DictReader
+from functools import lru_cache
 from typing import Any, TypedDict, cast
 
 from importlib_resources import files
@@ -93,26 +94,31 @@ class FlagsDataDict(TypedDict):
 
 
 # Note that all the functions below cast the result hint of read_csv
-# to a more specific dict type, which contains item info.
+# to a more specific dict type, which contains item info. The data is read once and then
+# cached, since formatters look it up for every value they format, so it must not be modified.
 
 
+@lru_cache(maxsize=None)
 def _get_locales_data() -> list[LocalesDict]:
     fname = DATA_MOD / "x_locales.csv"
 
     return cast("list[LocalesDict]", read_csv(fname))
 
 
+@lru_cache(maxsize=None)
 def _get_default_locales_data() -> list[DefaultLocalesDict]:
     fname = DATA_MOD / "x_default_locales.csv"
     return cast("list[DefaultLocalesDict]", read_csv(fname))
 
 
+@lru_cache(maxsize=None)
 def _get_currencies_data() -> list[CurrenciesDataDict]:
     fname = DATA_MOD / "x_currencies.csv"
 
     return cast("list[CurrenciesDataDict]", read_csv(fname))
 
 
+@lru_cache(maxsize=None)
 def _get_flags_data() -> list[FlagsDataDict]:
     fname = DATA_MOD / "x_flags.csv"
 
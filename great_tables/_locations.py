@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import itertools
+from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import singledispatch
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
+import numpy as np
 from typing_extensions import TypeAlias
 
 # note that types like Spanners are only used in annotations for concretes of the
 # resolve generic, but we need to import at runtime, due to singledispatch looking
 # up annotations
 from ._gt_data import (
+    CellRectangle,
     ColInfoTypeEnum,
     FootnoteInfo,
     FootnotePlacement,
@@ -19,7 +21,7 @@ from ._gt_data import (
     StyleInfo,
 )
 from ._styles import CellStyle
-from ._tbl_data import PlDataFrame, PlExpr, eval_select, eval_transform
+from ._tbl_data import PlDataFrame, PlExpr, eval_select, eval_transform, get_column_names
 
 if TYPE_CHECKING:
     from ._gt_data import TblData
@@ -35,16 +37,6 @@ RowSelectExpr: TypeAlias = 'list[int] | PlExpr | Callable[["TblData"], bool] | N
 # straight while going through helpers.R, but no strong opinion on naming!
 
 
-@dataclass
-class CellPos:
-    """The position of a cell in a DataFrame."""
-
-    column: int
-    row: int
-    colname: str
-    rowname: str | None = None
-
-
 @dataclass
 class Loc:
     """A location."""
@@ -715,7 +707,7 @@ def resolve_cols_i(
 
                 return [
                     (col, ii)
-                    for ii, col in enumerate(data._tbl_data.columns)
+                    for ii, col in enumerate(get_column_names(data._tbl_schema))
                     if col not in cols_excl
                 ]
 
@@ -742,7 +734,7 @@ def resolve_cols_i(
 
         cols_excl = [stub_var, group_var]
 
-        tbl_data = data._tbl_data
+        tbl_data = data._tbl_schema
     else:
         # I am not sure if this gets used in the R program, but it's
         # convenient for testing
@@ -775,8 +767,15 @@ def resolve_rows_i(
     if isinstance(expr, (str, int)):
         expr: list[str | int] = [expr]
 
+    if isinstance(data, GTData) and isinstance(expr, PlExpr):
+        # Only the names of the selected rows are needed here
+        return [
+            (getattr(data._stub[ii], row_name_attr), ii)
+            for ii in _resolve_rows_polars(data._tbl_data, expr).tolist()
+        ]
+
     if isinstance(data, GTData):
-        row_names = [getattr(row, row_name_attr) for row in data._stub]
+        row_names = data._stub.row_values(row_name_attr)
     else:
         row_names = data
 
@@ -800,17 +799,6 @@ def resolve_rows_i(
         ]
         return selected
 
-    elif isinstance(expr, PlExpr):
-        # TODO: decide later on the name supplied to `name`
-        # with_row_index supercedes with_row_count
-        frame: PlDataFrame = data._tbl_data
-        meth_row_number = getattr(frame, "with_row_index", None)
-        if not meth_row_number:
-            meth_row_number = frame.with_row_count
-
-        result = meth_row_number(name="__row_number__").filter(expr)
-        return [(row_names[ii], ii) for ii in result["__row_number__"]]
-
     elif callable(expr):
         res: "list[bool]" = eval_transform(data._tbl_data, expr)
         if not all(map(lambda x: isinstance(x, bool), res)):
@@ -832,13 +820,52 @@ def resolve_rows_i(
     )
 
 
+def resolve_rows_pos(
+    data: GTData,
+    expr: RowSelectExpr = None,
+    null_means: Literal["everything", "nothing"] = "everything",
+) -> Sequence[int]:
+    """Return matching row numbers (without their names), based on expr
+
+    When all rows are selected, these are returned as a range. Otherwise, they're returned as an
+    array of row numbers (rather than as a list).
+    """
+
+    if expr is None:
+        return range(len(data._stub)) if null_means == "everything" else []
+
+    if isinstance(expr, PlExpr):
+        return _resolve_rows_polars(data._tbl_data, expr)
+
+    row_pos = [ii for _, ii in resolve_rows_i(data, expr, null_means=null_means)]
+    return np.array(row_pos, dtype=np.intp)
+
+
+def _resolve_rows_polars(frame: PlDataFrame, expr: PlExpr) -> np.ndarray:
+    """Return an array of the numbers of the rows where a polars expression is true."""
+
+    # TODO: decide later on the name supplied to `name`
+    # with_row_index supercedes with_row_count
+    lazy_frame = frame.lazy()
+    meth_row_number = getattr(lazy_frame, "with_row_index", None)
+    if not meth_row_number:
+        meth_row_number = lazy_frame.with_row_count
+
+    # Run as a lazy query, so that only the row number column of the filtered frame is collected
+    # (rather than every column of the frame)
+    result = meth_row_number(name="__row_number__").filter(expr).select("__row_number__").collect()
+    return result["__row_number__"].to_numpy().astype(np.intp)
+
+
 def resolve_mask(
     data: GTData | list[str],
     expr: PlExpr,
     excl_stub: bool = True,
     excl_group: bool = True,
-) -> list[tuple[int, int, str]]:
-    """Return data for creating `CellPos`, based on expr"""
+) -> list[tuple[str, np.ndarray]]:
+    """Return the names of the masked columns, each with an array of its selected rows"""
+    import polars as pl
+
     if not isinstance(expr, PlExpr):
         raise ValueError("Only Polars expressions can be passed to the `mask` argument.")
 
@@ -868,21 +895,20 @@ def resolve_mask(
             f"\n* Mask length: {masked.height}"
         )
 
-    cellpos_data: list[tuple[int, int, str]] = []  # column, row, colname for `CellPos`
-    col_idx_map = {colname: frame_cols.index(colname) for colname in frame_cols}
-    for row_idx, row_dict in enumerate(masked.iter_rows(named=True)):
-        for colname, value in row_dict.items():
-            if value:  # select only when `value` is True
-                col_idx = col_idx_map[colname]
-                cellpos_data.append((col_idx, row_idx, colname))
-    return cellpos_data
+    # Get the selected rows of each column (where the mask value is true, i.e., not false or
+    # null) as an array of row numbers, dropping the columns without any selected rows
+    row_idx_list = [
+        (colname, masked[colname].cast(pl.Boolean).fill_null(False).arg_true().to_numpy())
+        for colname in masked.columns
+    ]
+    return [(colname, row_idx.astype(np.intp)) for colname, row_idx in row_idx_list if len(row_idx)]
 
 
 # Resolve generic ======================================================================
 
 
 @singledispatch
-def resolve(loc: Loc, *args: Any, **kwargs: Any) -> Loc | list[CellPos]:
+def resolve(loc: Loc, *args: Any, **kwargs: Any) -> Loc | list[CellRectangle]:
     """Return a copy of location with lookups resolved (e.g. tidyselect on columns)."""
     raise NotImplementedError(f"Unsupported location type: {type(loc)}")
 
@@ -916,30 +942,27 @@ def _(loc: LocRowGroups, data: GTData) -> set[str]:
 @resolve.register
 def _(loc: LocStub, data: GTData) -> set[int]:
     # TODO: what are the rules for matching row groups?
-    rows = resolve_rows_i(data=data, expr=loc.rows)
-    cell_pos = set(row[1] for row in rows)
+    cell_pos = set(resolve_rows_pos(data=data, expr=loc.rows))
     return cell_pos
 
 
 @resolve.register
-def _(loc: LocBody, data: GTData) -> list[CellPos]:
+def _(loc: LocBody, data: GTData) -> list[CellRectangle]:
     if (loc.columns is not None or loc.rows is not None) and loc.mask is not None:
         raise ValueError(
             "Cannot specify the `mask` argument along with `columns` or `rows` in `loc.body()`."
         )
 
     if loc.mask is None:
-        rows = resolve_rows_i(data=data, expr=loc.rows)
-        cols = resolve_cols_i(data=data, expr=loc.columns)
+        rows = resolve_rows_pos(data=data, expr=loc.rows)
+        cols = resolve_cols_c(data=data, expr=loc.columns)
         # TODO: dplyr arranges by `Var1`, and does distinct (since you can tidyselect the same
         # thing multiple times
-        cell_pos = [
-            CellPos(col[1], row[1], colname=col[0]) for col, row in itertools.product(cols, rows)
-        ]
+        cells = [CellRectangle(cols, rows)]
     else:
-        cellpos_data = resolve_mask(data=data, expr=loc.mask)
-        cell_pos = [CellPos(*cellpos) for cellpos in cellpos_data]
-    return cell_pos
+        # the mask can select different rows for each column
+        cells = [CellRectangle([col], rows) for col, rows in resolve_mask(data=data, expr=loc.mask)]
+    return cells
 
 
 # Style generic ========================================================================
@@ -1003,8 +1026,11 @@ def _(
 def _(loc: LocColumnLabels, data: GTData, style: list[CellStyle]) -> GTData:
     selected = resolve(loc, data)
 
-    # evaluate any column expressions in styles
-    styles = [entry._evaluate_expressions(data._tbl_data) for entry in style]
+    # evaluate any column expressions in styles (only getting the data when a style needs it)
+    if any(entry._requires_data() for entry in style):
+        styles = [entry._evaluate_expressions(data._tbl_data) for entry in style]
+    else:
+        styles = style
 
     all_info: list[StyleInfo] = []
     for name, pos in selected:
@@ -1056,18 +1082,24 @@ def _(loc: LocStub, data: GTData, style: list[CellStyle]) -> GTData:
 
 @set_style.register
 def _(loc: LocBody, data: GTData, style: list[CellStyle]) -> GTData:
-    positions: list[CellPos] = resolve(loc, data)
+    cells: list[CellRectangle] = resolve(loc, data)
+
+    # styles are shared by all cells of a rectangle, unless they take values from the data
+    if not any(entry._requires_data() for entry in style):
+        all_info = [StyleInfo(locname=loc, styles=style, cells=rect) for rect in cells]
+        return data._replace(_styles=data._styles + all_info)
 
-    # evaluate any column expressions in styles
-    style_ready = [entry._evaluate_expressions(data._tbl_data) for entry in style]
+    # evaluate any column expressions in styles, and set the styles separately for each row,
+    # with the values from that row
+    tbl_data = data._tbl_data
+    style_ready = [entry._evaluate_expressions(tbl_data) for entry in style]
 
     all_info: list[StyleInfo] = []
-    for col_pos in positions:
-        row_styles = [entry._from_row(data._tbl_data, col_pos.row) for entry in style_ready]
-        crnt_info = StyleInfo(
-            locname=loc, colname=col_pos.colname, rownum=col_pos.row, styles=row_styles
-        )
-        all_info.append(crnt_info)
+    for rect in cells:
+        for row in rect._row_numbers():
+            row_styles = [entry._from_row(tbl_data, row) for entry in style_ready]
+            row_rect = CellRectangle(rect.cols, [row])
+            all_info.append(StyleInfo(locname=loc, styles=row_styles, cells=row_rect))
 
     return data._replace(_styles=data._styles + all_info)
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
-from ._gt_data import Locale, RowGroups, Styles
+from ._gt_data import CellRectangle, Locale, PersistentList, RowGroups, StyleInfo, Styles
 
 if TYPE_CHECKING:
     from ._types import GTSelf
@@ -19,9 +20,19 @@ def _remove_from_body_styles(styles: Styles, column: str) -> Styles:
     from ._utils_render_html import _is_loc
     from ._locations import LocBody
 
-    new_styles = [
-        info for info in styles if not (_is_loc(info.locname, LocBody) and info.colname == column)
-    ]
+    def drop_column(info: StyleInfo) -> StyleInfo | None:
+        if not (_is_loc(info.locname, LocBody) and column in info.cells.cols):
+            return info
+
+        cols = [col for col in info.cells.cols if col != column]
+        if not cols:
+            return None
+
+        return replace(info, cells=CellRectangle(cols, info.cells.rows))
+
+    new_styles = PersistentList(
+        new_info for new_info in map(drop_column, styles) if new_info is not None
+    )
 
     return new_styles
 
@@ -150,7 +161,7 @@ def with_locale(self: GTSelf, locale: str | None = None) -> GTSelf:
     return self._replace(_locale=Locale(locale))
 
 
-def with_id(self: GTSelf, id: str | None = None) -> GTSelf:
+def with_id(self: GTSelf, id: str | None = None, deterministic: bool = False) -> GTSelf:
     """Set the id for this table.
 
     Note that this is a shortcut for the `table_id=` argument in `GT.tab_options()`.
@@ -161,6 +172,11 @@ def with_id(self: GTSelf, id: str | None = None) -> GTSelf:
         By default (with `None`) the table ID will be a random, ten-letter string as generated
         through internal use of the `random_id()` function. A custom table ID can be used here by
         providing a string.
+    deterministic
+        When no `id=` is provided, should the generated table ID be derived from the content of the
+        table rather than being random? With `True`, rendering the same table twice will produce
+        identical output, which is useful for caching (e.g., with ETags) or for diffing rendered
+        tables. By default, this is `False`.
 
     Returns
     -------
@@ -176,5 +192,15 @@ def with_id(self: GTSelf, id: str | None = None) -> GTSelf:
 
     GT(exibble).with_id("your-table-id")
     ```
+
+    If the table should instead get an ID that stays the same for as long as the table's content
+    doesn't change, use `deterministic=True`:
+
+    ```{python}
+    GT(exibble).with_id(deterministic=True)
+    ```
     """
-    return self._replace(_options=self._options._set_option_value("table_id", id))
+    options = self._options._set_option_value("table_id", id)
+    options = options._set_option_value("table_id_deterministic", deterministic)
+
+    return self._replace(_options=options)
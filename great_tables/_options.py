@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, fields, replace
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING, ClassVar, Iterable, cast
 
 from . import _utils
@@ -163,6 +163,7 @@ def tab_options(
     row_striping_background_color: str | None = None,
     row_striping_include_stub: bool | None = None,
     row_striping_include_table_body: bool | None = None,
+    nanoplot_shared_defs: bool | None = None,
     quarto_disable_processing: bool | None = None,
 ) -> GTSelf:
     """
@@ -473,6 +474,11 @@ def tab_options(
         An option for whether to include the stub when striping rows.
     row_striping_include_table_body
         An option for whether to include the table body when striping rows.
+    nanoplot_shared_defs
+        An option for whether the SVG definitions and styles of nanoplots (which are identical
+        across the nanoplots made by a [`fmt_nanoplot()`](`great_tables.GT.fmt_nanoplot`) call)
+        should be placed once in the table's container rather than in every nanoplot. This
+        greatly reduces the size of the HTML output for tables with many nanoplots.
     quarto_disable_processing
         Whether to disable Quarto table processing.
 
@@ -553,10 +559,7 @@ def tab_options(
         if isinstance(modified_args["table_font_names"], str):
             modified_args["table_font_names"] = [modified_args["table_font_names"]]
 
-    new_options_info = {
-        k: replace(getattr(self._options, k), value=v) for k, v in modified_args.items()
-    }
-    new_options = replace(self._options, **new_options_info)
+    new_options = self._options._set_option_values(modified_args)
 
     return self._replace(_options=new_options)
 
@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterator
+
+
+class MemoryBudgetWarning(UserWarning):
+    """Warning for a phase or formatting function that exceeded the memory budget of a profile."""
+
+
+@dataclass
+class PhaseTiming:
+    """Wall time, call count and output size of one phase of building or rendering a table.
+
+    When memory is profiled, `peak_bytes=` is the largest amount of memory allocated during any
+    one call (above what was allocated when the call started), and `retained_bytes=` is the total
+    memory that calls left allocated.
+    """
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    n_bytes: int = 0
+    peak_bytes: int = 0
+    retained_bytes: int = 0
+
+
+@dataclass
+class FormatterTiming:
+    """Wall time and number of cells handled by one formatting function.
+
+    The memory fields are the same as for `PhaseTiming`.
+    """
+
+    name: str
+    calls: int = 0
+    cells: int = 0
+    seconds: float = 0.0
+    peak_bytes: int = 0
+    retained_bytes: int = 0
+
+
+@dataclass
+class RenderProfile:
+    """Timings collected while tables are built and rendered.
+
+    The `phases=` are keyed by phase name (e.g., `"build.formats"` or `"html.body"`) and are
+    recorded in the order they first ran. The `formatters=` are keyed by the name of the
+    formatting function. Repeated renders within the same profile accumulate into the same
+    entries.
+
+    When `memory=` is `True`, the memory allocated by each phase and formatter is measured with
+    `tracemalloc` as well. A `memory_budget=` (in bytes) can be set to flag any phase or formatter
+    whose peak allocation exceeds it.
+    """
+
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+    formatters: dict[str, FormatterTiming] = field(default_factory=dict)
+    memory: bool = False
+    memory_budget: int | None = None
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(phase.seconds for phase in self.phases.values())
+
+    def record_phase(
+        self,
+        name: str,
+        seconds: float,
+        n_bytes: int = 0,
+        peak_bytes: int = 0,
+        retained_bytes: int = 0,
+    ) -> None:
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseTiming(name)
+
+        phase.calls += 1
+        phase.seconds += seconds
+        phase.n_bytes += n_bytes
+        self._record_memory(phase, peak_bytes, retained_bytes)
+
+    def record_formatter(
+        self,
+        name: str,
+        cells: int,
+        seconds: float,
+        peak_bytes: int = 0,
+        retained_bytes: int = 0,
+    ) -> None:
+        formatter = self.formatters.get(name)
+        if formatter is None:
+            formatter = self.formatters[name] = FormatterTiming(name)
+
+        formatter.calls += 1
+        formatter.cells += cells
+        formatter.seconds += seconds
+        self._record_memory(formatter, peak_bytes, retained_bytes)
+
+    def over_budget(self) -> list[str]:
+        """Return the names of the phases and formatters whose peak allocation exceeded the
+        memory budget."""
+
+        if self.memory_budget is None:
+            return []
+
+        entries = [*self.phases.values(), *self.formatters.values()]
+        return [entry.name for entry in entries if entry.peak_bytes > self.memory_budget]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_seconds": self.total_seconds,
+            "phases": [asdict(phase) for phase in self.phases.values()],
+            "formatters": [asdict(formatter) for formatter in self.formatters.values()],
+        }
+
+    def report(self) -> str:
+        """Return the timings as a plain-text table."""
+
+        mem_header = f"{'peak':>12}{'retained':>12}" if self.memory else ""
+
+        lines = [f"{'phase':<28}{'calls':>8}{'seconds':>12}{'bytes':>12}{mem_header}"]
+        for phase in self.phases.values():
+            lines.append(
+                f"{phase.name:<28}{phase.calls:>8}{phase.seconds:>12.4f}{phase.n_bytes:>12}"
+                f"{self._format_memory(phase)}"
+            )
+        lines.append(f"{'total':<28}{'':>8}{self.total_seconds:>12.4f}")
+
+        if self.formatters:
+            lines.append("")
+            lines.append(f"{'formatter':<28}{'calls':>8}{'seconds':>12}{'cells':>12}{mem_header}")
+            for fmt in self.formatters.values():
+                lines.append(
+                    f"{fmt.name:<28}{fmt.calls:>8}{fmt.seconds:>12.4f}{fmt.cells:>12}"
+                    f"{self._format_memory(fmt)}"
+                )
+
+        return "\n".join(lines)
+
+    def _format_memory(self, entry: PhaseTiming | FormatterTiming) -> str:
+        if not self.memory:
+            return ""
+        return f"{entry.peak_bytes:>12}{entry.retained_bytes:>12}"
+
+    def _record_memory(
+        self, entry: PhaseTiming | FormatterTiming, peak_bytes: int, retained_bytes: int
+    ) -> None:
+        within_budget = self.memory_budget is not None and entry.peak_bytes <= self.memory_budget
+
+        entry.peak_bytes = max(entry.peak_bytes, peak_bytes)
+        entry.retained_bytes += retained_bytes
+
+        # only warn the first time an entry goes over budget
+        if within_budget and entry.peak_bytes > self.memory_budget:
+            warnings.warn(
+                f"`{entry.name}` allocated {entry.peak_bytes} bytes at its peak, which exceeds"
+                f" the memory budget of {self.memory_budget} bytes.",
+                category=MemoryBudgetWarning,
+            )
+
+    def _start_memory(self) -> None:
+        if not self.memory:
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        stack = _memory_stack.get()
+
+        # The peak is reset for every measurement. So that an enclosing measurement doesn't miss
+        # its own peak, pass along the peak seen so far before resetting it. Note that the peak
+        # traced by tracemalloc is process-wide, so this also resets it for any other code that
+        # reads it.
+        if stack:
+            parent = stack[-1]
+            parent[1] = max(parent[1], peak)
+
+        tracemalloc.reset_peak()
+        _memory_stack.set((*stack, [current, current]))
+
+    def _stop_memory(self) -> tuple[int, int]:
+        """Return the peak and retained bytes of the most recently started measurement."""
+
+        if not self.memory:
+            return 0, 0
+
+        current, peak = tracemalloc.get_traced_memory()
+        *stack, (start, max_peak) = _memory_stack.get()
+        peak = max(peak, max_peak)
+
+        if stack:
+            parent = stack[-1]
+            parent[1] = max(parent[1], peak)
+
+        _memory_stack.set(tuple(stack))
+
+        return peak - start, current - start
+
+
+class _Phase:
+    """Collects the output of a phase (when profiling is active)."""
+
+    __slots__ = ("n_bytes",)
+
+    def __init__(self):
+        self.n_bytes = 0
+
+    def output(self, text: Any) -> None:
+        # components may be htmltools tags, which are rendered when converted to a string
+        self.n_bytes += len(str(text).encode("utf-8"))
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def output(self, text: Any) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+_current_profile: ContextVar[RenderProfile | None] = ContextVar("_current_profile", default=None)
+
+# The memory measurements in progress, innermost last, as `[start, peak]` pairs of traced bytes.
+# This is a context variable, so that concurrent renders (e.g., in asyncio tasks) each have their
+# own stack.
+_memory_stack: ContextVar[tuple[list[int], ...]] = ContextVar("_memory_stack", default=())
+
+
+def current_profile() -> RenderProfile | None:
+    """Return the profile being recorded, or `None` when profiling is not active."""
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[_Phase | _NullPhase]:
+    """Time a phase of building or rendering a table, when profiling is active.
+
+    The yielded object has an `output()` method, for recording the text the phase produced.
+    """
+
+    profile = _current_profile.get()
+
+    if profile is None:
+        yield _NULL_PHASE
+        return
+
+    phase = _Phase()
+    profile._start_memory()
+    start = time.perf_counter()
+    try:
+        yield phase
+    finally:
+        seconds = time.perf_counter() - start
+        profile.record_phase(name, seconds, phase.n_bytes, *profile._stop_memory())
+
+
+class _FormatterRun:
+    """Counts the cells handled by a formatter."""
+
+    __slots__ = ("cells",)
+
+    def __init__(self):
+        self.cells = 0
+
+
+@contextmanager
+def profile_formatter(fn: Callable[..., Any]) -> Iterator[_FormatterRun]:
+    """Time a formatting function, when profiling is active.
+
+    Add the number of cells formatted to the `cells` attribute of the yielded object.
+    """
+
+    profile = _current_profile.get()
+    run = _FormatterRun()
+
+    if profile is None:
+        yield run
+        return
+
+    profile._start_memory()
+    start = time.perf_counter()
+    try:
+        yield run
+    finally:
+        seconds = time.perf_counter() - start
+        profile.record_formatter(formatter_name(fn), run.cells, seconds, *profile._stop_memory())
+
+
+def formatter_name(fn: Callable[..., Any]) -> str:
+    """Return a readable name for a formatting function."""
+
+    while isinstance(fn, partial):
+        fn = fn.func
+
+    return getattr(fn, "__name__", type(fn).__name__)
+
+
+@contextmanager
+def profile_render(
+    hook: Callable[[RenderProfile], Any] | None = None,
+    memory: bool = False,
+    memory_budget: int | None = None,
+) -> Iterator[RenderProfile]:
+    """Record where time (and optionally memory) goes when tables are built and rendered.
+
+    Within the `with` block, every table rendered (e.g., through `GT.as_raw_html()` or
+    `GT.as_latex()`) adds its timings to the yielded `RenderProfile` object. For each phase of
+    the build (applying formatters and substitutions, reassembling the body, etc.) and of the
+    HTML or LaTeX rendering (the heading, column labels, body, CSS, etc.), the profile holds the
+    wall time, the number of calls and the number of bytes produced. For each formatting function,
+    it holds the wall time and the number of cells formatted.
+
+    Parameters
+    ----------
+    hook
+        An optional function that is called with the `RenderProfile` object when the `with` block
+        exits. This is useful for sending the timings to a metrics system.
+    memory
+        Should the memory allocated by each phase and formatting function be measured? This uses
+        `tracemalloc` (started for the duration of the `with` block, if it isn't already tracing),
+        which makes rendering noticeably slower, so the timings are less representative.
+    memory_budget
+        An optional number of bytes that no single phase or formatting function should allocate
+        at its peak. A `MemoryBudgetWarning` is emitted when a phase or formatting function first
+        exceeds the budget, and `RenderProfile.over_budget()` lists all that did. Setting a budget
+        implies `memory=True`. The budget is only a check: rendering carries on as usual when it
+        is exceeded. Use `RenderProfile.over_budget()` to decide how to render tables afterwards
+        (see the examples below).
+
+    Returns
+    -------
+    Iterator[RenderProfile]
+        A context manager that yields the `RenderProfile` object being recorded.
+
+    Examples
+    --------
+    ```python
+    from great_tables import GT, exibble, profile_render
+
+    gt_tbl = GT(exibble).fmt_number(columns="num").fmt_currency(columns="currency")
+
+    with profile_render() as profile:
+        gt_tbl.as_raw_html()
+
+    print(profile.report())
+    ```
+
+    The timings are also available as a dictionary, with `profile.to_dict()`.
+
+    To find out which phases of a render use the most memory, use `memory=True`. The report then
+    includes the peak and retained bytes of each phase and formatting function.
+
+    ```python
+    with profile_render(memory=True) as profile:
+        gt_tbl.as_raw_html()
+
+    print(profile.report())
+    ```
+
+    Memory is measured with the peak traced by `tracemalloc`, which is reset at the start of each
+    phase and formatting function. This affects all code in the process that reads the peak (e.g.,
+    through `tracemalloc.get_traced_memory()`), and renders running at the same time (e.g., in
+    other threads or asyncio tasks) count towards each other's memory.
+
+    A memory budget doesn't change how a table is rendered, but the profile can be used to switch
+    to an approach that uses less memory. For instance, a LaTeX table can be written to a file in
+    chunks with `GT.write_latex()`, rather than returned as a single string:
+
+    ```python
+    with profile_render(memory_budget=50_000_000) as profile:
+        latex = gt_tbl.as_latex()
+
+    if profile.over_budget():
+        gt_tbl.write_latex("table.tex")
+    ```
+    """
+
+    memory = memory or memory_budget is not None
+    profile = RenderProfile(memory=memory, memory_budget=memory_budget)
+
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    token = _current_profile.set(profile)
+
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+        if start_tracing:
+            tracemalloc.stop()
+
+        # report the timings collected so far, even when a render failed
+        if hook is not None:
+            hook(profile)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import os
+import sys
+from dataclasses import dataclass
 from typing import Literal
 
+RenderEnv = Literal["quarto", "databricks", "ipython_terminal", "vscode", "positron", "default"]
+
 IDE_ENV_FLAGS = {
     "default": {"make_page": False, "all_important": False},
     "quarto": {"make_page": False, "all_important": False},
@@ -13,9 +17,27 @@ IDE_ENV_FLAGS = {
 }
 
 
-def infer_render_env() -> (
-    Literal["quarto", "databricks", "ipython_terminal", "vscode", "positron", "default"]
-):
+@dataclass
+class RenderConfig:
+    """Global settings for rendering tables (see the `great_tables.config` module).
+
+    A `render_env=` of `None` means the environment is detected. Likewise, `make_page=` and
+    `all_important=` of `None` mean the defaults for the environment are used.
+    """
+
+    render_env: RenderEnv | None = None
+    make_page: bool | None = None
+    all_important: bool | None = None
+    deterministic_ids: bool = False
+
+
+_render_config = RenderConfig()
+
+
+def infer_render_env() -> RenderEnv:
+    if _render_config.render_env is not None:
+        return _render_config.render_env
+
     # Check if we are rendering in the Quarto environment
     if "QUARTO_BIN_PATH" in os.environ:
         return "quarto"
@@ -26,18 +48,29 @@ def infer_render_env() -> (
     elif "VSCODE_PID" in os.environ:
         return "vscode"
     else:
-        try:
-            import IPython
+        # A running IPython shell has always imported IPython, so there's no need to attempt the
+        # import (which searches the whole path on every render when IPython isn't installed)
+        IPython = sys.modules.get("IPython")
 
+        if IPython is not None:
             shell = IPython.get_ipython()
             if shell.__class__.__name__ == "TerminalInteractiveShell":
                 return "ipython_terminal"
-        except ImportError:
-            pass
 
     return "default"
 
 
-def infer_render_env_defaults():
+def infer_render_env_defaults() -> dict[str, bool]:
     env = infer_render_env()
-    return IDE_ENV_FLAGS[env]
+    defaults = IDE_ENV_FLAGS[env]
+
+    make_page = _render_config.make_page
+    all_important = _render_config.all_important
+
+    if make_page is None and all_important is None:
+        return defaults
+
+    return {
+        "make_page": defaults["make_page"] if make_page is None else make_page,
+        "all_important": defaults["all_important"] if all_important is None else all_important,
+    }
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import re
-from dataclasses import fields
+from typing import Any
 from functools import partial
 from string import Template
 
 from importlib_resources import files
 
 from ._data_color.base import _html_color, _ideal_fgnd_color
-from ._gt_data import GTData
+from ._gt_data import GTData, Options
 from ._helpers import pct, px
 from ._utils import _as_css_font_family_attr, OrderedSet
 
@@ -84,16 +84,24 @@ def css_add(value: str | int, amount: int):
         raise NotImplementedError(f"Unable to add to CSS value: {value}")
 
 
-def compile_scss(
-    data: GTData, id: str | None, compress: bool = True, all_important: bool = False
-) -> str:
-    """Return CSS for styling a table, based on options set."""
+def _compile_scss_params(options: Options) -> dict[str, Any]:
+    """Return the values that are substituted into the SCSS template, based on options set.
+
+    Since Options objects are immutable, the result is cached on the Options object.
+    """
+
+    if "scss_params" not in options._cache:
+        options._cache["scss_params"] = _compute_scss_params(options)
 
+    return options._cache["scss_params"]
+
+
+def _compute_scss_params(options: Options) -> dict[str, Any]:
     # Obtain the SCSS options dictionary
-    options = {field.name: getattr(data._options, field.name) for field in fields(data._options)}
+    options_dict = options._get_all_options()
 
     # Get collection of parameters that pertain to SCSS ----
-    params = {k: opt.value for k, opt in options.items() if opt.scss and opt.value is not None}
+    params = {k: opt.value for k, opt in options_dict.items() if opt.scss and opt.value is not None}
     scss_defaults = {k: params.get("table_background_color") for k in DEFAULTS_TABLE_BACKGROUND}
     scss_params = {**scss_defaults, **params}
 
@@ -115,18 +123,12 @@ def compile_scss(
         "heading_padding_bottom": css_add(scss_params["heading_padding"], 1),
     }
 
-    # Handle table id ----
-    # Determine whether the table has an ID
-    has_id = id is not None
+    return final_params
 
-    # Obtain the `table_id` value (might be set, might be None)
-    # table_id = data._options._get_option_value(option="table_id")
 
-    # TODO: need to implement a function to normalize color (`html_color()`)
-
-    # Handle fonts ----
+def _font_family_attr(options: Options) -> str:
     # Get the unique list of fonts from `gt_options_dict`
-    _font_names = data._options.table_font_names.value
+    _font_names = options.table_font_names.value
     if _font_names is not None:
         font_list = OrderedSet(_font_names).as_list()
     else:
@@ -138,11 +140,11 @@ def compile_scss(
     else:
         font_family_attr = ""
 
-    # Generate styles ----
-    gt_table_open_str = f"#{id} table" if has_id else ".gt_table"
+    return font_family_attr
 
-    # Prepend any additional CSS ----
-    additional_css = data._options.table_additional_css.value
+
+def _additional_css(options: Options) -> str:
+    additional_css = options.table_additional_css.value
 
     # Determine if there are any additional CSS statements
     has_additional_css = (
@@ -153,34 +155,175 @@ def compile_scss(
     # separating with `\n`; use an empty string if list is empty or value is None
     if has_additional_css:
         additional_css_unique = OrderedSet(additional_css).as_list()
-        table_additional_css = "\n".join(additional_css_unique) + "\n"
-    else:
-        table_additional_css = ""
+        return "\n".join(additional_css_unique) + "\n"
 
-    gt_table_class_str = f"""{table_additional_css}{gt_table_open_str} {{
-          {font_family_attr}
-          -webkit-font-smoothing: antialiased;
-          -moz-osx-font-smoothing: grayscale;
-        }}"""
+    return ""
 
+
+def _read_scss_template(compress: bool) -> str:
     gt_styles_default = (files("great_tables") / "css/gt_styles_default.scss").read_text()
 
     if compress:
         gt_styles_default = re.sub(r"\s+", " ", gt_styles_default, count=0, flags=re.MULTILINE)
         gt_styles_default = re.sub(r"}", "}\n", gt_styles_default, count=0, flags=re.MULTILINE)
 
-    compiled_css = Template(gt_styles_default).substitute(final_params)
+    return gt_styles_default
+
+
+def _scss_template_params(template: str) -> list[str]:
+    """Return the names of all parameters used in the SCSS template, in order of appearance."""
+
+    return OrderedSet(re.findall(r"\$([_a-z][_a-z0-9]*)", template)).as_list()
+
+
+# The SCSS template doesn't change, so it's read (and compressed) only once, at import time
+SCSS_TEMPLATES = {
+    compress: Template(_read_scss_template(compress=compress)) for compress in (True, False)
+}
+SCSS_TEMPLATE_PARAMS = _scss_template_params(SCSS_TEMPLATES[False].template)
+
+
+def _scope_css(css: str, scope: str) -> str:
+    """Prefix the selectors of the compiled stylesheet with a scope (e.g., `#id`)."""
+
+    css = re.sub(r"\.gt_", f"{scope} .gt_", css, count=0, flags=re.MULTILINE)
+    css = re.sub(r"thead", f"{scope} thead", css, count=0, flags=re.MULTILINE)
+    css = re.sub(r"^( p|p) \{", f"{scope} p {{", css, count=0, flags=re.MULTILINE)
+
+    return css
+
+
+def _make_important(css: str) -> str:
+    return re.sub(r";", " !important;", css, count=0, flags=re.MULTILINE)
+
+
+def compile_scss(
+    data: GTData, id: str | None, compress: bool = True, all_important: bool = False
+) -> str:
+    """Return CSS for styling a table, based on options set."""
+
+    final_params = _compile_scss_params(data._options)
+
+    # Handle table id ----
+    # Determine whether the table has an ID
+    has_id = id is not None
+
+    # Obtain the `table_id` value (might be set, might be None)
+    # table_id = data._options._get_option_value(option="table_id")
+
+    # TODO: need to implement a function to normalize color (`html_color()`)
+
+    # Handle fonts ----
+    font_family_attr = _font_family_attr(data._options)
+
+    # Generate styles ----
+    gt_table_open_str = f"#{id} table" if has_id else ".gt_table"
+
+    # Prepend any additional CSS ----
+    table_additional_css = _additional_css(data._options)
+
+    gt_table_class_str = f"""{table_additional_css}{gt_table_open_str} {{
+          {font_family_attr}
+          -webkit-font-smoothing: antialiased;
+          -moz-osx-font-smoothing: grayscale;
+        }}"""
+
+    compiled_css = SCSS_TEMPLATES[compress].substitute(final_params)
 
     if has_id:
-        compiled_css = re.sub(r"\.gt_", f"#{id} .gt_", compiled_css, count=0, flags=re.MULTILINE)
-        compiled_css = re.sub(r"thead", f"#{id} thead", compiled_css, count=0, flags=re.MULTILINE)
-        compiled_css = re.sub(
-            r"^( p|p) \{", f"#{id} p {{", compiled_css, count=0, flags=re.MULTILINE
-        )
+        compiled_css = _scope_css(compiled_css, scope=f"#{id}")
 
     if all_important:
-        compiled_css = re.sub(r";", " !important;", compiled_css, count=0, flags=re.MULTILINE)
+        compiled_css = _make_important(compiled_css)
 
     finalized_css = f"{gt_table_class_str}\n\n{compiled_css}"
 
     return finalized_css
+
+
+# Shared stylesheet ----
+# In shared mode, the bulk of the CSS is the same for every table on a page. It is scoped to the
+# `SHARED_CSS_CLASS` class (set on each table's container) and refers to CSS custom properties
+# rather than to option values. Each table then only declares (in its container's `style=`
+# attribute) the custom properties whose values differ from the defaults.
+
+SHARED_CSS_CLASS = "gt_container"
+
+
+def _css_var_name(param: str) -> str:
+    return "--gt-" + param.replace("_", "-")
+
+
+def _compile_shared_css_body(compress: bool) -> str:
+    var_refs = {k: f"var({_css_var_name(k)})" for k in SCSS_TEMPLATE_PARAMS}
+    compiled_css = SCSS_TEMPLATES[compress].substitute(var_refs)
+
+    return _scope_css(compiled_css, scope=f".{SHARED_CSS_CLASS}")
+
+
+# Neither the default option values nor the shared stylesheet depend on any table, so these are
+# also computed once, at import time
+DEFAULT_SCSS_PARAMS = _compile_scss_params(Options())
+DEFAULT_FONT_FAMILY_ATTR = _font_family_attr(Options())
+SHARED_CSS_BODY = {compress: _compile_shared_css_body(compress) for compress in (True, False)}
+
+
+def compile_shared_css(compress: bool = True, all_important: bool = False) -> str:
+    """Return the CSS shared by all tables rendered with `shared_css=True`."""
+
+    scope = f".{SHARED_CSS_CLASS}"
+
+    compiled_css = SHARED_CSS_BODY[compress]
+
+    if all_important:
+        compiled_css = _make_important(compiled_css)
+
+    var_defaults = " ".join(
+        f"{_css_var_name(k)}: {DEFAULT_SCSS_PARAMS[k]};" for k in SCSS_TEMPLATE_PARAMS
+    )
+
+    gt_table_class_str = f"""{scope} table {{
+          {DEFAULT_FONT_FAMILY_ATTR}
+          -webkit-font-smoothing: antialiased;
+          -moz-osx-font-smoothing: grayscale;
+        }}"""
+
+    return f"{gt_table_class_str}\n\n{scope} {{ {var_defaults} }}\n\n{compiled_css}"
+
+
+def compile_css_vars(data: GTData) -> str:
+    """Return the CSS custom property declarations for a table that uses the shared stylesheet.
+
+    Only the parameters that differ from their defaults are declared, so an empty string is
+    returned when the table uses only default options.
+    """
+
+    params = _compile_scss_params(data._options)
+
+    return "".join(
+        f"{_css_var_name(k)}:{params[k]};"
+        for k in SCSS_TEMPLATE_PARAMS
+        if params[k] != DEFAULT_SCSS_PARAMS[k]
+    )
+
+
+def compile_css_overrides(data: GTData, id: str) -> str:
+    """Return the table-specific CSS (other than custom properties) for a shared-CSS table.
+
+    This consists of the font family (when changed from the default) and any additional CSS. An
+    empty string is returned when neither is set.
+    """
+
+    options = data._options
+
+    css_overrides: list[str] = []
+
+    font_family_attr = _font_family_attr(options)
+    if font_family_attr != DEFAULT_FONT_FAMILY_ATTR:
+        css_overrides.append(f"#{id} table {{ {font_family_attr} }}")
+
+    table_additional_css = _additional_css(options)
+    if table_additional_css:
+        css_overrides.append(table_additional_css.rstrip("\n"))
+
+    return "\n".join(css_overrides)
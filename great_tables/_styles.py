@@ -78,6 +78,14 @@ class CellStyle:
     def _to_html_style(self) -> str:
         raise NotImplementedError
 
+    def _requires_data(self) -> bool:
+        """Does the style take any of its values from the table data?"""
+
+        return any(
+            isinstance(attr, (PlExpr, FromColumn)) or callable(attr)
+            for attr in (getattr(self, field.name) for field in fields(self))
+        )
+
     def _evaluate_expressions(self, data: TblData) -> Self:
         new_fields: dict[str, FromValues] = {}
         for field in fields(self):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal
 
 from ._formats import fmt
@@ -90,7 +91,7 @@ def sub_missing(
     ```
     """
 
-    subber = SubMissing(self._tbl_data, missing_text)
+    subber = SubMissing(self._tbl_schema, missing_text)
     return fmt(self, fns=subber.to_html, columns=columns, rows=rows, is_substitution=True)
 
 
@@ -164,9 +165,14 @@ class SubMissing:
         if self.missing_text is None:
             self.missing_text = html("&mdash;")
 
+    @cached_property
+    def _missing_html(self) -> str:
+        # the same text replaces every missing value, so only process it once
+        return _process_text(self.missing_text)
+
     def to_html(self, x: Any) -> str | FormatterSkipElement:
         if is_na(self.dispatch_frame, x):
-            return _process_text(self.missing_text)
+            return self._missing_html
 
         return FormatterSkipElement()
 
@@ -175,8 +181,12 @@ class SubMissing:
 class SubZero:
     zero_text: str | Text
 
+    @cached_property
+    def _zero_html(self) -> str:
+        return _process_text(self.zero_text)
+
     def to_html(self, x: Any) -> str | FormatterSkipElement:
         if x == 0:
-            return _process_text(self.zero_text)
+            return self._zero_html
 
         return FormatterSkipElement()
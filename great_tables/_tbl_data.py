@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import warnings
+from collections.abc import Sequence
 from functools import singledispatch
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
@@ -26,6 +27,9 @@ if TYPE_CHECKING:
     PlDataFrame = pl.DataFrame
     PyArrowTable = pa.Table
 
+    PlLazyFrame = pl.LazyFrame
+    DuckDBRelation = Any
+
     PlSelectExpr = _selector_proxy_
     PlExpr = pl.Expr
 
@@ -59,6 +63,12 @@ else:
     class PyArrowTable(AbstractBackend):
         _backends = [("pyarrow", "Table")]
 
+    class PlLazyFrame(AbstractBackend):
+        _backends = [("polars", "LazyFrame")]
+
+    class DuckDBRelation(AbstractBackend):
+        _backends = [("duckdb", "DuckDBPyRelation")]
+
     class PlSelectExpr(AbstractBackend):
         _backends = [("polars.selectors", "_selector_proxy_")]
 
@@ -231,7 +241,116 @@ def _(data: Any, row: int, col: str) -> Any:
 
 @_get_cell.register(PyArrowTable)
 def _(data: PyArrowTable, row: int, column: str) -> Any:
-    return data.column(column)[row].as_py()
+    col = data.column(column)
+    cell = col[row]
+
+    # As with polars, a cell of a list column is returned as a series: the slice of the column's
+    # flat values that the cell's offsets point to (rather than a copy as a list)
+    if _is_arrow_list_type(col.type) and cell.is_valid:
+        return cell.values
+
+    return cell.as_py()
+
+
+def _is_arrow_list_type(typ: Any) -> bool:
+    import pyarrow as pa
+
+    return pa.types.is_list(typ) or pa.types.is_large_list(typ) or pa.types.is_fixed_size_list(typ)
+
+
+@singledispatch
+def _get_cells(data: DataFrameLike, column: str, rows: Sequence[int]) -> list[Any]:
+    """Get the content from several cells of a column in the input data table
+
+    Each value is the same as what `_get_cell()` returns for that cell.
+    """
+
+    _raise_not_implemented(data)
+
+
+@_get_cells.register(PlDataFrame)
+def _(data: Any, column: str, rows: Sequence[int]) -> list[Any]:
+    return data[column].gather(rows).to_list()
+
+
+@_get_cells.register(PdDataFrame)
+def _(data: Any, column: str, rows: Sequence[int]) -> list[Any]:
+    col_ii = data.columns.get_loc(column)
+
+    if not isinstance(col_ii, int):
+        raise ValueError("Column named " + column + " matches multiple columns.")
+
+    # indexing the underlying array gives the same scalars as .iloc (e.g. Timestamps for
+    # datetimes, and NumPy scalars for NumPy dtypes)
+    values = data.iloc[:, col_ii].array
+    return [values[row] for row in rows]
+
+
+@_get_cells.register(PyArrowTable)
+def _(data: PyArrowTable, column: str, rows: Sequence[int]) -> list[Any]:
+    import pyarrow as pa
+
+    return data.column(column).take(pa.array(rows, type=pa.int64())).to_pylist()
+
+
+# _escape_string_cells ----
+
+
+@singledispatch
+def _escape_string_cells(
+    data: DataFrameLike, column: str, rows: Sequence[int], chars: str, prefix: str = "\\"
+) -> list[str | None] | None:
+    """Prefix each of `chars` in several cells of a string column, using the backend's string
+    operations.
+
+    Missing cells are returned as `None`. If the column isn't string-typed (or the backend has no
+    suitable operation), `None` is returned instead of a list, and the cells have to be cast to
+    strings and escaped in Python.
+    """
+
+    return None
+
+
+@_escape_string_cells.register(PlDataFrame)
+def _(
+    data: PlDataFrame, column: str, rows: Sequence[int], chars: str, prefix: str = "\\"
+) -> list[str | None] | None:
+    import polars as pl
+
+    ser = data[column]
+
+    # str.replace_many() was added in polars 0.20
+    if ser.dtype != pl.String or not hasattr(ser.str, "replace_many"):
+        return None
+
+    if len(rows) != len(ser):
+        ser = ser.gather(rows)
+
+    # the replacements are made in a single pass, so the prefixes aren't escaped again
+    return ser.str.replace_many(list(chars), [prefix + char for char in chars]).to_list()
+
+
+@_escape_string_cells.register(PyArrowTable)
+def _(
+    data: PyArrowTable, column: str, rows: Sequence[int], chars: str, prefix: str = "\\"
+) -> list[str | None] | None:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    arr = data.column(column)
+
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
+
+    if len(rows) != len(arr):
+        arr = arr.take(pa.array(rows, type=pa.int64()))
+
+    # One pass per character is faster than a regex with a group. The prefix added for one
+    # character is never escaped again, as long as the prefix itself comes first in `chars`.
+    for char in chars:
+        arr = pc.replace_substring(arr, pattern=char, replacement=prefix + char)
+
+    return arr.to_pylist()
 
 
 # _set_cell ----
@@ -308,21 +427,71 @@ def _(data: PyArrowTable, rows: list[int], columns: list[str]) -> PyArrowTable:
     return data.select(columns).take(rows)
 
 
-# group_splits ----
+# group_offsets ----
+
+
+def _group_offsets_from_codes(
+    codes: "np.ndarray", n_groups: int
+) -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
+    """Return group order, row order, and group offsets from per-row group codes.
+
+    The codes must be integers from 0 to n_groups - 1 (with every code present). Groups are
+    ordered by their first row in the data, and rows within each group keep their original order.
+
+    Returns the codes of the groups (in group order), the row numbers sorted by group, and the
+    positions in the row order where each group starts (along with the total number of rows).
+    """
+    import numpy as np
+
+    codes = np.asarray(codes, dtype=np.intp)
+
+    row_order = np.argsort(codes, kind="stable")
+    sizes = np.bincount(codes, minlength=n_groups)
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.intp)
+
+    # Order the groups by their first row, and sort the rows again if that changes their order
+    group_order = np.argsort(row_order[offsets[:-1]], kind="stable")
+    if not np.array_equal(group_order, np.arange(n_groups)):
+        group_rank = np.empty(n_groups, dtype=np.intp)
+        group_rank[group_order] = np.arange(n_groups)
+
+        row_order = np.argsort(group_rank[codes], kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(sizes[group_order])]).astype(np.intp)
+
+    return group_order, row_order, offsets
+
+
 @singledispatch
-def group_splits(data: DataFrameLike, group_key: str) -> dict[Any, list[int]]:
+def group_offsets(
+    data: DataFrameLike, group_key: str
+) -> "tuple[list[Any], np.ndarray, np.ndarray]":
+    """Group rows by the values of a column.
+
+    Returns the group keys (ordered by the first row of each group), an array of all row numbers
+    sorted by group, and an array of the positions in the row order where each group starts
+    (with the total number of rows at the end). Missing values form their own group.
+    """
     raise NotImplementedError(f"Unsupported data type: {type(data)}")
 
 
-@group_splits.register
-def _(data: PdDataFrame, group_key: str) -> dict[Any, list[int]]:
-    g_df = data.groupby(group_key, dropna=False)
-    return {k: list(v) for k, v in g_df.indices.items()}
+@group_offsets.register
+def _(data: PdDataFrame, group_key: str) -> Any:
+    import pandas as pd
+
+    # missing values get a code of their own (use_na_sentinel= replaced na_sentinel= in pandas 1.5)
+    pd_version = _re_version(pd.__version__)
+    na_opts = {"use_na_sentinel": False} if pd_version >= (1, 5, 0) else {"na_sentinel": None}
+
+    codes, uniques = pd.factorize(data[group_key], sort=False, **na_opts)
+    group_order, row_order, offsets = _group_offsets_from_codes(codes, len(uniques))
+
+    return uniques.take(group_order).tolist(), row_order, offsets
 
 
-@group_splits.register
-def _(data: PlDataFrame, group_key: str) -> dict[Any, list[int]]:
+@group_offsets.register
+def _(data: PlDataFrame, group_key: str) -> Any:
     # TODO: should ensure row count name isn't already in data
+    import numpy as np
     import polars as pl
 
     # with_row_index supercedes with_row_count
@@ -330,24 +499,47 @@ def _(data: PlDataFrame, group_key: str) -> dict[Any, list[int]]:
     if not meth_row_number:
         meth_row_number = data.with_row_count
 
-    groups = meth_row_number("__row_count__").group_by(group_key).agg(pl.col("__row_count__"))
+    # hash grouping, with groups in order of their first row (and rows in their original order)
+    groups = (
+        meth_row_number("__row_count__")
+        .group_by(group_key, maintain_order=True)
+        .agg(pl.col("__row_count__"))
+    )
+
+    row_order = groups["__row_count__"].explode().to_numpy().astype(np.intp)
+    sizes = groups["__row_count__"].list.len().to_numpy()
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.intp)
 
-    res = dict(zip(groups[group_key].to_list(), groups["__row_count__"].to_list()))
-    return res
+    return groups[group_key].to_list(), row_order, offsets
 
 
-@group_splits.register
-def _(data: PyArrowTable, group_key: str) -> dict[Any, list[int]]:
-    import pyarrow.compute as pc
+@group_offsets.register
+def _(data: PyArrowTable, group_key: str) -> Any:
+    import pyarrow as pa
 
     group_col = data.column(group_key)
-    encoded = group_col.dictionary_encode().combine_chunks()
+    if pa.types.is_dictionary(group_col.type):
+        # a dictionary may contain values that are not in the data
+        group_col = group_col.cast(group_col.type.value_type)
 
-    d = {}
-    for idx, group_key in enumerate(encoded.dictionary):
-        mask = pc.equal(encoded.indices, idx)
-        d[group_key.as_py()] = pc.indices_nonzero(mask).to_pylist()
-    return d
+    encoded = group_col.dictionary_encode(null_encoding="encode").combine_chunks()
+    group_order, row_order, offsets = _group_offsets_from_codes(
+        encoded.indices.to_numpy(zero_copy_only=False), len(encoded.dictionary)
+    )
+
+    return encoded.dictionary.take(group_order).to_pylist(), row_order, offsets
+
+
+# group_splits ----
+
+
+def group_splits(data: DataFrameLike, group_key: str) -> dict[Any, list[int]]:
+    """Return a mapping of group keys to the row numbers in each group."""
+
+    keys, row_order, offsets = group_offsets(data, group_key)
+    bounds = offsets.tolist()
+
+    return {key: row_order[start:end].tolist() for key, start, end in zip(keys, bounds, bounds[1:])}
 
 
 # eval_select ----
@@ -526,6 +718,55 @@ def _(df: PyArrowTable):
     return pa.table({col: pa.nulls(df.num_rows, type=pa.string()) for col in df.column_names})
 
 
+@singledispatch
+def create_string_frame(df: DataFrameLike, values: dict[str, list[Any]]) -> DataFrameLike:
+    """Return a DataFrame with the same shape, with string columns set from values
+
+    Columns that are not in values are all nan.
+    """
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@create_string_frame.register
+def _(df: PdDataFrame, values: dict[str, list[Any]]):
+    import pandas as pd
+
+    frame = create_empty_frame(df)
+    for col, col_values in values.items():
+        frame[col] = pd.array(col_values, dtype="string")
+
+    return frame
+
+
+@create_string_frame.register
+def _(df: PlDataFrame, values: dict[str, list[Any]]):
+    import polars as pl
+
+    frame = create_empty_frame(df)
+    if not values:
+        return frame
+
+    return frame.with_columns(
+        [pl.Series(col, col_values, dtype=pl.Utf8) for col, col_values in values.items()]
+    )
+
+
+@create_string_frame.register
+def _(df: PyArrowTable, values: dict[str, list[Any]]):
+    import pyarrow as pa
+
+    return pa.table(
+        {
+            col: (
+                pa.array(values[col], type=pa.string())
+                if col in values
+                else pa.nulls(df.num_rows, type=pa.string())
+            )
+            for col in df.column_names
+        }
+    )
+
+
 @singledispatch
 def copy_frame(df: DataFrameLike) -> DataFrameLike:
     """Return a copy of the input DataFrame"""
@@ -585,6 +826,30 @@ def _(df: PyArrowTable):
     return pa.table({col: pa.array(df.column(col).cast(pa.string())) for col in df.column_names})
 
 
+# select_columns ----
+
+
+@singledispatch
+def select_columns(df: DataFrameLike, columns: list[str]) -> DataFrameLike:
+    """Return a DataFrame with only the given columns"""
+    raise NotImplementedError(f"Unsupported type: {type(df)}")
+
+
+@select_columns.register
+def _(df: PdDataFrame, columns: list[str]):
+    return df.loc[:, columns]
+
+
+@select_columns.register
+def _(df: PlDataFrame, columns: list[str]):
+    return df.select(columns)
+
+
+@select_columns.register
+def _(df: PyArrowTable, columns: list[str]):
+    return df.select(columns)
+
+
 # replace_null_frame ----
 
 
@@ -645,6 +910,127 @@ def _(ser: PyArrowChunkedArray) -> list[Any]:
     return ser.to_pylist()
 
 
+# to_numeric_array ----
+
+
+@singledispatch
+def to_numeric_array(ser: SeriesLike) -> "np.ndarray | None":
+    """Get the values of a numeric series as a NumPy array.
+
+    Where the backend allows it, the array is a view over the series' buffer rather than a copy.
+    None is returned for non-numeric series, and for series with missing values (NumPy can only
+    represent those as NaN, casting integers to floats). Pandas float series are the exception,
+    since their missing values are already NaN.
+    """
+    raise NotImplementedError(f"Unsupported type: {type(ser)}")
+
+
+@to_numeric_array.register
+def _(ser: PdSeries) -> Any:
+    if ser.dtype.kind not in "iuf" or (ser.dtype.kind != "f" and ser.hasnans):
+        return None
+
+    return ser.to_numpy()
+
+
+@to_numeric_array.register
+def _(ser: PlSeries) -> Any:
+    if not ser.dtype.is_numeric() or ser.null_count() > 0:
+        return None
+
+    return ser.to_numpy()
+
+
+@to_numeric_array.register(PyArrowArray)
+@to_numeric_array.register(PyArrowChunkedArray)
+def _(ser: "PyArrowArray | PyArrowChunkedArray") -> Any:
+    import pyarrow as pa
+
+    if not (pa.types.is_integer(ser.type) or pa.types.is_floating(ser.type)):
+        return None
+
+    if ser.null_count > 0:
+        return None
+
+    return ser.to_numpy(zero_copy_only=False)
+
+
+# flatten_list_column ----
+
+
+@singledispatch
+def flatten_list_column(data: DataFrameLike, column: str) -> "np.ndarray | None":
+    """Get the non-missing values across all cells of a numeric list column as a NumPy array.
+
+    The values are read from the column's flat values buffer (not cell by cell). None is returned
+    if the column is not a list column with a numeric inner type.
+    """
+    return None
+
+
+@flatten_list_column.register
+def _(data: PlDataFrame, column: str) -> Any:
+    import polars as pl
+
+    ser = data[column]
+
+    if not isinstance(ser.dtype, (pl.List, pl.Array)) or not ser.dtype.inner.is_numeric():
+        return None
+
+    return to_numeric_array(ser.explode().drop_nulls())
+
+
+@flatten_list_column.register
+def _(data: PyArrowTable, column: str) -> Any:
+    import pyarrow.compute as pc
+
+    col = data.column(column)
+
+    if not _is_arrow_list_type(col.type):
+        return None
+
+    flat = pc.list_flatten(col)
+
+    return to_numeric_array(flat.drop_null() if flat.null_count > 0 else flat)
+
+
+# is_number_like ----
+
+# Strings made up of digits, spaces, and common separators (e.g., "2015-01-01" or "12:30")
+NUMBER_LIKE_PATTERN = r"[0-9 -/:\.]*\n?"
+
+
+@singledispatch
+def is_number_like(ser: SeriesLike, chunk_size: int = 10_000) -> bool:
+    """Return whether all string values in a series are 'number-like'.
+
+    Values that are not strings are ignored. The check stops at the first non-matching value.
+    """
+
+    number_like = re.compile(NUMBER_LIKE_PATTERN)
+    return all(number_like.fullmatch(val) for val in to_list(ser) if isinstance(val, str))
+
+
+@is_number_like.register
+def _(ser: PdSeries, chunk_size: int = 10_000) -> bool:
+    # Check the values in chunks, so that a non-matching value near the start of a long
+    # column ends the check early
+    for start in range(0, len(ser), chunk_size):
+        chunk = ser.iloc[start : start + chunk_size]
+
+        try:
+            matched = chunk.str.fullmatch(NUMBER_LIKE_PATTERN)
+        except AttributeError:
+            # The `.str` accessor is unavailable when a chunk contains no strings
+            continue
+
+        # Non-string values give missing results here, so only an explicit False is a mismatch
+        if matched.eq(False).any():
+            return False
+
+    return True
+
+
 # is_series ----
 
 
@@ -822,6 +1208,145 @@ def _(df: PyArrowTable) -> PyArrowTable:
     return df
 
 
+# collect_frame ----
+
+
+@singledispatch
+def collect_frame(data: Any) -> Any:
+    """Materialize a lazy query into a DataFrame that Great Tables can work with.
+
+    Eager DataFrames are returned unchanged. Any filtering or row limits should be part of the
+    query itself, in order to be pushed down to the engine (see `LazySource` for the columns).
+    """
+    return data
+
+
+@collect_frame.register
+def _(data: PlLazyFrame) -> PlDataFrame:
+    return data.collect()
+
+
+@collect_frame.register
+def _(data: DuckDBRelation) -> DataFrameLike:
+    # prefer the fully supported backends, and only fall back to Arrow (which is experimental
+    # here) when neither polars nor pandas is installed
+    try:
+        import polars  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        return data.pl()
+
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        return data.df()
+
+    return data.fetch_arrow_table()
+
+
+# lazy sources ----
+
+
+@singledispatch
+def is_lazy_frame(data: Any) -> bool:
+    """Can the data be kept as a lazy query, whose columns are collected when they're needed?
+
+    This is the case for queries that are collected as polars DataFrames.
+    """
+    return False
+
+
+@is_lazy_frame.register
+def _(data: PlLazyFrame) -> bool:
+    return True
+
+
+@is_lazy_frame.register
+def _(data: DuckDBRelation) -> bool:
+    try:
+        import polars  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+@singledispatch
+def lazy_select(data: Any, columns: list[str]) -> Any:
+    """Return a lazy query that selects (and only reads) some columns of another."""
+    _raise_not_implemented(data)
+
+
+@lazy_select.register
+def _(data: PlLazyFrame, columns: list[str]) -> PlLazyFrame:
+    return data.select(columns)
+
+
+@lazy_select.register
+def _(data: DuckDBRelation, columns: list[str]) -> DuckDBRelation:
+    quoted = ['"' + col.replace('"', '""') + '"' for col in columns]
+    return data.project(", ".join(quoted))
+
+
+@singledispatch
+def lazy_schema(data: Any) -> DataFrameLike:
+    """Return an empty DataFrame with the columns of a lazy query, without running it."""
+    _raise_not_implemented(data)
+
+
+@lazy_schema.register
+def _(data: PlLazyFrame) -> PlDataFrame:
+    return data.clear().collect()
+
+
+@lazy_schema.register
+def _(data: DuckDBRelation) -> PlDataFrame:
+    return data.limit(0).pl()
+
+
+class LazySource:
+    """A lazy query that a table was created from (see `is_lazy_frame()`).
+
+    Building a table only collects the columns it uses (with `collect()`), so that the engine can
+    skip reading the others. Anything that needs all of the data (with `frame()`) collects the
+    whole query instead, once, and later collections reuse it.
+    """
+
+    def __init__(self, query: Any):
+        self.query = query
+        self.schema = validate_frame(lazy_schema(query))
+        self.columns = get_column_names(self.schema)
+        self._frame: DataFrameLike | None = None
+
+    def frame(self) -> DataFrameLike:
+        if self._frame is None:
+            self._frame = validate_frame(collect_frame(self.query))
+
+        return self._frame
+
+    def collect(self, columns: list[str]) -> DataFrameLike:
+        """Collect some columns of the query, in the order of the query."""
+
+        columns = [col for col in self.columns if col in set(columns)]
+
+        if self._frame is not None:
+            return select_columns(self._frame, columns)
+
+        return validate_frame(collect_frame(lazy_select(self.query, columns)))
+
+    def shape_frame(self, n_rows: int) -> DataFrameLike:
+        """Return a DataFrame with the columns of the query and `n_rows` rows, that holds no data.
+
+        This stands in for the table data where only its shape and backend are needed.
+        """
+        import polars as pl
+
+        return pl.DataFrame(schema={col: pl.Null for col in self.columns}).clear(n_rows)
+
+
 # to_frame ----
 
 
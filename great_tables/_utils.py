@@ -7,8 +7,10 @@ from collections.abc import Generator, Set
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
-from ._tbl_data import _get_cell, _set_cell, get_column_names, n_rows
-from ._text import BaseText, _process_text
+import numpy as np
+
+from ._tbl_data import _escape_string_cells, _get_cells, get_column_names, n_rows
+from ._text import _LATEX_ESCAPE_CHARS, BaseText, _latex_escape_many
 
 if TYPE_CHECKING:
     from ._gt_data import FormatInfo, GTData
@@ -243,7 +245,10 @@ def _migrate_unformatted_to_output(
     if context != "latex":
         return data
 
-    all_formatted_cells: list[list[tuple[str, int]]] = []
+    n = n_rows(data_tbl)
+
+    # Track the formatted cells as a boolean array of rows for each visible column
+    formatted_masks = {col: np.zeros(n, dtype=bool) for col in get_column_names(data_tbl)}
 
     for fmt in formats:
         eval_func = getattr(fmt.func, context, fmt.func.default)
@@ -251,36 +256,35 @@ def _migrate_unformatted_to_output(
             raise Exception("Internal Error")
 
         # Accumulate all formatted cells in the table
-        all_formatted_cells.append(fmt.cells.resolve())
-
-    # Deduplicate the list of formatted cells
-    deduplicate_formatted_cells = list(set(_flatten_list(all_formatted_cells)))
-
-    # Get all visible cells in the table
-    all_visible_cells = _get_visible_cells(data=data_tbl)
-
-    # Get the difference between the visible cells and the formatted cells
-    all_unformatted_cells = list(set(all_visible_cells) - set(deduplicate_formatted_cells))
+        for col, row_mask in fmt.cells.iter_column_masks(n):
+            if col in formatted_masks:
+                formatted_masks[col] |= row_mask
 
     # TODO: this currently will only be used for LaTeX (HTML escaping will be performed
     # in the future)
 
-    for col, row in all_unformatted_cells:
-        # Get the cell value and cast as string
-        cell_value = _get_cell(data_tbl, row, col)
-        cell_value_str = str(cell_value)
+    # The unformatted cells are the visible cells that are not set in a column's mask
+    for col, formatted_mask in formatted_masks.items():
+        rows = np.flatnonzero(~formatted_mask)
+        if not len(rows):
+            continue
 
-        result = _process_text(cell_value_str, context=context)
+        rows = rows.tolist()
 
-        _set_cell(data._body.body, row, col, result)
+        # String columns are escaped by the DataFrame backend, where it can
+        escaped = _escape_string_cells(data_tbl, col, rows, chars=_LATEX_ESCAPE_CHARS)
 
-    return data
+        if escaped is not None:
+            # a missing value is displayed as str(None), which has nothing to escape
+            results = ["None" if value is None else value for value in escaped]
+        else:
+            # Get the cell values of the column at once, cast as strings, and escape them together
+            cell_values = [str(cell_value) for cell_value in _get_cells(data_tbl, col, rows)]
+            results = _latex_escape_many(cell_values)
 
+        data._body.set_cells(rows, col, results)
 
-# Get a list of tuples for all visible cells in the table
-# Define the type of `data` as `TblData` when doing so won't result in a circular import
-def _get_visible_cells(data: TblData) -> list[tuple[str, int]]:
-    return [(col, row) for col in get_column_names(data) for row in range(n_rows(data))]
+    return data
 
 
 def is_valid_http_schema(url: str) -> bool:
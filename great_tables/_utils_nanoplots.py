@@ -1,23 +1,42 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+from itertools import accumulate
+from math import isnan
 from typing import Any, Callable
 
 import numpy as np
 
-from ._tbl_data import Agnostic, is_na
+from ._tbl_data import PlNull
 from ._utils import _flatten_list, _match_arg
 
 REFERENCE_LINE_KEYWORDS = ["mean", "median", "min", "max", "q1", "q3"]
 
+# Matches the opening tag of a nanoplot SVG followed by its `<defs>` and `<style>` blocks (in the
+# form produced by `_construct_nanoplot_svg()`)
+NANOPLOT_DEFS_STYLE_PATTERN = re.compile(
+    r'(<svg role="img" [^>]*>)(<defs>.*?</defs>)(<style>.*?</style>)', flags=re.DOTALL
+)
+
 
 def _is_na(x: Any) -> bool:
-    return is_na(Agnostic(), x)
+    # This is the check made by `is_na(Agnostic(), x)`, inlined (with numbers handled first)
+    # since it runs once per value
+    if isinstance(x, (int, float)):
+        return isinstance(x, float) and isnan(x)
+
+    return x is None or isinstance(x, PlNull)
 
 
-def _map_is_na(x: list[Any]) -> list[bool]:
+def _map_is_na(x: list[Any] | np.ndarray) -> list[bool] | np.ndarray:
     # TODO: all([]) returns True. Let's double check all places
     # in the code that call all() with this function. Do they work as intended?
-    return [is_na(Agnostic(), val) for val in x]
+    if isinstance(x, np.ndarray):
+        # Numeric arrays can only hold missing values as NaN
+        return np.isnan(x) if x.dtype.kind == "f" else np.zeros(len(x), dtype=bool)
+
+    return [_is_na(val) for val in x]
 
 
 def _val_is_numeric(x: Any) -> bool:
@@ -56,6 +75,9 @@ def _is_integerlike(val_list: list[Any]) -> bool:
     if len(val_list) == 0:
         return False
 
+    if isinstance(val_list, np.ndarray):
+        return val_list.dtype.kind in "iu"
+
     return all((isinstance(val, (int, np.integer)) or _is_na(val)) for val in val_list)
 
 
@@ -122,73 +144,133 @@ def _format_number_compactly(
     Format a single numeric value compactly, using a currency if provided.
     """
 
-    from great_tables.vals import fmt_currency, fmt_integer, fmt_number, fmt_scientific
+    return _format_numbers_compactly(vals=[val], currency=currency, as_integer=as_integer, fn=fn)[0]
+
+
+def _format_numbers_compactly(
+    vals: list[int | float] | np.ndarray,
+    currency: str | None = None,
+    as_integer: bool = False,
+    fn: Callable[..., str] | None = None,
+) -> list[str]:
+    """
+    Format a list of numeric values compactly, using a currency if provided.
+
+    Values that share a formatting directive are formatted together through a single call of the
+    corresponding `vals.fmt_*()` function (instead of one call per value).
+    """
+
+    # The labels are formatted from Python scalars, so that arrays are labeled just as lists are
+    if isinstance(vals, np.ndarray):
+        vals = vals.tolist()
 
     if fn is not None and isinstance(fn, Callable):
-        res = fn(val)
+        res = [fn(val) for val in vals]
 
-        # Check whether the result is a single string value; if not, raise an error
-        if not isinstance(res, str):
+        # Check whether each result is a single string value; if not, raise an error
+        if not all(isinstance(val, str) for val in res):
             raise ValueError("The result of the formatting function must be a single string value.")
 
         return res
 
-    if _is_na(val):
-        return "NA"
+    formatted: list[str] = [""] * len(vals)
+
+    # Group the positions of the values by formatting directive; the type of the value is part
+    # of the directive so that ints and floats are formatted just as they would be individually
+    groups: dict[tuple[Any, ...], list[int]] = {}
+
+    for i, val in enumerate(vals):
+        if _is_na(val):
+            formatted[i] = "NA"
+            continue
+
+        if val == 0:
+            formatted[i] = "0"
+            continue
+
+        # Very large currency values are only marked as being out of range
+        if currency is not None and abs(val) >= 1e15:
+            formatted[i] = ">"
+            continue
+
+        key = (*_compact_format_directive(val, currency=currency, as_integer=as_integer), type(val))
+        groups.setdefault(key, []).append(i)
 
-    if val == 0:
-        return "0"
+    for (fmt_fn, fmt_kwargs, _), idx in groups.items():
+        res = fmt_fn([vals[i] for i in idx], **dict(fmt_kwargs))
 
-    if abs(val) < 0.01:
+        for i, res_i in zip(idx, res):
+            formatted[i] = res_i
+
+    return formatted
+
+
+def _compact_format_directive(
+    val: int | float,
+    currency: str | None = None,
+    as_integer: bool = False,
+) -> tuple[Callable[..., list[str]], tuple[tuple[str, Any], ...]]:
+    """
+    Determine how a single (non-missing, non-zero) value is to be formatted compactly.
+
+    A tuple of the `vals.fmt_*()` function and its keyword arguments (as hashable items) is
+    returned.
+    """
+
+    from great_tables.vals import fmt_currency, fmt_integer, fmt_number, fmt_scientific
+
+    abs_val = abs(val)
+
+    if abs_val < 0.01:
         use_subunits = True
         decimals = None
 
         n_sigfig = 2
         compact = False
 
-    elif abs(val) < 1:
+    elif abs_val < 1:
         use_subunits = True
         decimals = None
 
         n_sigfig = 2
         compact = False
 
-    elif abs(val) < 100:
+    elif abs_val < 100:
         use_subunits = True
         decimals = None
 
         n_sigfig = 3
         compact = False
 
-    elif abs(val) < 1000:
+    elif abs_val < 1000:
         use_subunits = True
         decimals = None
 
         n_sigfig = 3
         compact = False
 
-    elif abs(val) < 10000:
+    elif abs_val < 10000:
         use_subunits = False
         decimals = 2
 
         n_sigfig = 3
         compact = True
 
-    elif abs(val) < 100000:
+    elif abs_val < 100000:
         use_subunits = False
         decimals = 1
 
         n_sigfig = 3
         compact = True
 
-    elif abs(val) < 1000000:
+    elif abs_val < 1000000:
         use_subunits = False
         decimals = 0
 
         n_sigfig = 3
         compact = True
 
-    elif abs(val) < 1e15:
+    elif abs_val < 1e15:
         use_subunits = False
         decimals = 1
 
@@ -204,48 +286,18 @@ def _format_number_compactly(
     # Format value accordingly
 
     if currency is not None:
-        if abs(val) >= 1e15:
-            val_formatted = fmt_currency(
-                1e15,
-                currency=currency,
-                use_subunits=False,
-                decimals=0,
-                # compact=True,
-            )
-
-            val_formatted = f">{val_formatted}"
-
-        else:
-            val_formatted = fmt_currency(
-                val,
-                currency=currency,
-                use_subunits=use_subunits,
-                decimals=decimals,
-                # compact=compact,
-            )
-
-    else:
-        if abs(val) < 0.01 or abs(val) >= 1e15:
-            val_formatted = fmt_scientific(
-                val,
-                exp_style="E",
-                n_sigfig=n_sigfig,
-                decimals=1,
-            )
+        return (
+            fmt_currency,
+            (("currency", currency), ("use_subunits", use_subunits), ("decimals", decimals)),
+        )
 
-        else:
-            if as_integer and val > -100 and val < 100:
-                val_formatted = fmt_integer(val)
+    if abs_val < 0.01 or abs_val >= 1e15:
+        return fmt_scientific, (("exp_style", "E"), ("n_sigfig", n_sigfig), ("decimals", 1))
 
-            else:
-                val_formatted = fmt_number(
-                    val,
-                    n_sigfig=n_sigfig,
-                    decimals=1,
-                    compact=compact,
-                )
+    if as_integer and val > -100 and val < 100:
+        return fmt_integer, ()
 
-    return val_formatted[0]
+    return fmt_number, (("n_sigfig", n_sigfig), ("decimals", 1), ("compact", compact))
 
 
 #
@@ -327,7 +379,7 @@ def _gt_q3(x: list[int | float]) -> float:
 
 
 def _get_extreme_value(
-    *args: int | float,
+    *args: int | float | list[int | float] | np.ndarray,
     stat: str = "max",
 ) -> int | float:
     """
@@ -337,7 +389,8 @@ def _get_extreme_value(
     # Ensure that `stat` is either 'max' or 'min'
     _match_arg(stat, lst=["max", "min"])
 
-    # Remove any None values from the `args` list
+    # Remove any None values from the `args` list, and reduce any arrays to their extreme values
+    args = [_array_extremes(val) if isinstance(val, np.ndarray) else val for val in args]
     args = [val for val in args if val is not None]
 
     # Flatten the `args` list which may contain lists and scalar values
@@ -357,7 +410,23 @@ def _get_extreme_value(
     return extreme_val
 
 
-def _generate_ref_line_from_keyword(vals: list[int | float], keyword: str) -> int | float:
+def _array_extremes(x: np.ndarray) -> list[int | float]:
+    """
+    Get the minimum and maximum of the non-missing values of a numeric array, as Python scalars.
+    """
+
+    if x.dtype.kind == "f":
+        x = x[~np.isnan(x)]
+
+    if x.size == 0:
+        return []
+
+    return [x.min().item(), x.max().item()]
+
+
+def _generate_ref_line_from_keyword(
+    vals: list[int | float] | np.ndarray, keyword: str
+) -> int | float:
     """
     Generate a value for a reference line from a valid keyword.
     """
@@ -367,6 +436,10 @@ def _generate_ref_line_from_keyword(vals: list[int | float], keyword: str) -> in
         lst=REFERENCE_LINE_KEYWORDS,
     )
 
+    # The statistics are taken over Python scalars, so that they're the same for arrays and lists
+    if isinstance(vals, np.ndarray):
+        vals = vals.tolist()
+
     _check_any_na_in_list(vals)
 
     # Remove missing values from the `vals` list
@@ -392,21 +465,47 @@ def _generate_ref_line_from_keyword(vals: list[int | float], keyword: str) -> in
     return ref_line
 
 
-def _normalize_vals(x: list[int] | list[float] | list[int | float]) -> list[int | float]:
+def _normalize_vals(
+    x: list[int] | list[float] | list[int | float] | np.ndarray,
+) -> list[int | float] | np.ndarray:
     """
     Normalize a list of numeric values to be between 0 and 1. Account for missing values.
+
+    An array of values is normalized as an array of floats (with missing values as NaN).
     """
 
-    x_missing = [i for i, val in enumerate(x) if _is_na(val)]
-    mean_x = np.mean([val for val in x if not _is_na(val)])
-    x = [mean_x if _is_na(val) else val for val in x]
-    x = np.array(x)
+    if isinstance(x, np.ndarray):
+        x = x.astype(float)
+        missing = np.isnan(x)
+
+        if missing.any():
+            x[missing] = np.mean(x[~missing])
+
+        x = (x - np.min(x)) / (np.max(x) - np.min(x))
+        x[missing] = np.nan
+
+        return x
+
+    missing = np.array(_map_is_na(x), dtype=bool)
+
+    if not missing.any():
+        x = np.array(x)
+    else:
+        x = np.array([np.nan if is_missing else val for val, is_missing in zip(x, missing)])
+
+        # Missing values are temporarily set to the mean of the non-missing values so that
+        # they don't affect the range of the values
+        x[missing] = np.mean(x[~missing])
+
     min_attr = np.min(x, axis=0)
     max_attr = np.max(x, axis=0)
     x = x - min_attr
     x = x / (max_attr - min_attr)
     x = x.tolist()
-    x = [np.nan if i in x_missing else val for i, val in enumerate(x)]
+
+    if missing.any():
+        x = [np.nan if is_missing else val for val, is_missing in zip(x, missing)]
+
     return x
 
 
@@ -443,6 +542,10 @@ def _normalize_to_dict(**kwargs: list[int | float]) -> dict[str, list[int | floa
     # Remove any None values from the `all_vals` list
     all_vals = [val for val in all_vals if val is not None]
 
+    # When any of the values are an array, all of them are normalized together as one array
+    if any(isinstance(val, np.ndarray) for val in all_vals):
+        return _normalize_arrays_to_dict(args, all_keys, all_vals)
+
     # Get the length of each arg in the args dictionary (if single value, length is 1; if
     # a list, length is the length of the list)
     arg_lens = [len(val) if type(val) is list else 1 for val in all_vals]
@@ -471,6 +574,71 @@ def _normalize_to_dict(**kwargs: list[int | float]) -> dict[str, list[int | floa
     return args
 
 
+def _normalize_arrays_to_dict(
+    args: dict[str, Any], all_keys: list[str], all_vals: list[Any]
+) -> dict[str, Any]:
+    """
+    Normalize a collection of numeric values (where some are arrays) as a single array, and put
+    the slices of that array back into `args` under their original keys.
+    """
+
+    # Missing values (as None) in any lists become NaN
+    arrays = [np.atleast_1d(np.asarray(val, dtype=float)) for val in all_vals]
+    all_arr = np.concatenate(arrays)
+
+    # If all values are the same, then jitter the values
+    if np.unique(all_arr).size == 1:
+        all_arr = all_arr + np.random.uniform(-0.1, 0.1, size=all_arr.size)
+
+    normalized_vals = _normalize_vals(all_arr)
+
+    bounds = list(accumulate((len(arr) for arr in arrays), initial=0))
+    for key, start, end in zip(all_keys, bounds, bounds[1:]):
+        args[key] = normalized_vals[start:end]
+
+    return args
+
+
+@lru_cache
+def _nanoplot_svg_defs(data_area_fill_color: str) -> str:
+    """
+    Generate the `<defs>` block (with the repeating line pattern for data areas) of a nanoplot.
+    """
+
+    return (
+        f"<defs>"
+        f'<pattern id="area_pattern" width="8" height="8" patternUnits="userSpaceOnUse">'
+        f'<path class="pattern-line" d="M 0,8 l 8,-8 M -1,1 l 4,-4 M 6,10 l 4,-4" stroke="'
+        f"{data_area_fill_color}"
+        f'" stroke-width="1.5" stroke-linecap="round" shape-rendering="geometricPrecision">'
+        f"</path>"
+        f"</pattern>"
+        f"</defs>"
+    )
+
+
+@lru_cache
+def _nanoplot_svg_style(interactive_data_values: bool, vertical_guide_stroke_color: str) -> str:
+    """
+    Generate the `<style>` block for the vertical guidelines and y-axis of a nanoplot.
+    """
+
+    hover_param = ":hover" if interactive_data_values else ""
+
+    return (
+        f"<style> text {{ font-family: ui-monospace, 'Cascadia Code', 'Source Code Pro', Menlo, Consolas, 'DejaVu Sans Mono', monospace; stroke-width: 0.15em; paint-order: stroke; stroke-linejoin: round; cursor: default; }} "
+        f".vert-line{hover_param} rect {{ fill: {vertical_guide_stroke_color}; fill-opacity: 40%; stroke: #FFFFFF60; color: red; }} "
+        f".vert-line{hover_param} text {{ stroke: white; fill: #212427; }} "
+        f".horizontal-line{hover_param} text {{stroke: white; fill: #212427; }} "
+        f".ref-line{hover_param} rect {{ stroke: #FFFFFF60; }} "
+        f".ref-line{hover_param} line {{ stroke: #FF0000; }} "
+        f".ref-line{hover_param} text {{ stroke: white; fill: #212427; }} "
+        f".y-axis-line{hover_param} rect {{ fill: #EDEDED; fill-opacity: 60%; stroke: #FFFFFF60; color: red; }} "
+        f".y-axis-line{hover_param} text {{ stroke: white; stroke-width: 0.20em; fill: #1A1C1F; }} "
+        f"</style>"
+    )
+
+
 def _construct_nanoplot_svg(
     viewbox: str,
     svg_height: str,
@@ -511,6 +679,37 @@ def _construct_nanoplot_svg(
     return f'<div><svg role="img" viewBox="{viewbox}" style="height: {svg_height}; margin-left: auto; margin-right: auto; font-size: inherit; overflow: visible; vertical-align: middle; position:relative;">{svg_defs}{svg_style}{ref_area_tags}{area_path_tags}{data_path_tags}{zero_line_tags}{bar_tags}{ref_line_tags}{circle_tags}{g_y_axis_tags}{g_guide_tags}</svg></div>'
 
 
+def _hoist_nanoplot_defs(html: str) -> tuple[str, str]:
+    """
+    Move the `<defs>` and `<style>` blocks out of every nanoplot SVG in an HTML string.
+
+    The HTML without those blocks is returned along with a hidden SVG that contains each distinct
+    block once. The blocks keep their order of first appearance: both are document-wide (the
+    styles apply to the whole page and the first pattern with a given `id` is the one that's used
+    by all plots) so placing the hidden SVG ahead of the plots doesn't change how they render.
+    """
+
+    defs: dict[str, None] = {}
+    styles: dict[str, None] = {}
+
+    def _hoist(match: re.Match[str]) -> str:
+        defs.setdefault(match[2])
+        styles.setdefault(match[3])
+        return match[1]
+
+    html = NANOPLOT_DEFS_STYLE_PATTERN.sub(_hoist, html)
+
+    if not defs:
+        return html, ""
+
+    shared_defs = (
+        '<svg aria-hidden="true" style="position: absolute; width: 0; height: 0; overflow: hidden;">'
+        f"{''.join(defs)}{''.join(styles)}</svg>"
+    )
+
+    return html, shared_defs
+
+
 def _generate_nanoplot(
     y_vals: list[int] | list[float] | list[int | float],
     y_ref_line: str | None = None,
@@ -592,18 +791,22 @@ def _generate_nanoplot(
     # Initialize the `single_horizontal_plot` variable with `False`
     single_horizontal_plot = False
 
+    # Values given as a NumPy array (e.g., a view over a cell of a list column) are kept as an
+    # array, and handled in the same way as a list of values
+    y_is_seq = isinstance(y_vals, (list, np.ndarray))
+
     # If the number of `y` values in a list is zero or if all consist of NA values,
     # return an empty string
-    if isinstance(y_vals, list) and len(y_vals) == 0:
+    if y_is_seq and len(y_vals) == 0:
         return ""
 
     # If all `y` values are NA, return an empty string
     # TODO: all([]) evaluates to True. In that case does this produce the intended behavior?
-    if isinstance(y_vals, list) and all(_map_is_na(y_vals)):
+    if y_is_seq and np.all(_map_is_na(y_vals)):
         return ""
 
     # Get the number of data points for `y`
-    if type(y_vals) is list:
+    if y_is_seq:
         num_y_vals = len(y_vals)
     else:
         num_y_vals = 1
@@ -614,7 +817,7 @@ def _generate_nanoplot(
         # return an empty string
         if len(x_vals) == 0:
             return ""
-        if all(_map_is_na(x_vals)):
+        if np.all(_map_is_na(x_vals)):
             return ""
 
         # Get the number of data points for `x`
@@ -633,7 +836,7 @@ def _generate_nanoplot(
         # Handle missing values in `x_vals` through removal (i.e., missing
         # values in `x_vals` means removal of positional values from both
         # `x_vals` and `y_vals`)
-        if any(_map_is_na(x_vals)):
+        if np.any(_map_is_na(x_vals)):
             # TODO: this code did not have test coverage and likely didn't
             # work. It should work now, but we need to test it.
 
@@ -669,7 +872,7 @@ def _generate_nanoplot(
             x_vals = x_vals[y_vals.index]
 
     # Get the number of data points for `y`
-    if isinstance(y_vals, list):
+    if isinstance(y_vals, (list, np.ndarray)):
         num_y_vals = len(y_vals)
     else:
         num_y_vals = 1
@@ -936,14 +1139,10 @@ def _generate_nanoplot(
     # plot area; these are named `data_x_points` and `data_y_points`
     #
 
-    for i in range(len(y_proportions)):
-        y_proportions[i] = safe_y_d + ((1 - y_proportions[i]) * data_y_height)
-
-    for i in range(len(x_proportions)):
-        x_proportions[i] = (data_x_width * x_proportions[i]) + safe_x_d
-
-    data_y_points = y_proportions
-    data_x_points = x_proportions
+    data_y_points = (
+        safe_y_d + ((1 - np.asarray(y_proportions, dtype=float)) * data_y_height)
+    ).tolist()
+    data_x_points = ((data_x_width * np.asarray(x_proportions, dtype=float)) + safe_x_d).tolist()
 
     #
     # Ensure that certain options have their lengths checked and
@@ -1001,14 +1200,17 @@ def _generate_nanoplot(
 
             curved_path_string = [f"M {curve_x[0]},{curve_y[0]}"]
 
-            for j in range(1, len(curve_x)):
-                point_b1 = f"{curve_x[j - 1] + x_d / 2},{curve_y[j - 1]}"
-                point_b2 = f"{curve_x[j] - x_d / 2},{curve_y[j]}"
-                point_i = f"{curve_x[j]},{curve_y[j]}"
-
-                path_string_j = f"C {point_b1} {point_b2} {point_i}"
+            if len(curve_x) > 1:
+                # The Bézier control points sit half an interval to either side of each point
+                curve_x_b1 = (np.asarray(curve_x[:-1]) + x_d / 2).tolist()
+                curve_x_b2 = (np.asarray(curve_x[1:]) - x_d / 2).tolist()
 
-                curved_path_string.append(path_string_j)
+                curved_path_string.extend(
+                    f"C {x_b1},{y_0} {x_b2},{y_1} {x_1},{y_1}"
+                    for x_b1, y_0, x_b2, x_1, y_1 in zip(
+                        curve_x_b1, curve_y[:-1], curve_x_b2, curve_x[1:], curve_y[1:]
+                    )
+                )
 
             curved_path_string_i = " ".join(curved_path_string)
 
@@ -1384,13 +1586,15 @@ def _generate_nanoplot(
 
         g_guide_strings = []
 
+        # Format all values in a compact manner (in a single pass over `y_vals`)
+        y_value_labels = _format_numbers_compactly(
+            vals=y_vals, currency=currency, as_integer=y_vals_integerlike, fn=y_val_fmt_fn
+        )
+
         for i, _ in enumerate(data_x_points):
             rect_strings_i = f'<rect x="{data_x_points[i] - 10}" y="{top_y}" width="20" height="{bottom_y}" stroke="transparent" stroke-width="{vertical_guide_stroke_width}" fill="transparent"></rect>'
 
-            # Format value in a compact manner
-            y_value_i = _format_number_compactly(
-                val=y_vals[i], currency=currency, as_integer=y_vals_integerlike, fn=y_val_fmt_fn
-            )
+            y_value_i = y_value_labels[i]
 
             x_text = data_x_points[i] + 10
 
@@ -1412,16 +1616,7 @@ def _generate_nanoplot(
     # Generate background with repeating line pattern
     #
 
-    svg_defs = (
-        f"<defs>"
-        f'<pattern id="area_pattern" width="8" height="8" patternUnits="userSpaceOnUse">'
-        f'<path class="pattern-line" d="M 0,8 l 8,-8 M -1,1 l 4,-4 M 6,10 l 4,-4" stroke="'
-        f"{data_area_fill_color}"
-        f'" stroke-width="1.5" stroke-linecap="round" shape-rendering="geometricPrecision">'
-        f"</path>"
-        f"</pattern>"
-        f"</defs>"
-    )
+    svg_defs = _nanoplot_svg_defs(data_area_fill_color)
 
     if plot_type == "line" and show_data_area:
         area_path_tags = []
@@ -1448,20 +1643,7 @@ def _generate_nanoplot(
     # Generate style tag for vertical guidelines and y-axis
     #
 
-    hover_param = ":hover" if interactive_data_values else ""
-
-    svg_style = (
-        f"<style> text {{ font-family: ui-monospace, 'Cascadia Code', 'Source Code Pro', Menlo, Consolas, 'DejaVu Sans Mono', monospace; stroke-width: 0.15em; paint-order: stroke; stroke-linejoin: round; cursor: default; }} "
-        f".vert-line{hover_param} rect {{ fill: {vertical_guide_stroke_color}; fill-opacity: 40%; stroke: #FFFFFF60; color: red; }} "
-        f".vert-line{hover_param} text {{ stroke: white; fill: #212427; }} "
-        f".horizontal-line{hover_param} text {{stroke: white; fill: #212427; }} "
-        f".ref-line{hover_param} rect {{ stroke: #FFFFFF60; }} "
-        f".ref-line{hover_param} line {{ stroke: #FF0000; }} "
-        f".ref-line{hover_param} text {{ stroke: white; fill: #212427; }} "
-        f".y-axis-line{hover_param} rect {{ fill: #EDEDED; fill-opacity: 60%; stroke: #FFFFFF60; color: red; }} "
-        f".y-axis-line{hover_param} text {{ stroke: white; stroke-width: 0.20em; fill: #1A1C1F; }} "
-        f"</style>"
-    )
+    svg_style = _nanoplot_svg_style(interactive_data_values, vertical_guide_stroke_color)
 
     nanoplot_svg = _construct_nanoplot_svg(
         viewbox=viewbox,
@@ -1507,7 +1689,15 @@ def _is_intlike(n: Any, scaled_by: float = 1e17) -> bool:
     return isinstance(n, numbers.Real) and ((n * scaled_by - int(n) * scaled_by) == 0)
 
 
-def _get_n_intlike(nums: list[Any]) -> int:
+def _get_n_intlike(nums: list[Any] | np.ndarray) -> int:
+    if isinstance(nums, np.ndarray) and nums.dtype.kind in "iuf":
+        if nums.dtype.kind in "iu":
+            return len(nums)
+
+        # The same check as `_is_intlike()`, over the finite values of the array
+        finite = nums[np.isfinite(nums)]
+        return int(np.count_nonzero(finite * 1e17 - np.trunc(finite) * 1e17 == 0))
+
     return len([n for n in nums if _is_intlike(n)])
 
 
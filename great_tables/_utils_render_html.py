@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 from itertools import chain
-from typing import Any, cast
+from typing import Any, Callable, Iterable, cast
 
-from htmltools import HTML, TagList, css, tags
+from htmltools import css, tags
 
 from . import _locations as loc
-from ._gt_data import GroupRowInfo, GTData, Styles
+from ._gt_data import GroupRowInfo, GTData, StyleInfo, Styles
 from ._spanners import spanners_print_matrix
-from ._tbl_data import _get_cell, cast_frame_to_string, replace_null_frame
 from ._text import BaseText, _process_text, _process_text_id
 from ._utils import heading_has_subtitle, heading_has_title, seq_groups
 
@@ -97,6 +96,81 @@ def create_heading_component_h(data: GTData) -> str:
     return heading
 
 
+# Templates for the column labels component ----
+# These emit the same markup that htmltools would produce for the equivalent tags (attribute
+# values escaped, and <th> cells with tag children spread over several lines).
+
+_HTML_ATTR_ESCAPE = str.maketrans(
+    {
+        "&": "&amp;",
+        ">": "&gt;",
+        "<": "&lt;",
+        '"': "&quot;",
+        "'": "&apos;",
+        "\r": "&#13;",
+        "\n": "&#10;",
+    }
+)
+
+_TH_TEMPLATE = '  <th class="{cls}" rowspan="{rowspan}" colspan="{colspan}"{style} scope="{scope}"{id}>{content}</th>'
+
+_TH_SPAN_TEMPLATE = '  <th class="{cls}" rowspan="{rowspan}" colspan="{colspan}"{style} scope="{scope}"{id}>\n    {content}\n  </th>'
+
+_TH_STUB_SPACER_TEMPLATE = '  <th class="{cls}" rowspan="1" colspan="{colspan}" scope="{scope}"{style}>\n    <span>&nbsp</span>\n  </th>'
+
+_SPANNER_SPAN_TEMPLATE = '<span class="gt_column_spanner">{label}</span>'
+
+
+def _escape_attr(x: Any) -> str:
+    return str(x).translate(_HTML_ATTR_ESCAPE)
+
+
+def _style_attr(rendered_styles: list[str]) -> str:
+    if not rendered_styles:
+        return ""
+    return f' style="{_escape_attr(" ".join(rendered_styles))}"'
+
+
+def _id_attr(id: str | None) -> str:
+    if id is None:
+        return ""
+    return f' id="{_escape_attr(id)}"'
+
+
+def _render_styles(styles: list[StyleInfo]) -> list[str]:
+    return [el._to_html_style() for x in styles for el in x.styles]
+
+
+def _index_styles(styles: list[StyleInfo], key: Callable[[StyleInfo], Iterable[Any]]):
+    """Group styles by each of their keys, keeping the order the styles were set in."""
+
+    index: dict[Any, list[StyleInfo]] = {}
+    for x in styles:
+        for k in dict.fromkeys(key(x)):
+            index.setdefault(k, []).append(x)
+
+    return index
+
+
+def _index_body_styles(styles: list[StyleInfo]) -> dict[str, dict[int, list[StyleInfo]]]:
+    """Group body styles by column, and then by row, keeping the order the styles were set in."""
+
+    index: dict[str, dict[int, list[StyleInfo]]] = {}
+    for col, col_styles in _index_styles(styles, lambda x: x.cells.cols).items():
+        row_index = index[col] = {}
+        for x in col_styles:
+            for row in x.cells._row_numbers():
+                row_index.setdefault(row, []).append(x)
+
+    return index
+
+
+def _tr(cells: list[str], cls: str, style: str = "") -> str:
+    if not cells:
+        return f'<tr class="{cls}"{style}></tr>'
+    return f'<tr class="{cls}"{style}>\n' + "\n".join(cells) + "\n</tr>"
+
+
 def create_columns_component_h(data: GTData) -> str:
     """
     Returns the HTML text fragment for the column/spanner labels.
@@ -144,6 +218,30 @@ def create_columns_component_h(data: GTData) -> str:
     styles_spanner_label = [x for x in data._styles if _is_loc(x.locname, loc.LocSpannerLabels)]
     styles_column_label = [x for x in data._styles if _is_loc(x.locname, loc.LocColumnLabels)]
 
+    # Extract the table ID to ensure subsequent IDs are unique
+    table_id = data._options.table_id.value
+
+    # Render the styles shared by all column labels once, and index the styles for individual
+    # column labels and spanners, so that each <th> only looks up its own styles
+    rendered_column_labels = _render_styles(styles_column_labels)
+    column_label_index = _index_styles(styles_column_label, lambda x: [x.colname])
+    spanner_label_index = _index_styles(styles_spanner_label, lambda x: x.grpname or [])
+
+    def column_label_style(var: str) -> str:
+        styles_i = column_label_index.get(var, [])
+        return _style_attr(rendered_column_labels + _render_styles(styles_i))
+
+    def column_label_th(label: Any, var: str, align: str | None, rowspan: int) -> str:
+        return _TH_TEMPLATE.format(
+            cls=_escape_attr(f"gt_col_heading gt_columns_bottom_border gt_{align}"),
+            rowspan=rowspan,
+            colspan=1,
+            style=column_label_style(var),
+            scope="col",
+            id=_id_attr(_create_element_id(table_id, var)),
+            content=_process_text(label),
+        )
+
     # If columns are present in the stub, then replace with a set stubhead label or nothing
     if len(stub_layout) > 0 and stubh is not None:
         stub_label = stubh
@@ -155,202 +253,133 @@ def create_columns_component_h(data: GTData) -> str:
     # Set a default alignment for the stubhead label
     stubhead_label_alignment = "left"
 
-    # Initialize the column headings list
-    table_col_headings = []
-
-    # Extract the table ID to ensure subsequent IDs are unique
-    table_id = data._options.table_id.value
+    def stubhead_th(rowspan: int) -> str:
+        return _TH_TEMPLATE.format(
+            cls=f"gt_col_heading gt_columns_bottom_border gt_{stubhead_label_alignment}",
+            rowspan=rowspan,
+            colspan=len(stub_layout),
+            style=_style_attr(_render_styles(styles_stubhead)),
+            scope="colgroup" if len(stub_layout) > 1 else "col",
+            id=_id_attr(_create_element_id(table_id, stub_label)),
+            content=_process_text(stub_label),
+        )
 
     # If there are no spanners, then we have to create the cells for the stubhead label
     # (if present) and for the column headings
     if spanner_row_count == 0:
+        # Initialize the column headings list
+        table_col_headings: list[str] = []
+
         # Create the cell for the stubhead label
         if len(stub_layout) > 0:
-            table_col_headings.append(
-                tags.th(
-                    HTML(_process_text(stub_label)),
-                    class_=f"gt_col_heading gt_columns_bottom_border gt_{stubhead_label_alignment}",
-                    rowspan="1",
-                    colspan=len(stub_layout),
-                    style=_flatten_styles(styles_stubhead),
-                    scope="colgroup" if len(stub_layout) > 1 else "col",
-                    id=_create_element_id(table_id, stub_label),
-                )
-            )
+            table_col_headings.append(stubhead_th(rowspan=1))
 
         # Create the headings in the case where there are no spanners at all -------------------------
         for info in headings_info:
-            # Filter by column label / id, join with overall column labels style
-            styles_i = [x for x in styles_column_label if x.colname == info.var]
-
             table_col_headings.append(
-                tags.th(
-                    HTML(_process_text(info.column_label)),
-                    class_=f"gt_col_heading gt_columns_bottom_border gt_{info.defaulted_align}",
-                    rowspan=1,
-                    colspan=1,
-                    style=_flatten_styles(styles_column_labels + styles_i),
-                    scope="col",
-                    id=_create_element_id(table_id, info.var),
-                )
+                column_label_th(info.column_label, info.var, info.defaulted_align, rowspan=1)
             )
 
-        # Join the <th> cells into a string and begin each with a newline
-        # th_cells = "\n" + "\n".join(["  " + str(tag) for tag in table_col_headings]) + "\n"
-
-        table_col_headings = tags.tr(*table_col_headings, class_="gt_col_headings")
+        return _tr(table_col_headings, cls="gt_col_headings")
 
     #
     # Create the spanners and column labels in the case where there *are* spanners -------------
     #
 
-    if spanner_row_count >= 1:
-        spanners, _ = spanners_print_matrix(
-            spanners=data._spanners, boxhead=boxhead, include_hidden=False
-        )
+    spanners, _ = spanners_print_matrix(
+        spanners=data._spanners, boxhead=boxhead, include_hidden=False
+    )
 
-        spanner_ids, spanner_col_names = spanners_print_matrix(
-            spanners=data._spanners, boxhead=boxhead, include_hidden=False, ids=False
-        )
+    spanner_ids, spanner_col_names = spanners_print_matrix(
+        spanners=data._spanners, boxhead=boxhead, include_hidden=False, ids=False
+    )
 
-        # Last is column labels
-        # So take second to last
-        level_1_index = -2
+    # Last is column labels
+    # So take second to last
+    level_1_index = -2
 
-        # A list of <th> elements that will go in the first level; this
-        # includes spanner labels and column labels for solo columns (don't
-        # have spanner labels above them)
-        level_1_spanners = []
+    # A list of <th> elements that will go in the first level; this
+    # includes spanner labels and column labels for solo columns (don't
+    # have spanner labels above them)
+    level_1_spanners = []
 
-        # A list of <th> elements that will go in the second row. This is
-        # all column labels that DO have spanners above them.
-        spanned_column_labels = []
+    # Create the cell for the stubhead label
+    if len(stub_layout) > 0:
+        level_1_spanners.append(stubhead_th(rowspan=2))
 
-        # Create the cell for the stubhead label
-        if len(stub_layout) > 0:
-            level_1_spanners.append(
-                tags.th(
-                    HTML(_process_text(stub_label)),
-                    class_=f"gt_col_heading gt_columns_bottom_border gt_{str(stubhead_label_alignment)}",
-                    rowspan=2,
-                    colspan=len(stub_layout),
-                    style=_flatten_styles(styles_stubhead),
-                    scope="colgroup" if len(stub_layout) > 1 else "col",
-                    id=_create_element_id(table_id, stub_label),
-                )
-            )
+    # NOTE: Run-length encoding treats missing values as distinct from each other; in other
+    # words, each missing value starts a new run of length 1
 
-        # NOTE: Run-length encoding treats missing values as distinct from each other; in other
-        # words, each missing value starts a new run of length 1
+    spanner_ids_level_1_index = list(spanner_ids[level_1_index].values())
+    spanners_rle = seq_groups(seq=spanner_ids_level_1_index)
 
-        spanner_ids_level_1_index = list(spanner_ids[level_1_index].values())
-        spanners_rle = seq_groups(seq=spanner_ids_level_1_index)
+    # `colspans` matches `spanners` in length; each element is the number of columns that the
+    # <th> at that position should span; if 0, then skip the <th> at that position
+    group_spans = [[x[1]] + [0] * (x[1] - 1) for x in spanners_rle]
 
-        # `colspans` matches `spanners` in length; each element is the number of columns that the
-        # <th> at that position should span; if 0, then skip the <th> at that position
-        group_spans = [[x[1]] + [0] * (x[1] - 1) for x in spanners_rle]
+    colspans = list(chain(*group_spans))
 
-        colspans = list(chain(*group_spans))
+    for ii, (span_key, h_info) in enumerate(zip(spanner_col_names, headings_info)):
+        if spanner_ids[level_1_index][span_key] is None:
+            # Creation of <th> tags for column labels with no spanners above them
+            level_1_spanners.append(
+                column_label_th(h_info.column_label, h_info.var, h_info.defaulted_align, rowspan=2)
+            )
 
-        for ii, (span_key, h_info) in enumerate(zip(spanner_col_names, headings_info)):
-            if spanner_ids[level_1_index][span_key] is None:
-                # Filter by column label / id, join with overall column labels style
-                styles_i = [x for x in styles_column_label if x.colname == h_info.var]
+        # If colspans[i] == 0, it means that a previous cell's `colspan` will cover us
+        elif colspans[ii] > 0:
+            spanner_id = spanner_ids_level_1_index[ii]
 
-                # Get the alignment values for the first set of column labels
-                first_set_alignment = h_info.defaulted_align
+            # spanner IDs default to the label, which might be an (unhashable) html() object
+            if isinstance(spanner_id, str):
+                styles_i = spanner_label_index.get(spanner_id, [])
+            else:
+                styles_i = []
 
-                # Creation of <th> tags for column labels with no spanners above them
-                level_1_spanners.append(
-                    tags.th(
-                        HTML(_process_text(h_info.column_label)),
-                        class_=f"gt_col_heading gt_columns_bottom_border gt_{str(first_set_alignment)}",
-                        rowspan=2,
-                        colspan=1,
-                        style=_flatten_styles(styles_column_labels + styles_i),
-                        scope="col",
-                        id=_create_element_id(table_id, h_info.var),
-                    )
+            level_1_spanners.append(
+                _TH_SPAN_TEMPLATE.format(
+                    cls="gt_center gt_columns_top_border gt_column_spanner_outer",
+                    rowspan=1,
+                    colspan=colspans[ii],
+                    style=_style_attr(rendered_column_labels + _render_styles(styles_i)),
+                    scope="colgroup" if colspans[ii] > 1 else "col",
+                    id=_id_attr(_create_element_id(table_id, spanner_id)),
+                    content=_SPANNER_SPAN_TEMPLATE.format(label=_process_text(spanner_id)),
                 )
+            )
 
-            elif spanner_ids[level_1_index][span_key] is not None:
-                # If colspans[i] == 0, it means that a previous cell's
-                # `colspan` will cover us
-                if colspans[ii] > 0:
-                    # Filter by column label / id, join with overall column labels style
-                    # TODO check this filter logic
-                    styles_i = [
-                        x
-                        for x in styles_spanner_label
-                        # TODO: refactor use of set
-                        if set(x.grpname) & set([spanner_ids_level_1_index[ii]])
-                    ]
-
-                    level_1_spanners.append(
-                        tags.th(
-                            tags.span(
-                                HTML(_process_text(spanner_ids_level_1_index[ii])),
-                                class_="gt_column_spanner",
-                            ),
-                            class_="gt_center gt_columns_top_border gt_column_spanner_outer",
-                            rowspan=1,
-                            colspan=colspans[ii],
-                            style=_flatten_styles(styles_column_labels + styles_i),
-                            scope="colgroup" if colspans[ii] > 1 else "col",
-                            id=_create_element_id(table_id, spanner_ids_level_1_index[ii]),
-                        )
-                    )
+    remaining_headings = {k for k, v in spanner_ids[level_1_index].items() if v is not None}
 
-        remaining_headings = [k for k, v in spanner_ids[level_1_index].items() if v is not None]
-        remaining_headings_labels = [
-            entry.column_label for entry in boxhead if entry.var in remaining_headings
-        ]
-        col_alignment = [
-            entry.defaulted_align for entry in boxhead if entry.var in remaining_headings
+    if len(remaining_headings) > 0:
+        # A list of <th> elements that will go in the second row. This is
+        # all column labels that DO have spanners above them.
+        spanned_column_labels = [
+            column_label_th(entry.column_label, entry.var, str(entry.column_align), rowspan=1)
+            for entry in boxhead
+            if entry.var in remaining_headings
         ]
 
-        if len(remaining_headings) > 0:
-            spanned_column_labels = []
-
-            remaining_heading_ids = [
-                entry.var for entry in boxhead if entry.var in remaining_headings
-            ]
-
-            for j in range(len(remaining_headings)):
-                # Filter by column label / id, join with overall column labels style
-                # TODO check this filter logic
-                styles_i = [x for x in styles_column_label if x.colname == remaining_headings[j]]
-
-                remaining_alignment = boxhead._get_boxhead_get_alignment_by_var(
-                    var=remaining_headings[j]
-                )
-
-                spanned_column_labels.append(
-                    tags.th(
-                        HTML(_process_text(remaining_headings_labels[j])),
-                        class_=f"gt_col_heading gt_columns_bottom_border gt_{remaining_alignment}",
-                        rowspan=1,
-                        colspan=1,
-                        style=_flatten_styles(styles_column_labels + styles_i),
-                        scope="col",
-                        id=_create_element_id(table_id, remaining_heading_ids[j]),
-                    )
-                )
-
-            table_col_headings = TagList(
-                tags.tr(level_1_spanners, class_="gt_col_headings gt_spanner_row"),
-                tags.tr(spanned_column_labels, class_="gt_col_headings"),
-            )
+        table_col_headings_rows = [
+            _tr(level_1_spanners, cls="gt_col_headings gt_spanner_row"),
+            _tr(spanned_column_labels, cls="gt_col_headings"),
+        ]
 
-        else:
-            # Create the `table_col_headings` HTML component
-            table_col_headings = tags.tr(level_1_spanners, class_="gt_col_headings gt_spanner_row")
+    else:
+        # Create the `table_col_headings` HTML component
+        table_col_headings_rows = [_tr(level_1_spanners, cls="gt_col_headings gt_spanner_row")]
 
     if _get_spanners_matrix_height(data=data) > 2:
         # Spanners are listed top to bottom, so we need to work bottom to top
         # We can skip the last (column labels) and second to last (first spanner)
         higher_spanner_rows_idx = range(0, len(spanner_ids) - 2)
-        higher_spanner_rows = TagList()
+        higher_spanner_rows = []
+
+        # The higher spanner rows only get the styles shared by all column labels (from
+        # `loc.column_header()`). Their cells span several columns, so styles for individual
+        # column labels (from `loc.column_labels(columns=...)`) don't apply to them. (Before, a
+        # column label style on a table with three or more levels of headings raised a
+        # TypeError here.)
+        base_style = _style_attr(rendered_column_labels)
 
         for i in higher_spanner_rows_idx:
             spanners_row = spanners[i]
@@ -366,80 +395,75 @@ def create_columns_component_h(data: GTData) -> str:
 
             for colspan, span_label in zip(colspans, spanners_row.values()):
                 if colspan > 0:
-                    # Filter by column label / id, join with overall column labels style
-                    # TODO check this filter logic
-                    styles_i = [
-                        x
-                        for x in styles_column_label
-                        # TODO: refactor use of set
-                        if set(x.grpname) & set([colspan, span_label])
-                    ]
-
                     if span_label:
-                        span = tags.span(
-                            HTML(_process_text(span_label)),
-                            class_="gt_column_spanner",
-                        )
+                        span = _SPANNER_SPAN_TEMPLATE.format(label=_process_text(span_label))
                     else:
-                        span = tags.span(HTML("&nbsp;"))
+                        span = "<span>&nbsp;</span>"
 
                     level_i_spanners.append(
-                        tags.th(
-                            span,
-                            class_="gt_center gt_columns_bottom_border gt_columns_top_border gt_column_spanner_outer",
+                        _TH_SPAN_TEMPLATE.format(
+                            cls="gt_center gt_columns_bottom_border gt_columns_top_border gt_column_spanner_outer",
                             rowspan=1,
                             colspan=colspan,
-                            style=_flatten_styles(styles_column_labels + styles_i),
+                            style=base_style,
                             scope="colgroup" if colspan > 1 else "col",
+                            id="",
+                            content=span,
                         )
                     )
 
             if len(stub_layout) > 0:
                 level_i_spanners.insert(
                     0,
-                    tags.th(
-                        tags.span(HTML("&nbsp")),
-                        class_=f"gt_col_heading gt_columns_bottom_border gt_{str(stubhead_label_alignment)}",
-                        rowspan=1,
+                    _TH_STUB_SPACER_TEMPLATE.format(
+                        cls=f"gt_col_heading gt_columns_bottom_border gt_{stubhead_label_alignment}",
                         colspan=len(stub_layout),
                         scope="colgroup" if len(stub_layout) > 1 else "col",
-                        # TODO check if ok to just use base styling?
-                        style=_flatten_styles(styles_column_labels),
+                        style=base_style,
                     ),
                 )
 
-            higher_spanner_rows = TagList(
-                higher_spanner_rows,
-                TagList(
-                    tags.tr(
-                        level_i_spanners,
-                        class_="gt_col_headings gt_spanner_row",
-                        # TODO check if ok to just use base styling?
-                        style=_flatten_styles(styles_column_labels),
-                    )
-                ),
+            higher_spanner_rows.append(
+                _tr(level_i_spanners, cls="gt_col_headings gt_spanner_row", style=base_style)
             )
 
-        table_col_headings = TagList(
-            higher_spanner_rows,
-            table_col_headings,
-        )
-    return table_col_headings
+        table_col_headings_rows = [*higher_spanner_rows, *table_col_headings_rows]
+
+    return "\n".join(table_col_headings_rows)
 
 
 def create_body_component_h(data: GTData) -> str:
-    # for now, just coerce everything in the original data to a string
-    # so we can fill in the body data with it
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    body_rows = [row for _, row in create_body_rows_h(data)]
+
+    return _tbody(body_rows)
+
+
+def _tbody(body_rows: list[str]) -> str:
+    all_body_rows = "\n".join(body_rows)
+
+    return f"""<tbody class="gt_table_body">
+{all_body_rows}
+</tbody>"""
+
+
+def create_body_rows_h(data: GTData) -> list[tuple[str, str]]:
+    """Return the rows of the table body, each as a key and the HTML of its `<tr>` element.
+
+    Keys are stable across renders of tables with the same rows: data rows are keyed by their
+    row name (or by their index, when there is no stub column) and group heading rows by their
+    group id.
+    """
 
     # Filter list of StyleInfo to only those that apply to the stub
     styles_row_group_label = [x for x in data._styles if _is_loc(x.locname, loc.LocRowGroups)]
     styles_row_label = [x for x in data._styles if _is_loc(x.locname, loc.LocStub)]
     styles_summary_label = [x for x in data._styles if _is_loc(x.locname, loc.LocSummaryLabel)]
 
-    # Filter list of StyleInfo to only those that apply to the body
+    # Filter list of StyleInfo to only those that apply to the body, and index them by the
+    # column and row of each cell
     styles_cells = [x for x in data._styles if _is_loc(x.locname, loc.LocBody)]
+    body_style_index = _index_body_styles(styles_cells)
+    row_label_index = _index_styles(styles_row_label, lambda x: [x.rownum])
     # styles_body = [x for x in data._styles if _is_loc(x.locname, loc.LocBody2)]
     # styles_summary = [x for x in data._styles if _is_loc(x.locname, loc.LocSummary)]
 
@@ -458,13 +482,22 @@ def create_body_component_h(data: GTData) -> str:
     if stub_var is not None:
         column_vars = [stub_var] + column_vars
 
+    # Get the text of all body cells (formatted values, or the data values cast to strings)
+    body_text = data._body.text_columns(data._tbl_data, [colinfo.var for colinfo in column_vars])
+
     # Is the stub to be striped?
     table_stub_striped = data._options.row_striping_include_stub.value
 
     # Are the rows in the table body to be striped?
     table_body_striped = data._options.row_striping_include_table_body.value
 
-    body_rows: list[str] = []
+    body_rows: list[tuple[str, str]] = []
+
+    # Key the rows by their row names, when they're shown in the stub
+    if has_stub_column:
+        rownames = dict(zip(data._stub.row_values("rownum_i"), data._stub.row_values("rowname")))
+    else:
+        rownames = {}
 
     # iterate over rows (ordered by groupings)
     prev_group_info = None
@@ -502,11 +535,11 @@ def create_body_component_h(data: GTData) -> str:
     <th class="gt_group_heading" colspan="{colspan_value}"{group_styles}>{group_label}</th>
   </tr>"""
 
-                body_rows.append(group_row)
+                body_rows.append((f"group:{group_info.group_id}", group_row))
 
         # Create row cells
         for colinfo in column_vars:
-            cell_content: Any = _get_cell(tbl_data, i, colinfo.var)
+            cell_content: Any = body_text[colinfo.var][i]
             cell_str: str = str(cell_content)
 
             # Determine whether the current cell is the stub cell
@@ -519,16 +552,15 @@ def create_body_component_h(data: GTData) -> str:
             # by using the `name` value to obtain the index of the alignment value
             cell_alignment = colinfo.defaulted_align
 
-            # Get the style attributes for the current cell by filtering the
-            # `styles_cells` list for the current row and column
-            _body_styles = [x for x in styles_cells if x.rownum == i and x.colname == colinfo.var]
+            # Get the style attributes for the current cell from the index of body styles
+            _body_styles = body_style_index.get(colinfo.var, {}).get(i, [])
 
             if is_stub_cell:
                 el_name = "th"
 
                 classes = ["gt_row", "gt_left", "gt_stub"]
 
-                _rowname_styles = [x for x in styles_row_label if x.rownum == i]
+                _rowname_styles = row_label_index.get(i, [])
 
                 if table_stub_striped and odd_i_row:
                     classes.append("gt_striped")
@@ -556,13 +588,10 @@ def create_body_component_h(data: GTData) -> str:
 
         prev_group_info = group_info
 
-        body_rows.append("  <tr>\n" + "\n".join(body_cells) + "\n  </tr>")
-
-    all_body_rows = "\n".join(body_rows)
+        row_key = f"row:{rownames[i]}" if has_stub_column else f"row:{i}"
+        body_rows.append((row_key, "  <tr>\n" + "\n".join(body_cells) + "\n  </tr>"))
 
-    return f"""<tbody class="gt_table_body">
-{all_body_rows}
-</tbody>"""
+    return body_rows
 
 
 def create_source_notes_component_h(data: GTData) -> str:
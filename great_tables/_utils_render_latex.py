@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from itertools import chain
-from typing import TYPE_CHECKING
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Iterator, TextIO
 import warnings
 
 import re
-from ._tbl_data import _get_cell, cast_frame_to_string, replace_null_frame
 from .quarto import is_quarto_render
+from ._profile import profile_phase
 from ._spanners import spanners_print_matrix
 from ._utils import heading_has_subtitle, heading_has_title, seq_groups
 from ._utils_render_html import _get_spanners_matrix_height
@@ -25,6 +25,9 @@ LENGTH_TRANSLATIONS_TO_PX = {
     "em": 16.0,
 }
 
+# The number of body rows whose cell text is fetched at a time when writing the body
+BODY_CHUNK_ROWS = 1000
+
 
 def _not_implemented(msg: str) -> None:
     warnings.warn(msg)
@@ -390,38 +393,33 @@ def create_body_component_l(data: GTData) -> str:
         The LaTeX code for the body component of the table.
     """
 
-    _str_orig_data = cast_frame_to_string(data._tbl_data)
-    tbl_data = replace_null_frame(data._body.body, _str_orig_data)
+    return "\n".join(_iter_body_rows_l(data=data))
 
-    # Get the default column vars
-    column_vars = data._boxhead._get_default_columns()
 
-    body_rows = []
+def _iter_body_rows_l(data: GTData, chunk_size: int = BODY_CHUNK_ROWS) -> Iterator[str]:
+    """
+    Generate the LaTeX code for each row of the body, in the order the rows are displayed.
 
-    ordered_index: list[tuple[int, GroupRowInfo | None]] = data._stub.group_indices_map()
+    The text of the body cells (formatted values, or the data values cast to strings) is fetched
+    `chunk_size` rows at a time, so that streaming the rows doesn't hold the text of every cell.
+    """
 
-    for i, _ in ordered_index:
-        body_cells: list[str] = []
+    # Get the default column vars
+    column_vars = [colinfo.var for colinfo in data._boxhead._get_default_columns()]
+
+    ordered_index: list[tuple[int, GroupRowInfo | None]] = data._stub.group_indices_map()
+    row_order = [i for i, _ in ordered_index]
 
-        # Create a body row
-        for colinfo in column_vars:
-            cell_content = _get_cell(tbl_data, i, colinfo.var)
-            cell_str: str = str(cell_content)
+    for start in range(0, len(row_order), chunk_size):
+        rows = row_order[start : start + chunk_size]
 
-            body_cells.append(cell_str)
+        body_text = data._body.text_columns(data._tbl_data, column_vars, rows=rows)
+        columns = [body_text[var] for var in column_vars]
 
         # When joining the body cells together, we need to ensure that each item is separated by
         # an ampersand and that the row is terminated with a double backslash
-        body_cells = " & ".join(body_cells) + " \\\\"
-
-        body_rows.append("".join(body_cells))
-
-    # When joining all the body rows together, we need to ensure that each row is separated by
-    # newline except for the last
-
-    all_body_rows = "\n".join(body_rows)
-
-    return all_body_rows
+        for j in range(len(rows)):
+            yield " & ".join([str(column[j]) for column in columns]) + " \\\\"
 
 
 def create_footer_component_l(data: GTData) -> str:
@@ -563,6 +561,61 @@ def create_wrap_end_l(use_longtable: bool) -> str:
 
 
 def _render_as_latex(data: GTData, use_longtable: bool = False, tbl_pos: str | None = None) -> str:
+    table_head, body_rows, table_tail = _latex_table_parts(
+        data=data, use_longtable=use_longtable, tbl_pos=tbl_pos
+    )
+
+    # Create the body component
+    with profile_phase("latex.body") as phase:
+        body_component = "\n".join(body_rows)
+        phase.output(body_component)
+
+    return table_head + body_component + table_tail
+
+
+def _write_latex(
+    data: GTData,
+    stream: TextIO,
+    use_longtable: bool = False,
+    tbl_pos: str | None = None,
+    chunk_size: int = 1000,
+) -> None:
+    """
+    Write the LaTeX table to a stream, with the body written a chunk of rows at a time.
+
+    The result is the same as writing the output of `_render_as_latex()`, but the body is never
+    held in memory as a whole.
+    """
+
+    table_head, body_rows, table_tail = _latex_table_parts(
+        data=data, use_longtable=use_longtable, tbl_pos=tbl_pos
+    )
+
+    stream.write(table_head)
+
+    with profile_phase("latex.body") as phase:
+        body_rows = iter(body_rows)
+        sep = ""
+
+        while chunk := list(islice(body_rows, chunk_size)):
+            body_chunk = sep + "\n".join(chunk)
+            stream.write(body_chunk)
+            phase.output(body_chunk)
+
+            # rows are separated by newlines, including the rows at either side of a chunk
+            sep = "\n"
+
+    stream.write(table_tail)
+
+
+def _latex_table_parts(
+    data: GTData, use_longtable: bool = False, tbl_pos: str | None = None
+) -> tuple[str, Iterator[str], str]:
+    """
+    Return the LaTeX code before the body rows, the body rows themselves (lazily), and the LaTeX
+    code after the body rows.
+    """
+
     # Check for styles (not yet supported so warn user)
     if data._styles:
         _not_implemented("Styles are not yet supported in LaTeX output.")
@@ -588,16 +641,22 @@ def _render_as_latex(data: GTData, use_longtable: bool = False, tbl_pos: str | N
     table_start = create_table_start_l(data=data, use_longtable=use_longtable)
 
     # Create the heading component
-    heading_component = create_heading_component_l(data=data, use_longtable=use_longtable)
+    with profile_phase("latex.heading") as phase:
+        heading_component = create_heading_component_l(data=data, use_longtable=use_longtable)
+        phase.output(heading_component)
 
     # Create the columns component
-    columns_component = create_columns_component_l(data=data)
+    with profile_phase("latex.column_labels") as phase:
+        columns_component = create_columns_component_l(data=data)
+        phase.output(columns_component)
 
-    # Create the body component
-    body_component = create_body_component_l(data=data)
+    # Create the rows of the body component (generated as they are consumed)
+    body_rows = _iter_body_rows_l(data=data)
 
     # Create the footnotes component
-    footer_component = create_footer_component_l(data=data)
+    with profile_phase("latex.footer") as phase:
+        footer_component = create_footer_component_l(data=data)
+        phase.output(footer_component)
 
     # Create a LaTeX fragment for the ending tabular statement
     table_end = create_table_end_l(use_longtable=use_longtable)
@@ -612,31 +671,29 @@ def _render_as_latex(data: GTData, use_longtable: bool = False, tbl_pos: str | N
     wrap_start_statement = create_wrap_start_l(use_longtable=use_longtable, tbl_pos=tbl_pos)
     wrap_end_statement = create_wrap_end_l(use_longtable=use_longtable)
 
-    # Compose the LaTeX table
+    # Compose the LaTeX table around the body
     if use_longtable:
-        finalized_table = f"""{wrap_start_statement}
+        table_head = f"""{wrap_start_statement}
 {table_width_statement}
 {fontsize_statement}
 {table_start}
 {heading_component}
 {columns_component}
-{body_component}
-{table_end}
-{footer_component}
-{wrap_end_statement}
 """
 
     else:
-        finalized_table = f"""{wrap_start_statement}
+        table_head = f"""{wrap_start_statement}
 {heading_component}
 {table_width_statement}
 {fontsize_statement}
 {table_start}
 {columns_component}
-{body_component}
+"""
+
+    table_tail = f"""
 {table_end}
 {footer_component}
 {wrap_end_statement}
 """
 
-    return finalized_table
+    return table_head, body_rows, table_tail
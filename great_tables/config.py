@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from ._render import IDE_ENV_FLAGS, RenderConfig, RenderEnv, _render_config
+
+__all__ = ("get_config", "set_render_env", "set_render_defaults")
+
+
+def get_config() -> RenderConfig:
+    """Get the global settings for rendering tables.
+
+    Returns
+    -------
+    RenderConfig
+        The object holding the settings. It is shared by the whole process, and is changed with
+        `set_render_env()` and `set_render_defaults()`.
+
+    Examples
+    --------
+    ```{python}
+    from great_tables import config
+
+    config.get_config()
+    ```
+    """
+
+    return _render_config
+
+
+def set_render_env(env: RenderEnv | None) -> None:
+    """Set the environment that tables are rendered in.
+
+    By default, the environment (e.g., Quarto, VS Code or Positron) is detected on every render,
+    from environment variables and from whether an IPython terminal is running. The environment
+    determines the defaults for rendering the HTML of a table in a notebook (e.g., whether it is
+    wrapped in a full HTML page). Setting it skips the detection, which is useful when the
+    detection gets it wrong, or in a server that renders many tables.
+
+    Parameters
+    ----------
+    env
+        One of `"quarto"`, `"databricks"`, `"ipython_terminal"`, `"vscode"`, `"positron"` or
+        `"default"`. Use `None` to go back to detecting the environment.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    ```python
+    from great_tables import config
+
+    config.set_render_env("default")
+    ```
+    """
+
+    if env is not None and env not in IDE_ENV_FLAGS:
+        raise ValueError(
+            f"The render environment must be one of {list(IDE_ENV_FLAGS)} or None, not `{env}`."
+        )
+
+    _render_config.render_env = env
+
+
+def set_render_defaults(
+    make_page: bool | None = None,
+    all_important: bool | None = None,
+    deterministic_ids: bool = False,
+) -> None:
+    """Set the defaults used when tables are rendered as HTML.
+
+    Every call replaces all of the defaults, so calling this function without any arguments
+    restores the original behavior.
+
+    Parameters
+    ----------
+    make_page
+        Should the HTML shown for a table (e.g., in a notebook) be a full HTML page? With `None`,
+        this depends on the render environment.
+    all_important
+        Should the CSS rules shown with a table (e.g., in a notebook) be marked as `!important`?
+        With `None`, this depends on the render environment.
+    deterministic_ids
+        Should tables without an ID get one derived from their content, instead of a random one?
+        This applies to all tables, as if `GT.with_id(deterministic=True)` was used on each. It is
+        useful for caching rendered tables, or for comparing them between runs.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    ```python
+    from great_tables import GT, config, exibble
+
+    config.set_render_defaults(deterministic_ids=True)
+
+    GT(exibble).as_raw_html() == GT(exibble).as_raw_html()
+    ```
+    """
+
+    _render_config.make_page = make_page
+    _render_config.all_important = all_important
+    _render_config.deterministic_ids = deterministic_ids
@@ -8,7 +8,7 @@ from typing_extensions import Self
 from ._body import body_reassemble
 from ._boxhead import cols_align, cols_label
 from ._data_color import data_color
-from ._export import as_latex, as_raw_html, save, show, write_raw_html
+from ._export import as_latex, as_raw_html, save, show, write_latex, write_raw_html
 from ._formats import (
     fmt,
     fmt_bytes,
@@ -30,7 +30,7 @@ from ._formats import (
 )
 from ._gt_data import GTData
 from ._heading import tab_header
-from ._helpers import random_id
+from ._helpers import _content_id, random_id
 from ._modify_rows import row_group_order, tab_stub, with_id, with_locale
 from ._options import (
     opt_align_table_header,
@@ -45,7 +45,8 @@ from ._options import (
     tab_options,
 )
 from ._pipe import pipe
-from ._render import infer_render_env_defaults
+from ._profile import profile_phase
+from ._render import _render_config, infer_render_env_defaults
 from ._render_checks import _render_check
 from ._source_notes import tab_source_note
 from ._spanners import (
@@ -63,6 +64,7 @@ from ._substitution import sub_missing, sub_zero
 from ._tab_create_modify import tab_style
 from ._tbl_data import _get_cell, n_rows
 from ._utils import _migrate_unformatted_to_output
+from ._utils_nanoplots import _hoist_nanoplot_defs
 from ._utils_render_html import (
     _get_table_defs,
     create_body_component_h,
@@ -102,7 +104,12 @@ class GT(
     Parameters
     ----------
     data
-        A DataFrame object.
+        A DataFrame object. A Polars `LazyFrame` or a DuckDB relation can also be used. The query
+        is then kept, and each render only collects the columns that the table shows or formats
+        (as a Polars DataFrame), so that the engine can skip reading the others. Methods that need
+        all of the data, such as `data_color()`, `fmt_nanoplot()` or selecting rows with an
+        expression, collect the whole query instead (once). Without Polars, a DuckDB relation is
+        collected as a Pandas DataFrame when the table is created.
     rowname_col
         The column name in the input `data=` table to use as row labels to be placed in the table
         stub.
@@ -111,11 +118,14 @@ class GT(
         groups.
     auto_align
         Optionally have column data be aligned depending on the content contained in each column of
-        the input `data=`.
+        the input `data=`. For very large tables, an integer can be given instead of `True`, in
+        which case only that many values from the top of each text column are checked when
+        deciding whether its values are all number-like (and so right-aligned).
     id
         By default (with `None`) the table ID will be a random, ten-letter string as generated
         through internal use of the `random_id()` function. A custom table ID can be used here by
-        providing a string.
+        providing a string. To get an ID that is derived from the table's content (and so doesn't
+        change between renders), use `GT.with_id(deterministic=True)`.
     locale
         An optional locale identifier that can be set as the default locale for all functions that
         take a `locale` argument. Examples include `"en"` for English (United States) and `"fr"`
@@ -206,7 +216,7 @@ class GT(
         data: Any,
         rowname_col: str | None = None,
         groupname_col: str | None = None,
-        auto_align: bool = True,
+        auto_align: bool | int = True,
         id: str | None = None,
         locale: str | None = None,
     ):
@@ -278,6 +288,7 @@ class GT(
     as_raw_html = as_raw_html
     write_raw_html = write_raw_html
     as_latex = as_latex
+    write_latex = write_latex
 
     pipe = pipe
 
@@ -304,26 +315,34 @@ class GT(
         new_body = self._body.copy()
 
         # TODO: this body method performs a mutation. Should we make a copy of body?
-        new_body.render_formats(self._tbl_data, self._formats, context)
-        new_body.render_formats(self._tbl_data, self._substitutions, context)
+        with profile_phase("build.formats"):
+            new_body.render_formats(self._tbl_data, self._formats, context)
+        with profile_phase("build.substitutions"):
+            new_body.render_formats(self._tbl_data, self._substitutions, context)
         return self._replace(_body=new_body)
 
     def _build_data(self, context: str) -> Self:
         # Build the body of the table by generating a dictionary
         # of lists with cells initially set to nan values
-        built = self._render_formats(context)
+        # For a table created from a lazy query, collect the columns it uses
+        data = self._collect_source()
+
+        built = data._render_formats(context)
 
         if context == "latex":
-            built = _migrate_unformatted_to_output(
-                data=built, data_tbl=self._tbl_data, formats=self._formats, context=context
-            )
+            with profile_phase("build.migrate_unformatted"):
+                built = _migrate_unformatted_to_output(
+                    data=built, data_tbl=data._tbl_data, formats=self._formats, context=context
+                )
 
         # built._perform_col_merge()
-        final_body = body_reassemble(built._body)
+        with profile_phase("build.body_reassemble"):
+            final_body = body_reassemble(built._body)
 
         # Reordering of the metadata elements of the table
 
-        final_stub = reorder_stub_df(built._stub)
+        with profile_phase("build.reorder_stub"):
+            final_stub = reorder_stub_df(built._stub)
         # self = self.reorder_footnotes()
         # self = self.reorder_styles()
 
@@ -352,15 +371,71 @@ class GT(
         self,
         make_page: bool = False,
         all_important: bool = False,
+        shared_css: bool = False,
     ) -> str:
+        html, _ = self._render_as_html_with_id(
+            make_page=make_page, all_important=all_important, shared_css=shared_css
+        )
+        return html
+
+    def _get_table_id(self, html_table: str) -> str:
+        """Return the ID for the rendered table.
+
+        A table ID set by the user is always used. Otherwise, the ID is either random or (when
+        requested for this table, or for all tables through `config.set_render_defaults()`)
+        derived from the table's markup and options, so that it doesn't change between renders
+        of the same table.
+        """
+
+        # Obtain the `table_id` value from the Options (might be set, might be None)
+        table_id = self._options.table_id.value
+
+        if table_id is not None:
+            return table_id
+
+        if self._options.table_id_deterministic.value or _render_config.deterministic_ids:
+            return _content_id(html_table, repr(self._options))
+
+        return random_id()
+
+    def _render_as_html_with_id(
+        self,
+        make_page: bool = False,
+        all_important: bool = False,
+        shared_css: bool = False,
+        body_component: str | None = None,
+    ) -> tuple[str, str]:
         # TODO: better to put these checks in a pre render hook?
         _render_check(self)
 
-        heading_component = create_heading_component_h(data=self)
-        column_labels_component = create_columns_component_h(data=self)
-        body_component = create_body_component_h(data=self)
-        source_notes_component = create_source_notes_component_h(data=self)
-        footnotes_component = create_footnotes_component_h(data=self)
+        with profile_phase("html.heading") as phase:
+            heading_component = create_heading_component_h(data=self)
+            phase.output(heading_component)
+        with profile_phase("html.column_labels") as phase:
+            column_labels_component = create_columns_component_h(data=self)
+            phase.output(column_labels_component)
+        with profile_phase("html.body") as phase:
+            # The body may have been rendered ahead of time (e.g., by the Shiny integration,
+            # which keeps the individual rows to diff them between renders)
+            if body_component is None:
+                body_component = create_body_component_h(data=self)
+            phase.output(body_component)
+        with profile_phase("html.source_notes") as phase:
+            source_notes_component = create_source_notes_component_h(data=self)
+            phase.output(source_notes_component)
+        with profile_phase("html.footnotes") as phase:
+            footnotes_component = create_footnotes_component_h(data=self)
+            phase.output(footnotes_component)
+
+        # Optionally place the SVG definitions and styles of all nanoplots in the body once, ahead
+        # of the table
+        if self._options.nanoplot_shared_defs.value:
+            body_component, nanoplot_defs = _hoist_nanoplot_defs(body_component)
+        else:
+            nanoplot_defs = ""
+
+        if nanoplot_defs:
+            nanoplot_defs = f"{nanoplot_defs}\n"
 
         # Get attributes for the table
         table_defs = _get_table_defs(data=self)
@@ -392,18 +467,32 @@ class GT(
 </table>
 """
 
-        # Obtain the `table_id` value from the Options (might be set, might be None)
-        table_id = self._options.table_id.value
-
-        if table_id is None:
-            id = random_id()
-        else:
-            id = table_id
+        id = self._get_table_id(html_table)
 
         # Compile the SCSS as CSS
-        from ._scss import compile_scss
+        from ._scss import (
+            SHARED_CSS_CLASS,
+            compile_css_overrides,
+            compile_css_vars,
+            compile_scss,
+            compile_shared_css,
+        )
 
-        css = compile_scss(data=self, id=id, all_important=all_important)
+        with profile_phase("html.css") as phase:
+            if shared_css:
+                # The bulk of the CSS is expected to be on the page already (see `shared_css()`),
+                # so only the options that differ from their defaults are included with the table
+                # (as CSS custom properties on the container)
+                css = compile_css_overrides(data=self, id=id)
+                css_vars = compile_css_vars(data=self)
+                container_class = f' class="{SHARED_CSS_CLASS}"'
+            else:
+                css = compile_scss(data=self, id=id, all_important=all_important)
+                css_vars = ""
+                container_class = ""
+            phase.output(css)
+
+        style_block = f"<style>\n{css}\n</style>\n" if css else ""
 
         # Obtain options set for overflow and container dimensions
 
@@ -414,27 +503,32 @@ class GT(
         container_width = self._options.container_width.value
         container_height = self._options.container_height.value
 
-        finalized_table = f"""<div id="{id}" style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};">
-<style>
-{css}
-</style>
-{html_table}
+        finalized_table = f"""<div id="{id}"{container_class} style="padding-left:{container_padding_x};padding-right:{container_padding_x};padding-top:{container_padding_y};padding-bottom:{container_padding_y};overflow-x:{container_overflow_x};overflow-y:{container_overflow_y};width:{container_width};height:{container_height};{css_vars}">
+{style_block}{nanoplot_defs}{html_table}
 </div>
         """
 
         if make_page:
+            # With shared CSS, the page needs to carry the shared stylesheet in its head
+            if shared_css:
+                shared_style = (
+                    f"<style>\n{compile_shared_css(all_important=all_important)}\n</style>\n"
+                )
+            else:
+                shared_style = ""
+
             # Create an HTML page and place the table within it
             finalized_table = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8"/>
-</head>
+{shared_style}</head>
 <body>
 {finalized_table}
 </body>
 </html>
             """
-        return finalized_table
+        return finalized_table, id
 
 
 # =============================================================================
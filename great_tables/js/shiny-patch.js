@@ -0,0 +1,29 @@
+// Applies the row-level updates sent by `render_gt(patch=True)` (see great_tables/shiny.py).
+//
+// A patch lists the new rows of the table body in order. Each entry is either the HTML of a new
+// (or changed) row, or a [start, stop) range of rows currently in the body that are kept as is.
+Shiny.addCustomMessageHandler("great_tables_patch", function (message) {
+  var output = document.getElementById(message.id);
+  var tbody = output && output.querySelector("tbody.gt_table_body");
+
+  if (!tbody) {
+    return;
+  }
+
+  var oldRows = Array.prototype.slice.call(tbody.children);
+  var fragment = document.createDocumentFragment();
+  var template = document.createElement("template");
+
+  message.rows.forEach(function (row) {
+    if (typeof row === "string") {
+      template.innerHTML = row;
+      fragment.appendChild(template.content.firstElementChild);
+    } else {
+      for (var ii = row[0]; ii < row[1]; ii++) {
+        fragment.appendChild(oldRows[ii]);
+      }
+    }
+  });
+
+  tbody.replaceChildren(fragment);
+});
@@ -1,4 +1,4 @@
-import os
+from ._render import infer_render_env
 
 
 def is_quarto_render() -> bool:
@@ -7,7 +7,8 @@ def is_quarto_render() -> bool:
 
     This environment variable check is used to determine if there is currently a Quarto
     render occurring. This is useful for determining if certain rendering options should be
-    enabled or disabled for this specific environment.
+    enabled or disabled for this specific environment. A render environment set through
+    `config.set_render_env()` takes precedence over the check.
     """
 
-    return "QUARTO_BIN_PATH" in os.environ
+    return infer_render_env() == "quarto"
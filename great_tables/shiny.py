@@ -5,8 +5,20 @@ __all__ = (
     "render_gt",
 )
 
+import asyncio
+import hashlib
+import pickle
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from weakref import WeakKeyDictionary
+
+from . import __version__
+from ._render import infer_render_env_defaults
+from ._utils_render_html import _tbody, create_body_rows_h
 from .gt import GT
-from htmltools import Tag, div, HTML
+from htmltools import HTML, HTMLDependency, Tag, TagList, div
 
 try:
     from shiny.render.transformer import (
@@ -16,6 +28,8 @@ try:
         resolve_value_fn,
     )
     from shiny._namespaces import resolve_id
+    from shiny.reactive import get_current_context
+    from shiny.types import SilentCancelOutputException
 except ImportError:
     raise ImportError(
         "The great_tables.shiny module requires the shiny package to be installed."
@@ -23,11 +37,14 @@ except ImportError:
         "\n\n    pip install shiny"
     )
 
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Any, Callable, overload
 
 if TYPE_CHECKING:
     from shiny.session._utils import RenderedDeps
 
+# The number of rendered tables kept for each output, when caching is enabled
+_HTML_CACHE_SIZE = 8
+
 
 def output_gt(id: str, placeholder: bool = False) -> Tag:
     """Output UI for a great_tables table."""
@@ -35,18 +52,266 @@ def output_gt(id: str, placeholder: bool = False) -> Tag:
 
 
 @output_transformer(default_ui=output_gt)
-async def GtTransformer(_meta: TransformerMetadata, _fn: ValueFn[GT | None]) -> RenderedDeps | None:
+async def GtTransformer(
+    _meta: TransformerMetadata,
+    _fn: ValueFn[GT | None],
+    *,
+    executor: Executor | None = None,
+    cache: bool = False,
+    patch: bool = False,
+) -> RenderedDeps | None:
+    session = _meta.session
+
+    if patch:
+        # Whatever the client shows is unknown if this render fails, so the state of the last
+        # render is only put back once this one succeeds
+        patch_states = _session_store(_patch_states, session)
+        previous = patch_states.pop(_meta.name, None)
+
     value = await resolve_value_fn(_fn)
     if value is None:
         return None
-    elif isinstance(value, GT):
-        return _meta.session._process_ui(HTML(value._repr_html_()))
+    elif not isinstance(value, GT):
+        raise TypeError(f"Expected a great_tables.GT object, got {type(value)}")
+
+    if patch:
+        render = partial(_render_table_parts, default_id=f"{session.ns(_meta.name)}_table")
+    else:
+        render = _render_html
+
+    html_cache = _get_html_cache(session, _meta.name) if cache else None
+
+    if html_cache is not None:
+        cache_key = html_cache.key(value)
+        rendered = html_cache.get(cache_key, value)
+    else:
+        rendered = None
+
+    if rendered is None:
+        if executor is None:
+            rendered = render(value)
+        else:
+            rendered = await _render_in_executor(value, executor, render)
+
+        if html_cache is not None:
+            html_cache.put(cache_key, value, rendered)
+
+    if not patch:
+        return session._process_ui(HTML(rendered))
+
+    patch_states[_meta.name] = rendered
+
+    rows = _diff_body_rows(previous, rendered) if previous is not None else None
+
+    if rows is None:
+        return session._process_ui(TagList(_patch_dependency(), HTML(rendered.html)))
+
+    if rows != [[0, len(previous.rows)]] or len(rendered.rows) != len(previous.rows):
+        await session.send_custom_message(
+            "great_tables_patch", {"id": session.ns(_meta.name), "rows": rows}
+        )
+
+    # the client updates the table from the patch, so leave the output as it is
+    raise SilentCancelOutputException()
+
+
+def _render_html(value: GT) -> str:
+    # a module-level function, so that it can be sent to a process pool
+    return value._repr_html_()
+
+
+async def _render_in_executor(
+    value: GT, executor: Executor, render: Callable[[GT], Any] | None = None
+) -> Any:
+    """Render a table in an executor, without blocking the event loop.
+
+    If the output is invalidated (e.g., because an input changed) while the table is rendering,
+    the output will render again, so the render is cancelled if it hasn't started yet and its
+    result is discarded otherwise.
+    """
+
+    if render is None:
+        render = _render_html
+
+    future = executor.submit(render, value)
+
+    stale = False
+
+    def cancel() -> None:
+        nonlocal stale
+        stale = True
+        future.cancel()
+
+    try:
+        get_current_context().on_invalidate(cancel)
+    except RuntimeError:
+        # rendering outside of a reactive context, so there's nothing to go stale
+        pass
+
+    try:
+        rendered = await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        if not stale:
+            raise
+        rendered = None
+
+    if stale:
+        # leave the output as it is until the new render finishes
+        raise SilentCancelOutputException()
+
+    return rendered
+
+
+@dataclass(frozen=True)
+class _TableParts:
+    """A rendered table, along with the keyed rows of its body.
+
+    The `frame` is the HTML of the table without its body rows. It is `None` when the rows can't
+    be separated from the rest of the table (e.g., when nanoplot definitions are moved out of the
+    body), in which case the table is always rendered in full.
+    """
+
+    html: str
+    frame: str | None
+    keys: list[str]
+    rows: list[str]
+
+
+# Stands in for the body rows in the frame of a table
+_BODY_PLACEHOLDER = "\x00"
+
+
+def _render_table_parts(value: GT, default_id: str) -> _TableParts:
+    # A fixed id keeps the table's CSS (which is scoped to the id) the same between renders
+    if value._options.table_id.value is None:
+        value = value.with_id(default_id)
+
+    built = value._build_data(context="html")
+
+    keyed_rows = create_body_rows_h(built)
+    keys = [key for key, _ in keyed_rows]
+    rows = [row for _, row in keyed_rows]
+
+    body_component = _tbody(rows)
+
+    html, _ = built._render_as_html_with_id(
+        all_important=infer_render_env_defaults()["all_important"],
+        body_component=body_component,
+    )
+
+    frame_parts = html.split(body_component)
+    frame = _BODY_PLACEHOLDER.join(frame_parts) if len(frame_parts) == 2 else None
+
+    return _TableParts(html=html, frame=frame, keys=keys, rows=rows)
+
+
+def _diff_body_rows(previous: _TableParts, current: _TableParts) -> list[Any] | None:
+    """Return the patch that turns the body rows of `previous` into those of `current`.
+
+    Each entry of the patch is either the HTML of a new or changed row, or a `[start, stop]`
+    range of rows of `previous` that are kept as they are. `None` is returned when the table
+    has to be rendered in full: when anything outside the body changed (including the CSS), or
+    when the row keys aren't unique.
+    """
+
+    if previous.frame is None or previous.frame != current.frame:
+        return None
+
+    previous_index = {key: ii for ii, key in enumerate(previous.keys)}
+
+    if len(previous_index) != len(previous.keys) or len(set(current.keys)) != len(current.keys):
+        return None
+
+    patch: list[Any] = []
+
+    for key, row in zip(current.keys, current.rows):
+        ii = previous_index.get(key)
+
+        if ii is None or previous.rows[ii] != row:
+            patch.append(row)
+        elif patch and isinstance(patch[-1], list) and patch[-1][1] == ii:
+            patch[-1][1] = ii + 1
+        else:
+            patch.append([ii, ii + 1])
+
+    return patch
+
+
+def _patch_dependency() -> HTMLDependency:
+    return HTMLDependency(
+        name="great-tables-shiny-patch",
+        version=__version__,
+        source={"package": "great_tables", "subdir": "js"},
+        script={"src": "shiny-patch.js"},
+    )
+
+
+class _HtmlCache:
+    """The HTML of the most recently rendered tables of an output.
 
-    raise TypeError(f"Expected a great_tables.GT object, got {type(value)}")
+    Tables are keyed by their content (a hash of the pickled `GT` object), so that an equal table
+    that was built again (e.g., by a render function without a `reactive.calc`) reuses the HTML.
+    Equal tables whose data is laid out differently in memory may hash differently, which only
+    means that they're rendered again. Tables that can't be pickled (e.g., ones formatted with a
+    lambda) are keyed by identity instead, which is enough because `GT` objects are never modified
+    in place. The tables themselves are kept, so that their ids can't be reused by other objects.
+    """
+
+    def __init__(self, size: int = _HTML_CACHE_SIZE):
+        self.size = size
+        self._entries: OrderedDict[str | int, tuple[GT, Any]] = OrderedDict()
+
+    def key(self, value: GT) -> str | int:
+        # a table that is returned again is found without hashing it
+        for key, (table, _) in self._entries.items():
+            if table is value:
+                return key
+
+        try:
+            content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return id(value)
+
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, key: str | int, value: GT) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None or (isinstance(key, int) and entry[0] is not value):
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str | int, value: GT, html: Any) -> None:
+        self._entries[key] = (value, html)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+
+# The caches and patch states of each session, which are dropped along with the session
+_html_caches: WeakKeyDictionary[Any, dict[str, _HtmlCache]] = WeakKeyDictionary()
+_patch_states: WeakKeyDictionary[Any, dict[str, _TableParts]] = WeakKeyDictionary()
+
+
+def _session_store(stores: WeakKeyDictionary[Any, dict[str, Any]], session: Any) -> dict[str, Any]:
+    return stores.setdefault(session, {})
+
+
+def _get_html_cache(session: Any, name: str) -> _HtmlCache:
+    session_caches = _session_store(_html_caches, session)
+
+    if name not in session_caches:
+        session_caches[name] = _HtmlCache()
+
+    return session_caches[name]
 
 
 @overload
-def render_gt() -> GtTransformer.OutputRendererDecorator: ...
+def render_gt(
+    *, executor: Executor | None = None, cache: bool = False, patch: bool = False
+) -> GtTransformer.OutputRendererDecorator: ...
 
 
 @overload
@@ -55,7 +320,33 @@ def render_gt(_fn: GtTransformer.ValueFn) -> GtTransformer.OutputRenderer: ...
 
 def render_gt(
     _fn: GtTransformer.ValueFn | None = None,
+    *,
+    executor: Executor | None = None,
+    cache: bool = False,
+    patch: bool = False,
 ) -> GtTransformer.OutputRenderer | GtTransformer.OutputRendererDecorator:
-    """Render a great_tables table."""
+    """Render a great_tables table.
+
+    By default, tables are rendered on the event loop, which blocks all other sessions of the app
+    while a large table renders. Pass an `executor=` (e.g., a
+    `concurrent.futures.ThreadPoolExecutor` or `ProcessPoolExecutor`) to render tables there
+    instead. A process pool needs the tables to be picklable, so any functions passed to `fmt()`
+    and the like must be defined at the top level of a module. If the inputs of the output change
+    while a table is rendering in the executor, the render is cancelled (or, if it already
+    started, its result is discarded) in favor of the new one.
+
+    Use `cache=True` to reuse the rendered HTML when the render function returns the same table
+    again, either the same `GT` object (e.g., one returned by a `reactive.calc` whose inputs
+    haven't changed) or one with the same content. The HTML of the most recent tables is cached
+    for each output of each session.
+
+    Use `patch=True` for tables that are updated often, such as live dashboards. The first render
+    sends the whole table. After that, as long as only the body of the table changed, only the
+    rows that were added or changed are sent, and the browser updates the table in place. Anything
+    else (e.g., a new column, title or option, which changes the CSS) sends the whole table again.
+    Rows are matched between renders by their row names (from `rowname_col=`), or by their
+    position when the table has no stub. When the table doesn't set an `id=`, one based on the
+    output's id is used, so that the CSS stays the same between renders.
+    """
 
-    return GtTransformer(_fn)
+    return GtTransformer(_fn, GtTransformer.params(executor=executor, cache=cache, patch=patch))
@@ -1,8 +1,13 @@
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
+
+import great_tables._formats_vals
+from great_tables import GT, vals
+from great_tables._formats import make_fmt_number_fn
 from great_tables._formats_vals import _make_one_col_table
-from great_tables._tbl_data import to_list
+from great_tables._tbl_data import Agnostic, to_list
 
 
 @pytest.mark.parametrize("src", [1, [1], (1,), pd.Series([1]), pl.Series([1])])
@@ -10,3 +15,82 @@ def test_roundtrip(src):
     gt = _make_one_col_table(src)
 
     assert to_list(gt._tbl_data["x"]) == [1]
+
+
+@pytest.fixture
+def no_table(monkeypatch: pytest.MonkeyPatch):
+    def raise_table(vals):
+        raise AssertionError("A table should not be created.")
+
+    monkeypatch.setattr(great_tables._formats_vals, "_make_one_col_table", raise_table)
+
+
+@pytest.mark.parametrize(
+    "src", [1234.5, [1234.5], (1234.5,), pd.Series([1234.5]), pl.Series([1234.5])]
+)
+def test_format_values_without_table(no_table, src):
+    assert vals.fmt_number(src) == ["1,234.50"]
+
+
+def test_format_values_locale_without_table(no_table):
+    assert vals.fmt_currency([1234.5], currency="EUR", locale="de") == ["&#8364;1.234,50"]
+
+
+def test_format_values_missing_uses_table():
+    # missing values are passed through by formatters, and displayed as they would be in a table
+    assert vals.fmt_number([1.5, None]) == ["1.50", "<NA>"]
+    assert vals.fmt_number(pl.Series([1.5, None])) == ["1.50", "None"]
+
+
+def test_format_values_list_coerced_like_column():
+    # a column of ints and floats is a column of floats
+    assert vals.fmt_markdown([1.5, -2, 0]) == ["1.5", "-2.0", "0.0"]
+
+
+@pytest.mark.parametrize(
+    "src, expected",
+    [
+        ([1.5, -2, 0], ["1.5", "-2.0", "0.0"]),
+        ([1, 2], ["1", "2"]),
+        ([True, 1.5], ["True", "1.5"]),
+        ([1.5, 2**70], ["1.5", str(2**70)]),
+        (["a", 1], ["a", "1"]),
+    ],
+)
+def test_format_values_scalars_without_frame(monkeypatch: pytest.MonkeyPatch, src, expected):
+    def raise_frame(ser, name):
+        raise AssertionError("A DataFrame should not be created.")
+
+    monkeypatch.setattr(great_tables._formats_vals, "to_frame", raise_frame)
+
+    assert vals.fmt_markdown(src) == expected
+
+
+def test_format_values_ndarray():
+    assert vals.fmt_markdown(np.array([1.0, 2.5])) == ["1.0", "2.5"]
+    assert vals.fmt_number(np.array([1.0, 2.5]), decimals=1) == ["1.0", "2.5"]
+    assert vals.fmt_number(np.array(3.0)) == ["3.00"]
+
+
+def test_make_fmt_fn_matches_method():
+    fmt_fn = make_fmt_number_fn(
+        Agnostic(),
+        decimals=1,
+        n_sigfig=None,
+        drop_trailing_zeros=False,
+        drop_trailing_dec_mark=True,
+        use_seps=True,
+        accounting=False,
+        scale_by=1,
+        compact=False,
+        pattern="{x}",
+        sep_mark=",",
+        dec_mark=".",
+        force_sign=False,
+        locale=None,
+    )
+
+    gt = GT(pl.DataFrame({"x": [-2.0]})).fmt_number("x", decimals=1)
+
+    assert fmt_fn(-2.0, context="html") == gt._formats[0].func.html(-2.0)
+    assert fmt_fn(-2.0, context="latex") == gt._formats[0].func.latex(-2.0)
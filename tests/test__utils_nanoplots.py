@@ -9,6 +9,7 @@ from decimal import Decimal
 from great_tables._utils_nanoplots import (
     _flatten_list,
     _format_number_compactly,
+    _format_numbers_compactly,
     _generate_nanoplot,
     _generate_ref_line_from_keyword,
     _get_extreme_value,
@@ -346,6 +347,39 @@ def test_format_number_compactly_currency(num: float, currency: Union[str, None]
     assert res == dst
 
 
+@pytest.mark.parametrize("currency", [None, "USD"])
+@pytest.mark.parametrize("as_integer", [False, True])
+def test_format_numbers_compactly_matches_single_values(
+    currency: Union[str, None], as_integer: bool
+):
+    vals = [1.243234e-10, 0.074234, 0, 1, 23.34, -642.34, 1002.62, 56256.99345, 838238.123]
+    vals += [9237442.4, 8923749826567834, np.nan, None, 7, -42, 56256]
+
+    res = _format_numbers_compactly(vals=vals, currency=currency, as_integer=as_integer)
+
+    assert res == [
+        _format_number_compactly(val=val, currency=currency, as_integer=as_integer) for val in vals
+    ]
+
+
+def test_format_numbers_compactly_fn():
+    res = _format_numbers_compactly(vals=[1, 2.5], fn=lambda x: f"<{x}>")
+
+    assert res == ["<1>", "<2.5>"]
+
+
+def test_format_numbers_compactly_fn_raises_non_str():
+    with pytest.raises(ValueError, match="single string value"):
+        _format_numbers_compactly(vals=[1, 2], fn=lambda x: x)
+
+
+def test_normalize_vals_missing():
+    res = _normalize_vals([1, None, 3, np.nan, 5])
+
+    assert res[0::2] == [0.0, 0.5, 1.0]
+    assert np.isnan(res[1]) and np.isnan(res[3])
+
+
 @pytest.mark.parametrize(
     "num,dst",
     [
@@ -2061,3 +2095,33 @@ def test_noerror_list_of_strings() -> None:
             show_data_area=False,
         ),
     )
+
+
+@pytest.mark.parametrize(
+    "case", [case for case in CASES if isinstance(case["y_vals"], list)], ids=repr
+)
+def test_nanoplot_array_vals_match_lists(case: dict[str, Any]):
+    arr_case = {
+        **case,
+        **{k: np.array(case[k]) for k in ["y_vals", "x_vals"] if k in case},
+    }
+
+    assert _generate_nanoplot(**arr_case) == _generate_nanoplot(**case)
+
+
+def test_nanoplot_int_array_vals_match_lists():
+    y_vals = [-5, 6, -2, 0, 2, 14]
+
+    for plot_type in ["line", "bar"]:
+        res = _generate_nanoplot(y_vals=np.array(y_vals), y_ref_line="median", plot_type=plot_type)
+        dst = _generate_nanoplot(y_vals=y_vals, y_ref_line="median", plot_type=plot_type)
+
+        assert res == dst
+
+
+def test_normalize_vals_array():
+    res = _normalize_vals(np.array([1.0, np.nan, 3.0, 5.0]))
+
+    assert isinstance(res, np.ndarray)
+    assert res[[0, 2, 3]].tolist() == [0.0, 0.5, 1.0]
+    assert np.isnan(res[1])
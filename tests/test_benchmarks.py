@@ -0,0 +1,127 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def bench_run(monkeypatch):
+    # benchmarks isn't an installed package, so import it from the root of the repository, and
+    # register the imported modules with monkeypatch so they're dropped from sys.modules afterwards
+    names = ("benchmarks", "benchmarks.cases", "benchmarks.run")
+
+    monkeypatch.syspath_prepend(str(REPO_DIR))
+    for name in names:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = importlib.import_module("benchmarks.run")
+
+    for name in names:
+        monkeypatch.setitem(sys.modules, name, sys.modules.pop(name))
+
+    return module
+
+
+def _result(bench_run, case="construct", min=0.1, peak_bytes=1_000):
+    return bench_run.BenchResult(
+        case=case,
+        backend="polars",
+        rows=1_000,
+        cols=10,
+        min=min,
+        median=min,
+        peak_bytes=peak_bytes,
+    )
+
+
+def _compare(bench_run, results, baseline, min_seconds=0.05):
+    return bench_run.compare(
+        results, baseline, max_ratio=1.25, max_memory_ratio=1.25, min_seconds=min_seconds
+    )
+
+
+def test_compare_no_regressions(bench_run):
+    baseline = [_result(bench_run)]
+    results = [_result(bench_run, min=0.12, peak_bytes=1_200)]
+
+    assert _compare(bench_run, results, baseline) == []
+
+
+def test_compare_slowdown(bench_run):
+    baseline = [_result(bench_run, min=0.1)]
+    results = [_result(bench_run, min=0.2)]
+
+    (msg,) = _compare(bench_run, results, baseline)
+
+    assert msg.startswith("construct[polars, 1000x10]: time")
+    assert "(2.00x)" in msg
+
+
+def test_compare_memory_growth(bench_run):
+    baseline = [_result(bench_run, peak_bytes=1_000)]
+    results = [_result(bench_run, peak_bytes=2_000)]
+
+    (msg,) = _compare(bench_run, results, baseline)
+
+    assert msg.startswith("construct[polars, 1000x10]: peak memory")
+    assert "(2.00x)" in msg
+
+
+def test_compare_missing_case(bench_run):
+    baseline = [_result(bench_run), _result(bench_run, case="as_latex")]
+    results = [_result(bench_run), _result(bench_run, case="new_case")]
+
+    assert _compare(bench_run, results, baseline) == [
+        "as_latex[polars, 1000x10]: missing from the results"
+    ]
+
+
+def test_compare_min_seconds(bench_run):
+    baseline = [_result(bench_run, min=0.01)]
+    results = [_result(bench_run, min=0.04)]
+
+    assert _compare(bench_run, results, baseline, min_seconds=0.05) == []
+    assert len(_compare(bench_run, results, baseline, min_seconds=0.005)) == 1
+
+
+def test_run_reports_failures(bench_run, monkeypatch):
+    def case_broken(df):
+        raise ValueError("boom")
+
+    monkeypatch.setitem(bench_run.CASES, "broken", case_broken)
+
+    results, failures = bench_run.run(
+        ["construct", "broken"], ["polars"], rows=[10], cols=[1], repeat=1, memory=False
+    )
+
+    assert [res.case for res in results] == ["construct"]
+    assert failures == ["broken[polars, 10x1]: failed: ValueError: boom"]
+
+
+def test_best_of(bench_run):
+    first = [_result(bench_run, min=0.2, peak_bytes=1_000)]
+    second = [_result(bench_run, min=0.1, peak_bytes=2_000)]
+
+    (res,) = bench_run.best_of(first, second)
+
+    assert res.min == 0.1
+    assert res.peak_bytes == 1_000
+
+
+def test_main_exit_status(bench_run, monkeypatch, tmp_path):
+    def case_broken(df):
+        raise ValueError("boom")
+
+    monkeypatch.setitem(bench_run.CASES, "broken", case_broken)
+
+    args = ["--backends", "polars", "--rows", "10", "--cols", "1", "--repeat", "1", "--no-memory"]
+    baseline = str(tmp_path / "baseline.json")
+
+    assert bench_run.main(["--cases", "construct,as_latex", "--save", baseline, *args]) == 0
+
+    # as_latex is in the baseline, but not selected, so it isn't expected in the results
+    assert bench_run.main(["--cases", "construct", "--compare", baseline, *args]) == 0
+    assert bench_run.main(["--cases", "construct,broken", "--compare", baseline, *args]) == 1
@@ -8,3 +8,53 @@ from pandas.testing import assert_frame_equal
 df = pd.DataFrame(
     {"col1": [1, 2, 3, 4], "col2": ["b", "a", "b", "a"], "col3": [4.0, 5.0, 6.0, 7.0]}
 )
+
+
+def test_body_from_empty_is_all_missing():
+    body = Body.from_empty(df)
+
+    assert body._columns == {}
+    assert_frame_equal(
+        body.body, pd.DataFrame(pd.NA, index=df.index, columns=df.columns, dtype="string")
+    )
+
+
+def test_body_set_cell_only_creates_that_column():
+    body = Body.from_empty(df)
+    body.set_cell(1, "col2", "x")
+
+    assert list(body._columns) == ["col2"]
+    assert body.body["col2"].tolist() == [pd.NA, "x", pd.NA, pd.NA]
+    assert body.body["col1"].isna().all()
+
+
+def test_body_text_columns():
+    body = Body.from_empty(df)
+    body.set_cell(0, "col1", "one")
+    body.set_cell(1, "col1", float("nan"))
+
+    text = body.text_columns(df, ["col1", "col3"])
+
+    assert text == {"col1": ["one", "2", "3", "4"], "col3": ["4.0", "5.0", "6.0", "7.0"]}
+
+
+def test_body_copy_is_independent():
+    body = Body.from_empty(df)
+    body.set_cell(0, "col1", "a")
+
+    new_body = body.copy()
+    new_body.set_cell(0, "col1", "b")
+
+    assert body._columns["col1"][0] == "a"
+    assert new_body._columns["col1"][0] == "b"
+    assert new_body._data is body._data
+
+
+def test_body_reassemble():
+    body = Body.from_empty(df)
+    body.set_cell(2, "col3", "x")
+
+    new_body = body_reassemble(body)
+
+    assert new_body is not body
+    assert new_body._columns == body._columns
@@ -0,0 +1,77 @@
+import os
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from great_tables import GT, config, exibble
+from great_tables._render import infer_render_env, infer_render_env_defaults
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    yield
+    config.set_render_env(None)
+    config.set_render_defaults()
+
+
+@mock.patch.dict(os.environ, {"QUARTO_BIN_PATH": "1"}, clear=True)
+def test_set_render_env():
+    config.set_render_env("positron")
+
+    assert infer_render_env() == "positron"
+    assert config.get_config().render_env == "positron"
+
+    config.set_render_env(None)
+
+    assert infer_render_env() == "quarto"
+
+
+def test_set_render_env_raises():
+    with pytest.raises(ValueError):
+        config.set_render_env("jupyter")
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_infer_render_env_ipython_terminal(monkeypatch: pytest.MonkeyPatch):
+    class TerminalInteractiveShell:
+        pass
+
+    fake_ipython = ModuleType("IPython")
+    fake_ipython.get_ipython = lambda: TerminalInteractiveShell()
+    monkeypatch.setitem(sys.modules, "IPython", fake_ipython)
+
+    assert infer_render_env() == "ipython_terminal"
+
+    monkeypatch.setattr(fake_ipython, "get_ipython", lambda: SimpleNamespace())
+
+    assert infer_render_env() == "default"
+
+
+@mock.patch.dict(os.environ, {}, clear=True)
+def test_infer_render_env_without_ipython(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delitem(sys.modules, "IPython", raising=False)
+
+    assert infer_render_env() == "default"
+
+
+def test_set_render_defaults():
+    config.set_render_env("vscode")
+    config.set_render_defaults(make_page=True)
+
+    assert infer_render_env_defaults() == {"make_page": True, "all_important": True}
+    assert GT(exibble)._repr_html_().startswith("<!DOCTYPE html>")
+
+    config.set_render_defaults()
+
+    assert infer_render_env_defaults() == {"make_page": False, "all_important": True}
+
+
+def test_set_render_defaults_deterministic_ids():
+    assert GT(exibble).as_raw_html() != GT(exibble).as_raw_html()
+
+    config.set_render_defaults(deterministic_ids=True)
+
+    assert GT(exibble).as_raw_html() == GT(exibble).as_raw_html()
+    assert 'id="my_id"' in GT(exibble, id="my_id").as_raw_html()
@@ -8,7 +8,7 @@ import requests
 from ipykernel.zmqshell import ZMQInteractiveShell
 from IPython.terminal.interactiveshell import InteractiveShell, TerminalInteractiveShell
 
-from great_tables import GT, exibble, md
+from great_tables import GT, exibble, md, shared_css
 from great_tables._export import _create_temp_file_server, _infer_render_target, as_raw_html
 from great_tables.data import gtcars
 
@@ -61,6 +61,46 @@ def test_html_string_generated_all_important(gt_tbl_small: GT):
     assert "!important;" in gt_tbl_small.as_raw_html(inline_css=True, all_important=True)
 
 
+def test_html_string_deterministic_id():
+    gt_tbl = GT(exibble[["num", "char"]].head(2)).with_id(deterministic=True)
+
+    html = gt_tbl.as_raw_html()
+
+    assert html == gt_tbl.as_raw_html()
+    assert gt_tbl.as_raw_html(inline_css=True) == gt_tbl.as_raw_html(inline_css=True)
+
+    # different content gives a different id
+    assert html.split('"')[1] != gt_tbl.fmt_number(columns="num").as_raw_html().split('"')[1]
+
+
+def test_html_string_random_id_differs():
+    gt_tbl = GT(exibble[["num", "char"]].head(2))
+
+    assert gt_tbl.as_raw_html() != gt_tbl.as_raw_html()
+
+
+def test_html_string_shared_css(gt_tbl_small: GT):
+    html = gt_tbl_small.as_raw_html(shared_css=True)
+
+    assert '<div id="test_table_small" class="gt_container"' in html
+    assert "<style>" not in html
+
+    html_opts = gt_tbl_small.tab_options(heading_align="left").as_raw_html(shared_css=True)
+    assert 'height:auto;--gt-heading-align:left;">' in html_opts
+    assert "<style>" not in html_opts
+
+
+def test_html_string_shared_css_make_page(gt_tbl_small: GT):
+    html = gt_tbl_small.as_raw_html(shared_css=True, make_page=True)
+
+    assert f"<style>\n{shared_css()}\n</style>\n</head>" in html
+
+
+def test_html_string_shared_css_inline_css_raises(gt_tbl_small: GT):
+    with pytest.raises(ValueError):
+        gt_tbl_small.as_raw_html(shared_css=True, inline_css=True)
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="chrome might not be installed.")
 @pytest.mark.extra
 def test_save_image_file(gt_tbl: GT, tmp_path):
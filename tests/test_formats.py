@@ -155,7 +155,7 @@ def test_format_row_selection(expr):
 
     res = gt.fmt(lambda x: x, columns=[], rows=expr)
     assert len(res._formats) == 1
-    assert res._formats[0].cells.rows == [1, 2]
+    assert list(res._formats[0].cells.rows) == [1, 2]
 
 
 @pytest.mark.parametrize(
@@ -1,7 +1,11 @@
+import re
 from typing import Any
 
+import numpy as np
 import polars as pl
+import pyarrow as pa
 import pytest
+from great_tables import GT
 from great_tables._formats import _generate_data_vals, _process_number_stream
 
 
@@ -18,7 +22,28 @@ from great_tables._formats import _generate_data_vals, _process_number_stream
     ],
 )
 def test_generate_data_vals(src: Any):
-    assert _generate_data_vals(src) == [1, 2, 3]
+    assert list(_generate_data_vals(src)) == [1, 2, 3]
+
+
+def test_generate_data_vals_series_is_array_view():
+    ser = pl.DataFrame({"x": [[1.5, 2.5, 3.5]]})["x"][0]
+    res = _generate_data_vals(ser)
+
+    assert isinstance(res, np.ndarray)
+    assert res.tolist() == [1.5, 2.5, 3.5]
+    assert not res.flags.owndata
+
+
+def test_generate_data_vals_series_with_nulls_is_list():
+    assert _generate_data_vals(pl.Series([1, None, 3])) == [1, None, 3]
+    assert _generate_data_vals(pl.Series([1.5, None])) == [1.5, None]
+
+
+def test_generate_data_vals_numpy_array():
+    res = _generate_data_vals(np.array([1, 2, 3]))
+
+    assert isinstance(res, np.ndarray)
+    assert res.tolist() == [1, 2, 3]
 
 
 @pytest.mark.xfail
@@ -74,3 +99,98 @@ def test_nanoplot_ref_line_area():
 def test_process_number_stream(src: str, dst: list[float]):
     res = _process_number_stream(data_vals=src)
     assert res == dst
+
+
+def _get_svgs(html: str) -> list[str]:
+    return re.findall(r"<svg.*?</svg>", html, flags=re.DOTALL)
+
+
+@pytest.mark.parametrize("autoscale", [False, True])
+@pytest.mark.parametrize("plot_type", ["line", "bar"])
+def test_fmt_nanoplot_list_column_matches_number_stream(autoscale: bool, plot_type: str):
+    df = pl.DataFrame(
+        {
+            "lst": [[1.5, -2.0, 3.25], [10.0, 20.5, 5.0], [0.5]],
+            "str": ["1.5 -2 3.25", "10 20.5 5", "0.5"],
+        }
+    )
+
+    def render(column: str) -> list[str]:
+        gt = GT(df).fmt_nanoplot(column, plot_type=plot_type, autoscale=autoscale)
+        return _get_svgs(gt.with_id("id").as_raw_html())
+
+    res = render("lst")
+
+    assert len(res) == 3
+    assert res == render("str")
+
+
+def test_fmt_nanoplot_autoscale_list_column_with_nulls():
+    df = pl.DataFrame({"x": [[1, None, 3], [4, 5]], "y": [[1, 2, 3], [4, 5]]})
+
+    res = _get_svgs(GT(df).fmt_nanoplot("x", autoscale=True).with_id("id").as_raw_html())
+    dst = _get_svgs(GT(df).fmt_nanoplot("y", autoscale=True).with_id("id").as_raw_html())
+
+    # Both use a y-axis range of 1 to 5 (with integer labels)
+    assert res[1] == dst[1]
+
+
+def test_fmt_nanoplot_shared_defs():
+    df = pl.DataFrame({"x": [[1, 2, 3], [4, 5, 1], [2, 2, 8]]})
+    gt = GT(df).fmt_nanoplot("x").with_id("id")
+
+    html = gt.as_raw_html()
+    html_shared = gt.tab_options(nanoplot_shared_defs=True).as_raw_html()
+
+    assert html.count("<defs>") == 3
+    assert html.count("<style>") == 4
+
+    # A single hidden SVG carries the (identical) defs and styles ahead of the table
+    assert html_shared.count("<defs>") == 1
+    assert html_shared.count("<style>") == 2
+    assert html_shared.index('<svg aria-hidden="true"') < html_shared.index("<table")
+
+    # The plots themselves are otherwise unchanged
+    svgs = [re.sub(r"<defs>.*?</defs><style>.*?</style>", "", svg) for svg in _get_svgs(html)]
+    assert _get_svgs(html_shared)[1:] == svgs
+
+
+def test_fmt_nanoplot_shared_defs_keeps_distinct_blocks_in_order():
+    from great_tables import nanoplot_options
+
+    df = pl.DataFrame({"x": [[1, 2, 3]], "y": [[3, 2, 1]]})
+    gt = (
+        GT(df)
+        .fmt_nanoplot("x", options=nanoplot_options(data_area_fill_color="blue"))
+        .fmt_nanoplot("y", options=nanoplot_options(vertical_guide_stroke_color="green"))
+        .tab_options(nanoplot_shared_defs=True)
+    )
+
+    html = gt.as_raw_html()
+    shared_svg = _get_svgs(html)[0]
+
+    assert shared_svg.count("<defs>") == 2
+    assert shared_svg.count("<style>") == 2
+    assert shared_svg.index('stroke="blue"') < shared_svg.index('stroke="#FF0000"')
+    assert shared_svg.index("fill: #911EB4") < shared_svg.index("fill: green")
+
+
+def test_fmt_nanoplot_shared_defs_no_nanoplots():
+    df = pl.DataFrame({"x": [1, 2]})
+
+    html = GT(df).tab_options(nanoplot_shared_defs=True).as_raw_html()
+
+    assert "<svg" not in html
+
+
+def test_fmt_nanoplot_pyarrow_list_column_matches_polars():
+    vals = [[1.5, -2.0, 3.25], [10.0, 20.5, 5.0]]
+    pa_df = pa.table({"x": pa.array(vals, pa.list_(pa.float64()))})
+
+    res = _get_svgs(GT(pa_df).fmt_nanoplot("x", autoscale=True).with_id("id").as_raw_html())
+    dst = _get_svgs(
+        GT(pl.DataFrame({"x": vals})).fmt_nanoplot("x", autoscale=True).with_id("id").as_raw_html()
+    )
+
+    assert len(res) == 2
+    assert res == dst
@@ -1,6 +1,8 @@
+import pickle
+
 import pandas as pd
 import pytest
-from great_tables import GT
+from great_tables import GT, exibble, loc, style
 
 
 # Generate a gt Table object for assertion testing
@@ -37,7 +39,7 @@ def test_gt_object_prerender(gt_tbl: GT):
     assert type(gt_tbl._heading).__name__ == "Heading"
     assert isinstance(gt_tbl._source_notes, list)
     assert isinstance(gt_tbl._footnotes, list)
-    assert isinstance(gt_tbl._styles, list)
+    assert type(gt_tbl._styles).__name__ == "PersistentList"
     assert type(gt_tbl._locale).__name__ == "Locale"
 
 
@@ -64,3 +66,14 @@ def test_gt_table_render(gt_tbl: GT):
         ).__name__
         == "str"
     )
+
+
+def test_gt_pickle_round_trip():
+    gt_tbl = (
+        GT(exibble, rowname_col="row", groupname_col="group", id="test")
+        .fmt_number(columns="num")
+        .tab_spanner("spanner", ["num", "char"])
+        .tab_style(style.fill("red"), loc.body(columns="num", rows=[0]))
+    )
+
+    assert pickle.loads(pickle.dumps(gt_tbl)).as_raw_html() == gt_tbl.as_raw_html()
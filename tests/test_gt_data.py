@@ -1,5 +1,16 @@
 import pandas as pd
-from great_tables._gt_data import Boxhead, ColInfo, RowInfo, Stub
+import pytest
+from great_tables import GT
+from great_tables._gt_data import (
+    Boxhead,
+    CellRectangle,
+    ColInfo,
+    GroupRowInfo,
+    GroupRows,
+    PersistentList,
+    RowInfo,
+    Stub,
+)
 
 
 def test_stub_construct_df():
@@ -35,8 +46,157 @@ def test_stub_order_groups():
     assert indice_labels == [(3, "c"), (1, "a"), (0, "b"), (2, "b")]
 
 
+def test_stub_row_values():
+    stub = Stub.from_data(
+        pd.DataFrame({"g": ["b", "a", "b"], "r": ["x", "y", "z"]}),
+        rowname_col="r",
+        groupname_col="g",
+    )
+
+    assert stub.row_values("rownum_i") == [0, 1, 2]
+    assert stub.row_values("rowname") == ["x", "y", "z"]
+    assert stub.row_values("group_id") == ["b", "a", "b"]
+    assert stub[-1] == RowInfo(2, "b", "z")
+    assert (
+        list(stub)
+        == stub.rows
+        == [RowInfo(0, "b", "x"), RowInfo(1, "a", "y"), RowInfo(2, "b", "z")]
+    )
+
+
+def test_stub_reorder_rows():
+    stub = Stub.from_data(pd.DataFrame({"r": ["x", "y", "z"]}), rowname_col="r")
+    new_stub = stub.reorder_rows([2, 0, 1])
+
+    assert new_stub.row_values("rowname") == ["z", "x", "y"]
+    assert new_stub.row_values("rownum_i") == [2, 0, 1]
+    assert stub.row_values("rowname") == ["x", "y", "z"]
+
+
+def test_stub_rowname_sequence_values():
+    stub = Stub.from_data(pd.DataFrame({"r": [(1, 2), (3, 4)]}), rowname_col="r")
+
+    assert stub.row_values("rowname") == [(1, 2), (3, 4)]
+
+
+def test_group_rows_group_table():
+    group_rows = GroupRows([GroupRowInfo("a", indices=[1, 3]), GroupRowInfo("b", indices=[0, 2])])
+
+    assert group_rows.row_order(4).tolist() == [1, 3, 0, 2]
+    assert group_rows.offsets().tolist() == [0, 2, 4]
+
+    indices_map = group_rows.indices_map(4)
+    assert [(ii, info.group_id) for ii, info in indices_map] == [
+        (1, "a"),
+        (3, "a"),
+        (0, "b"),
+        (2, "b"),
+    ]
+    assert group_rows.indices_map(4) is indices_map
+
+
+def test_group_rows_no_groups():
+    group_rows = GroupRows([])
+
+    assert group_rows.row_order(3).tolist() == [0, 1, 2]
+    assert group_rows.indices_map(3) == [(0, None), (1, None), (2, None)]
+
+
+def test_boxhead_align_from_data():
+    df = pd.DataFrame(
+        {
+            "num_str": pd.Series(["1", "2-3", None], dtype=object),
+            "str": pd.Series(["1", "a", None], dtype=object),
+            "int": [1, 2, 3],
+            "bool": [True, False, True],
+        }
+    )
+    boxh = Boxhead(df).align_from_data(df)
+
+    assert [col.column_align for col in boxh] == ["right", "left", "right", "center"]
+
+
+def test_boxhead_align_from_data_sample_size():
+    df = pd.DataFrame({"x": pd.Series(["1", "2", "a"], dtype=object)})
+
+    assert Boxhead(df).align_from_data(df)[0].column_align == "left"
+    assert Boxhead(df).align_from_data(df, sample_size=2)[0].column_align == "right"
+
+
+def test_gt_auto_align_sample_size():
+    df = pd.DataFrame({"x": pd.Series(["1", "2", "a"], dtype=object)})
+
+    assert GT(df)._boxhead[0].column_align == "left"
+    assert GT(df, auto_align=2)._boxhead[0].column_align == "right"
+    assert GT(df, auto_align=3)._boxhead[0].column_align == "left"
+
+
 def test_boxhead_reorder():
     boxh = Boxhead([ColInfo("a"), ColInfo("b"), ColInfo("c")])
     new_boxh = boxh.reorder(["b", "a", "c"])
 
     assert new_boxh == Boxhead([ColInfo("b"), ColInfo("a"), ColInfo("c")])
+
+
+def test_persistent_list_append_shares_storage():
+    a = PersistentList([1, 2])
+    b = a + [3]
+    c = b + [4, 5]
+
+    assert list(a) == [1, 2]
+    assert list(b) == [1, 2, 3]
+    assert list(c) == [1, 2, 3, 4, 5]
+
+    # appending to the most recent version extends the same underlying list
+    assert a._shared is c._shared
+
+
+def test_persistent_list_append_to_old_version():
+    a = PersistentList([1])
+    b = a + [2]
+    c = a + [99]
+
+    assert list(b) == [1, 2]
+    assert list(c) == [1, 99]
+    assert b._shared is not c._shared
+
+
+def test_persistent_list_sequence_methods():
+    a = PersistentList(["x", "y", "z"]) + ["w"]
+    b = a + ["v"]
+
+    assert len(a) == 4
+    assert a[0] == "x"
+    assert a[-1] == "w"
+    assert a[1:3] == ["y", "z"]
+    assert a == ["x", "y", "z", "w"]
+    assert a == PersistentList(["x", "y", "z", "w"])
+    assert a != b
+
+    with pytest.raises(IndexError):
+        a[4]
+
+    assert not PersistentList()
+
+
+def test_cell_rectangle_resolve():
+    cells = CellRectangle(["a", "b"], range(2))
+
+    assert len(cells) == 4
+    assert cells.resolve() == [("a", 0), ("a", 1), ("b", 0), ("b", 1)]
+    assert list(cells.iter_columns()) == [("a", range(2)), ("b", range(2))]
+
+
+@pytest.mark.parametrize("rows", [range(1, 4), [1, 2, 3], [3, 1, 2]])
+def test_cell_rectangle_row_mask(rows):
+    cells = CellRectangle(["a", "b"], rows)
+
+    assert cells.row_mask(5).tolist() == [False, True, True, True, False]
+
+    col_masks = list(cells.iter_column_masks(5))
+    assert [col for col, _ in col_masks] == ["a", "b"]
+    assert all(mask.tolist() == [False, True, True, True, False] for _, mask in col_masks)
+
+
+def test_cell_rectangle_row_mask_empty():
+    assert not CellRectangle(["a"], []).row_mask(3).any()
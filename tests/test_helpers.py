@@ -4,6 +4,7 @@ from great_tables._helpers import (
     pct,
     px,
     random_id,
+    _content_id,
     google_font,
     _get_font_stack,
     define_units,
@@ -59,6 +60,15 @@ def test_random_id():
     assert len(random_id(5)) == 5
 
 
+def test_content_id():
+    cid = _content_id("<table></table>", "options")
+    assert len(cid) == 10
+    assert not set(cid).difference(letters())
+    assert cid == _content_id("<table></table>", "options")
+    assert cid != _content_id("<table></table>", "other options")
+    assert len(_content_id("x", n=50)) == 50
+
+
 def test_lowercases():
     lowercases = letters()
     assert isinstance(lowercases, list)
@@ -1,11 +1,11 @@
+import numpy as np
 import pandas as pd
 import polars as pl
 import polars.selectors as cs
 import pytest
 from great_tables import GT
-from great_tables._gt_data import Spanners
+from great_tables._gt_data import CellRectangle, Spanners
 from great_tables._locations import (
-    CellPos,
     LocBody,
     LocColumnLabels,
     LocSpannerLabels,
@@ -15,7 +15,9 @@ from great_tables._locations import (
     LocTitle,
     resolve,
     resolve_cols_i,
+    resolve_mask,
     resolve_rows_i,
+    resolve_rows_pos,
     resolve_vector_i,
     set_style,
 )
@@ -121,6 +123,54 @@ def test_resolve_rows_i_raises(bad_expr):
     assert "a callable that takes a DataFrame and returns a boolean Series" in expected
 
 
+@pytest.mark.parametrize(
+    "expr, resolved",
+    [
+        (None, [0, 1, 2]),
+        (["c", "a"], [0, 2]),
+        (pl.col("x").is_in(["a", "c"]), [0, 2]),
+        ([0, -1], [0, 2]),
+    ],
+)
+def test_resolve_rows_pos(expr, resolved):
+    gt = GT(pl.DataFrame({"x": ["a", "b", "c"]}), rowname_col="x")
+    res = resolve_rows_pos(gt, expr)
+
+    assert isinstance(res, (range, np.ndarray))
+    assert list(res) == resolved
+
+
+def test_resolve_rows_pos_everything_is_range():
+    gt = GT(pl.DataFrame({"x": ["a", "b", "c"]}), rowname_col="x")
+    assert resolve_rows_pos(gt) == range(3)
+
+
+def test_resolve_rows_pos_nothing():
+    gt = GT(pl.DataFrame({"x": ["a", "b", "c"]}), rowname_col="x")
+    assert resolve_rows_pos(gt, null_means="nothing") == []
+
+
+def test_resolve_rows_i_polars_expr_no_match():
+    gt = GT(pl.DataFrame({"x": ["a", "b", "c"]}), rowname_col="x")
+    assert resolve_rows_i(gt, pl.col("x") == "z") == []
+
+
+def test_resolve_mask_column_arrays():
+    df = pl.DataFrame({"a": [1, 5, 3], "b": [4, 2, None], "c": ["x", "y", "z"]})
+    gt = GT(df)
+
+    res = resolve_mask(gt, cs.numeric().gt(2))
+
+    assert [name for name, _ in res] == ["a", "b"]
+    assert all(isinstance(rows, np.ndarray) for _, rows in res)
+    assert [rows.tolist() for _, rows in res] == [[1, 2], [0]]
+
+
+def test_resolve_mask_no_match():
+    gt = GT(pl.DataFrame({"a": [1, 2], "b": [3, 4]}))
+    assert resolve_mask(gt, cs.numeric().gt(10)) == []
+
+
 # Resolve Loc tests --------------------------------------------------------------------------------
 
 
@@ -131,13 +181,19 @@ def test_resolve_loc_body():
 
     assert isinstance(cells, list)
     assert len(cells) == 1
-    assert isinstance(cells[0], CellPos)
+    assert isinstance(cells[0], CellRectangle)
 
-    pos = cells[0]
+    assert cells[0].resolve() == [("x", 1)]
 
-    assert pos.column == 0
-    assert pos.row == 1
-    assert pos.colname == "x"
+
+def test_resolve_loc_body_mask():
+    gt = GT(pl.DataFrame({"x": [1, 5, 3], "y": [4, 2, 0]}))
+
+    cells = resolve(LocBody(mask=cs.numeric().gt(2)), gt)
+
+    assert all(isinstance(rect, CellRectangle) for rect in cells)
+    assert [rect.cols for rect in cells] == [["x"], ["y"]]
+    assert [rect.rows.tolist() for rect in cells] == [[1, 2], [0]]
 
 
 @pytest.mark.xfail
@@ -285,6 +341,34 @@ def test_set_style_loc_body_from_column(expr):
     assert cell_info.styles[0].color == "blue"
 
 
+def test_set_style_loc_body_shared_by_cells():
+    gt_df = GT(pl.DataFrame({"x": [1, 2], "y": [3, 4]}))
+    style = CellStyleText(color="red")
+
+    new_gt = set_style(LocBody(["x", "y"]), gt_df, [style])
+
+    # 1 style info, for every cell in the rectangle
+    (cell_info,) = new_gt._styles
+
+    assert cell_info.styles == [style]
+    assert cell_info.cells.cols == ["x", "y"]
+    assert list(cell_info.cells.rows) == [0, 1]
+
+
+def test_set_style_loc_body_from_column_per_row():
+    df = pl.DataFrame({"x": [1, 2], "y": [3, 4], "color": ["red", "blue"]})
+    style = CellStyleText(color=FromColumn("color"))
+
+    new_gt = set_style(LocBody(["x", "y"]), GT(df), [style])
+
+    # 1 style info per row, with the color from that row
+    assert [info.cells.resolve() for info in new_gt._styles] == [
+        [("x", 0), ("y", 0)],
+        [("x", 1), ("y", 1)],
+    ]
+    assert [info.styles[0].color for info in new_gt._styles] == ["red", "blue"]
+
+
 def test_set_style_loc_title_from_column_error(snapshot):
     df = pd.DataFrame({"x": [1, 2], "color": ["red", "blue"]})
     gt_df = GT(df)
@@ -38,8 +38,8 @@ def test_with_groupname_col_undo_spanner_style():
     )
 
     assert gt._spanners[0].vars == SPAN_COLS
-    assert len(gt._styles) == 2
-    assert {style.colname for style in gt._styles} == set(STYLE_COLS)
+    assert len(gt._styles) == 1
+    assert gt._styles[0].cells.cols == STYLE_COLS
 
     new_gt = gt.tab_stub(groupname_col="g")
 
@@ -49,7 +49,7 @@ def test_with_groupname_col_undo_spanner_style():
 
     # grouping col dropped from body styles
     assert len(new_gt._styles) == 1
-    assert new_gt._styles[0].colname == "y"
+    assert new_gt._styles[0].cells.cols == ["y"]
 
 
 def test_with_groupname_col_unset():
@@ -93,8 +93,8 @@ def test_with_rowname_col_undo_spanner_style():
     )
 
     assert gt._spanners[0].vars == SPAN_COLS
-    assert len(gt._styles) == 2
-    assert {style.colname for style in gt._styles} == set(STYLE_COLS)
+    assert len(gt._styles) == 1
+    assert gt._styles[0].cells.cols == STYLE_COLS
 
     new_gt = gt.tab_stub(rowname_col="g")
 
@@ -103,7 +103,8 @@ def test_with_rowname_col_undo_spanner_style():
     assert new_gt._spanners[0].vars == ["x"]
 
     # rowname col *kept* in body styles
-    assert len(new_gt._styles) == 2
+    assert len(new_gt._styles) == 1
+    assert new_gt._styles[0].cells.cols == STYLE_COLS
 
 
 def test_with_rowname_col_unset():
@@ -167,3 +168,12 @@ def test_with_id_preserves_other_options():
     new_gt = gt.with_id("zzz")
     assert new_gt._options.table_id.value == "zzz"
     assert new_gt._options.container_width.value == "20px"
+
+
+def test_with_id_deterministic():
+    gt = GT(pd.DataFrame({"x": [1]})).with_id(deterministic=True)
+
+    assert gt._options.table_id.value is None
+    assert gt._options.table_id_deterministic.value is True
+
+    assert gt.with_id("zzz")._options.table_id_deterministic.value is False
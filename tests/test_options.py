@@ -30,6 +30,58 @@ def test_options_no_mutate():
     assert gt3._options.container_width.value == "999px"
 
 
+def test_options_store_only_overrides():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+
+    assert vars(gt._options) == {}
+
+    gt2 = gt.tab_options(container_width="100px", heading_align="left")
+    assert set(vars(gt2._options)) == {"container_width", "heading_align"}
+
+    # setting an option back to its default value drops the override
+    gt3 = gt2.tab_options(heading_align="center")
+    assert set(vars(gt3._options)) == {"container_width"}
+    assert gt3._options == gt.tab_options(container_width="100px")._options
+
+
+def test_options_all_options():
+    options = GT(pd.DataFrame({"x": [1]})).tab_options(heading_align="left")._options
+
+    all_options = options._get_all_options()
+
+    assert list(all_options)[:2] == ["table_id", "table_id_deterministic"]
+    assert all_options["heading_align"].value == "left"
+    assert all_options["table_width"].value == "auto"
+
+
+def test_options_immutable():
+    from dataclasses import FrozenInstanceError
+
+    options = GT(pd.DataFrame({"x": [1]}))._options
+
+    with pytest.raises(FrozenInstanceError):
+        options.heading_align = None
+
+
+def test_options_copy_pickle():
+    import copy
+    import pickle
+
+    options = GT(pd.DataFrame({"x": [1]})).tab_options(heading_align="left")._options
+
+    assert copy.copy(options) == options
+    assert copy.deepcopy(options) == options
+    assert pickle.loads(pickle.dumps(options)) == options
+
+
+def test_options_scss_params_cached():
+    gt = GT(pd.DataFrame({"x": [1]})).tab_options(heading_align="left")
+
+    compile_scss(gt, id="abc")
+
+    assert gt._options._cache["scss_params"]["heading_align"] == "left"
+
+
 # Include shared variables for `tab_options()`
 css_length_val_large = "100px"
 css_length_val_margin = "10px"
@@ -0,0 +1,188 @@
+import asyncio
+import polars as pl
+import pytest
+import tracemalloc
+from functools import partial
+
+from great_tables import GT, profile_render
+from great_tables._profile import (
+    MemoryBudgetWarning,
+    RenderProfile,
+    current_profile,
+    formatter_name,
+    profile_phase,
+)
+
+
+def test_profile_render_records_html_phases():
+    gt = GT(pl.DataFrame({"x": [1.0, 2.0, None]})).fmt_number("x").sub_missing()
+
+    with profile_render() as profile:
+        html = gt.as_raw_html()
+
+    assert current_profile() is None
+
+    phases = profile.phases
+    assert list(phases)[:2] == ["build.formats", "build.substitutions"]
+    assert {"html.column_labels", "html.body", "html.css"} <= set(phases)
+    assert all(phase.calls == 1 for phase in phases.values())
+    assert 0 < phases["html.body"].n_bytes < len(html.encode())
+
+
+def test_profile_render_records_formatter_cells():
+    gt = GT(pl.DataFrame({"x": [1.0, 2.0, 3.0], "y": [4.0, 5.0, 6.0]})).fmt_number(
+        ["x", "y"], rows=[0, 1]
+    )
+
+    with profile_render() as profile:
+        gt.as_raw_html()
+        gt.as_raw_html()
+
+    (formatter,) = profile.formatters.values()
+    assert formatter.name == "fmt_number_context"
+    assert formatter.calls == 2
+    assert formatter.cells == 8
+
+
+def test_profile_render_latex_phases():
+    gt = GT(pl.DataFrame({"x": [1.0, 2.0]}))
+
+    with profile_render() as profile:
+        gt.as_latex()
+
+    assert {"build.migrate_unformatted", "latex.body"} <= set(profile.phases)
+    assert not any(name.startswith("html.") for name in profile.phases)
+
+
+def test_profile_render_hook():
+    profiles = []
+
+    with profile_render(hook=profiles.append) as profile:
+        GT(pl.DataFrame({"x": [1]})).as_raw_html()
+
+    assert profiles == [profile]
+
+
+def test_profile_render_hook_called_on_error():
+    profiles = []
+
+    with pytest.raises(ValueError):
+        with profile_render(hook=profiles.append) as profile:
+            GT(pl.DataFrame({"x": [1]})).as_raw_html()
+            raise ValueError()
+
+    assert profiles == [profile]
+    assert "html.body" in profile.phases
+
+
+def test_render_profile_to_dict_and_report():
+    profile = RenderProfile()
+    profile.record_phase("html.body", 0.5, n_bytes=10)
+    profile.record_phase("html.body", 0.25, n_bytes=5)
+    profile.record_formatter("fmt_number_context", cells=3, seconds=0.1)
+
+    assert profile.to_dict() == {
+        "total_seconds": 0.75,
+        "phases": [
+            {
+                "name": "html.body",
+                "calls": 2,
+                "seconds": 0.75,
+                "n_bytes": 15,
+                "peak_bytes": 0,
+                "retained_bytes": 0,
+            }
+        ],
+        "formatters": [
+            {
+                "name": "fmt_number_context",
+                "calls": 1,
+                "cells": 3,
+                "seconds": 0.1,
+                "peak_bytes": 0,
+                "retained_bytes": 0,
+            },
+        ],
+    }
+    assert "html.body" in profile.report()
+    assert "fmt_number_context" in profile.report()
+
+
+def test_formatter_name_unwraps_partial():
+    def fmt_x(x, y):
+        return x
+
+    assert formatter_name(partial(partial(fmt_x, y=1))) == "fmt_x"
+    assert formatter_name(lambda x: x) == "<lambda>"
+
+
+def test_profile_render_memory():
+    gt = GT(pl.DataFrame({"x": [1.0, 2.0, 3.0]})).fmt_number("x")
+
+    assert not tracemalloc.is_tracing()
+
+    with profile_render(memory=True) as profile:
+        assert tracemalloc.is_tracing()
+        gt.as_raw_html()
+
+    assert not tracemalloc.is_tracing()
+
+    formats = profile.phases["build.formats"]
+    formatter = profile.formatters["fmt_number_context"]
+
+    assert formatter.peak_bytes > 0
+    # the formatter ran within the formats phase, so the phase's peak can't be lower
+    assert formats.peak_bytes >= formatter.peak_bytes
+    assert "retained" in profile.report()
+
+
+def test_profile_render_no_memory_by_default():
+    with profile_render() as profile:
+        GT(pl.DataFrame({"x": [1.0]})).fmt_number("x").as_raw_html()
+
+    assert all(phase.peak_bytes == 0 for phase in profile.phases.values())
+    assert "retained" not in profile.report()
+
+
+def test_profile_render_memory_budget():
+    gt = GT(pl.DataFrame({"x": [1.0, 2.0, 3.0]})).fmt_number("x")
+
+    with pytest.warns(MemoryBudgetWarning, match="exceeds the memory budget of 1 bytes"):
+        with profile_render(memory_budget=1) as profile:
+            gt.as_raw_html()
+
+    assert profile.memory
+    assert "build.formats" in profile.over_budget()
+    assert "fmt_number_context" in profile.over_budget()
+
+
+def test_profile_render_memory_concurrent_tasks():
+    n_bytes = 1_000_000
+
+    async def task_a():
+        with profile_phase("a"):
+            buffer = bytearray(n_bytes)  # noqa: F841
+            await asyncio.sleep(0)
+
+    async def task_b():
+        # starts after task_a, and ends after it
+        with profile_phase("b"):
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(task_a(), task_b())
+
+    with profile_render(memory=True) as profile:
+        asyncio.run(main())
+
+    # each task ends its own measurement, even though the phases interleave
+    assert profile.phases["a"].peak_bytes >= n_bytes
+    assert profile.phases["b"].peak_bytes < n_bytes
+
+
+def test_render_profile_over_budget_without_budget():
+    profile = RenderProfile()
+    profile.record_phase("html.body", 0.1, peak_bytes=100)
+
+    assert profile.over_budget() == []
@@ -2,7 +2,15 @@ import pytest
 import pandas as pd
 
 from great_tables import GT
-from great_tables._scss import font_color, css_add, compile_scss
+from great_tables._scss import (
+    font_color,
+    css_add,
+    compile_scss,
+    compile_shared_css,
+    compile_css_overrides,
+    compile_css_vars,
+    SCSS_TEMPLATE_PARAMS,
+)
 
 
 @pytest.mark.parametrize(
@@ -53,3 +61,66 @@ def test_scss_default_generated(snapshot):
     gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
 
     assert snapshot == compile_scss(gt, id="abc", compress=False)
+
+
+def test_shared_css_default_generated(snapshot):
+    assert snapshot == compile_shared_css(compress=False)
+
+
+def test_shared_css_uses_custom_properties():
+    css = compile_shared_css()
+
+    assert "$" not in css
+    assert "#" not in css.split(".gt_container {")[0]
+    assert "--gt-heading-background-color: #FFFFFF;" in css
+    assert "background-color: var(--gt-heading-background-color);" in css
+    assert ".gt_container .gt_heading" in css
+
+
+def test_shared_css_all_important():
+    css = compile_shared_css(all_important=True)
+
+    assert "var(--gt-heading-align) !important;" in css
+    # custom property declarations are left as is, so that tables can override them
+    assert "--gt-heading-align: center;" in css
+
+
+def test_scss_template_params():
+    assert SCSS_TEMPLATE_PARAMS[:2] == ["table_margin_left", "table_margin_right"]
+    assert len(SCSS_TEMPLATE_PARAMS) == len(set(SCSS_TEMPLATE_PARAMS))
+
+
+def test_css_vars_and_overrides_default_options_empty():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]}))
+
+    assert compile_css_vars(gt) == ""
+    assert compile_css_overrides(gt, id="abc") == ""
+
+
+def test_css_vars_changed_options():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]})).tab_options(heading_align="left")
+
+    assert compile_css_vars(gt) == "--gt-heading-align:left;"
+
+
+def test_css_vars_derived_params():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]})).tab_options(
+        heading_background_color="black", heading_padding="10px"
+    )
+
+    css_vars = compile_css_vars(gt)
+
+    assert "--gt-font-color-heading-background-color:#FFFFFF;" in css_vars
+    assert "--gt-heading-subtitle-padding-top:9px;" in css_vars
+    assert "--gt-heading-padding-bottom:11px;" in css_vars
+
+
+def test_css_overrides_changed_options():
+    gt = GT(pd.DataFrame({"x": [1, 2, 3]})).tab_options(
+        table_font_names="Arial",
+        table_additional_css=[".gt_table { color: red; }"],
+    )
+
+    css = compile_css_overrides(gt, id="abc")
+
+    assert css == "#abc table { font-family: Arial; }\n.gt_table { color: red; }"
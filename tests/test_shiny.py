@@ -1,5 +1,177 @@
-from great_tables.shiny import output_gt, render_gt
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-# TODO: this module currently just imports the shiny submodule
-# so the tests will fail if it's not importable. We should add
-# tests for render_gt, and output_gt
+import polars as pl
+import pytest
+from shiny.reactive import Context
+from shiny.types import SilentCancelOutputException
+
+from great_tables import GT, exibble
+import great_tables.shiny
+from great_tables.shiny import (
+    _diff_body_rows,
+    _HtmlCache,
+    _render_in_executor,
+    _render_table_parts,
+    _TableParts,
+    render_gt,
+)
+
+# TODO: add tests for render_gt, and output_gt running in a shiny session
+
+
+def test_html_cache_keyed_by_content():
+    cache = _HtmlCache()
+    gt = GT(pl.DataFrame({"x": [1.5]})).fmt_number("x")
+
+    assert cache.get(cache.key(gt), gt) is None
+
+    cache.put(cache.key(gt), gt, "<table></table>")
+
+    assert cache.get(cache.key(gt), gt) == "<table></table>"
+
+    # an equal table built again is found, a different one isn't
+    gt_equal = GT(pl.DataFrame({"x": [1.5]})).fmt_number("x")
+    gt_other = GT(pl.DataFrame({"x": [1.5]})).fmt_number("x", decimals=1)
+
+    assert cache.get(cache.key(gt_equal), gt_equal) == "<table></table>"
+    assert cache.get(cache.key(gt_other), gt_other) is None
+
+
+def test_html_cache_unpicklable_keyed_by_identity():
+    cache = _HtmlCache()
+    gt = GT(exibble).fmt(lambda x: str(x), columns="num")
+
+    cache.put(cache.key(gt), gt, "<table></table>")
+
+    gt_equal = GT(exibble).fmt(lambda x: str(x), columns="num")
+
+    assert cache.key(gt) == id(gt)
+    assert cache.get(cache.key(gt), gt) == "<table></table>"
+    assert cache.get(cache.key(gt_equal), gt_equal) is None
+
+
+def test_html_cache_drops_least_recent():
+    cache = _HtmlCache(size=2)
+    gt_1, gt_2, gt_3 = [GT(exibble).tab_header(title) for title in ["1", "2", "3"]]
+
+    for gt in [gt_1, gt_2]:
+        cache.put(cache.key(gt), gt, gt._heading.title)
+
+    cache.get(cache.key(gt_1), gt_1)
+    cache.put(cache.key(gt_3), gt_3, "3")
+
+    assert cache.get(cache.key(gt_1), gt_1) == "1"
+    assert cache.get(cache.key(gt_2), gt_2) is None
+    assert cache.get(cache.key(gt_3), gt_3) == "3"
+
+
+def test_render_in_executor():
+    gt = GT(exibble, id="test")
+
+    with ThreadPoolExecutor(1) as executor:
+        html = asyncio.run(_render_in_executor(gt, executor))
+
+    assert html == gt._repr_html_()
+
+
+def test_render_in_process_pool():
+    gt = GT(exibble, id="test").fmt_number("num").tab_header("title")
+
+    with ProcessPoolExecutor(1) as executor:
+        html = asyncio.run(_render_in_executor(gt, executor))
+
+    assert html == gt._repr_html_()
+
+
+@pytest.mark.parametrize("started", [False, True])
+def test_render_in_executor_stale(monkeypatch: pytest.MonkeyPatch, started: bool):
+    release = threading.Event()
+    render_html = great_tables.shiny._render_html
+
+    def slow_render_html(value: GT) -> str:
+        release.wait()
+        return render_html(value)
+
+    monkeypatch.setattr(great_tables.shiny, "_render_html", slow_render_html)
+
+    async def render_and_invalidate(executor: ThreadPoolExecutor):
+        ctx = Context()
+        with ctx():
+            task = asyncio.ensure_future(_render_in_executor(GT(exibble), executor))
+
+        await asyncio.sleep(0.05)
+        ctx.invalidate()
+        release.set()
+
+        await task
+
+    with ThreadPoolExecutor(1) as executor:
+        if not started:
+            # keep the executor busy, so the render is still queued when invalidated
+            executor.submit(release.wait)
+
+        with pytest.raises(SilentCancelOutputException):
+            asyncio.run(render_and_invalidate(executor))
+
+
+def test_render_gt_with_params():
+    with ThreadPoolExecutor(1) as executor:
+        decorator = render_gt(executor=executor, cache=True)
+
+    assert callable(decorator)
+
+
+def _parts(keys: list[str], rows: list[str], frame: str | None = "frame") -> _TableParts:
+    return _TableParts(html="", frame=frame, keys=keys, rows=rows)
+
+
+def test_diff_body_rows():
+    previous = _parts(["a", "b", "c", "d"], ["A", "B", "C", "D"])
+    current = _parts(["a", "b", "d", "e", "c"], ["A", "B", "D2", "E", "C"])
+
+    assert _diff_body_rows(previous, current) == [[0, 2], "D2", "E", [2, 3]]
+
+
+def test_diff_body_rows_unchanged():
+    previous = _parts(["a", "b"], ["A", "B"])
+
+    assert _diff_body_rows(previous, previous) == [[0, 2]]
+
+
+def test_diff_body_rows_full_render():
+    previous = _parts(["a", "b"], ["A", "B"])
+
+    # something outside the body changed
+    assert _diff_body_rows(previous, _parts(["a", "b"], ["A", "B"], frame="other")) is None
+    assert _diff_body_rows(_parts(["a"], ["A"], frame=None), _parts(["a"], ["A"], None)) is None
+
+    # row keys that aren't unique can't be matched
+    assert _diff_body_rows(previous, _parts(["a", "a"], ["A", "B"])) is None
+
+
+def test_render_table_parts():
+    df = pl.DataFrame({"key": ["a", "b"], "x": [1, 2]})
+
+    parts = _render_table_parts(GT(df, rowname_col="key"), default_id="out_table")
+    new_parts = _render_table_parts(
+        GT(df.with_columns(x=pl.col("x") * 10), rowname_col="key"), default_id="out_table"
+    )
+    header_parts = _render_table_parts(
+        GT(df, rowname_col="key").tab_header("Title"), default_id="out_table"
+    )
+
+    assert parts.keys == ["row:a", "row:b"]
+    assert 'id="out_table"' in parts.html
+    assert all(row in parts.html for row in parts.rows)
+
+    assert new_parts.frame == parts.frame
+    assert new_parts.rows != parts.rows
+    assert header_parts.frame != parts.frame
+
+
+def test_render_table_parts_keeps_id():
+    parts = _render_table_parts(GT(exibble, id="my_table"), default_id="out_table")
+
+    assert 'id="my_table"' in parts.html
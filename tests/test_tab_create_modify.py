@@ -33,10 +33,11 @@ def test_tab_style_multiple_columns(gt: GT):
     style = CellStyleFill(color="blue")
     new_gt = tab_style(gt, style, LocBody(["x", "y"], [0]))
 
-    assert len(new_gt._styles) == 2
+    assert len(new_gt._styles) == 1
 
     assert len(new_gt._styles[0].styles) == 1
     assert new_gt._styles[0].styles[0] is style
+    assert new_gt._styles[0].cells.resolve() == [("x", 0), ("y", 0)]
 
 
 def test_tab_style_google_font(gt: GT):
@@ -84,22 +85,16 @@ def test_tab_style_loc_body_mask(gt2: GT):
     new_gt = tab_style(gt2, style, LocBody(mask=cs.numeric().gt(1.5)))
 
     assert len(gt2._styles) == 0
-    assert len(new_gt._styles) == 3
-
-    xy_0y, xy_1x, xy_1y = new_gt._styles
-
-    assert xy_0y.styles[0] is style
-    assert xy_1x.styles[0] is style
-    assert xy_1y.styles[0] is style
+    assert len(new_gt._styles) == 2
 
-    assert xy_0y.rownum == 0
-    assert xy_0y.colname == "y"
+    # the mask selects different rows for each column
+    xy_x, xy_y = new_gt._styles
 
-    assert xy_1x.rownum == 1
-    assert xy_1x.colname == "x"
+    assert xy_x.styles[0] is style
+    assert xy_y.styles[0] is style
 
-    assert xy_1y.rownum == 1
-    assert xy_1y.colname == "y"
+    assert xy_x.cells.resolve() == [("x", 1)]
+    assert xy_y.cells.resolve() == [("y", 0), ("y", 1)]
 
 
 def test_tab_style_loc_body_raises(gt2: GT):
@@ -1,27 +1,39 @@
 import math
+import warnings
 import pandas as pd
 import polars as pl
 import pyarrow as pa
 import polars.testing
 import pytest
+import great_tables._tbl_data
 from great_tables import GT
 from great_tables._utils_render_html import create_body_component_h
 from great_tables._tbl_data import (
     DataFrameLike,
     SeriesLike,
+    _escape_string_cells,
     _get_cell,
+    _get_cells,
     _get_column_dtype,
     _set_cell,
     _validate_selector_list,
     cast_frame_to_string,
+    collect_frame,
     create_empty_frame,
+    create_string_frame,
     eval_select,
+    flatten_list_column,
     get_column_names,
+    group_offsets,
     group_splits,
+    is_na,
+    is_number_like,
     is_series,
     reorder,
+    select_columns,
     to_frame,
     to_list,
+    to_numeric_array,
     validate_frame,
     copy_frame,
 )
@@ -74,6 +86,51 @@ def test_get_cell(df: DataFrameLike):
     assert _get_cell(df, 1, "col2") == "b"
 
 
+def test_get_cell_pyarrow_list_is_array_view():
+    df = pa.table({"x": pa.array([[1.5, 2.5], None, [3.5]], pa.list_(pa.float64()))})
+
+    res = _get_cell(df, 0, "x")
+
+    # like polars, the cell is a series over the column's values, rather than a list
+    assert isinstance(res, pa.Array)
+    assert res.to_pylist() == [1.5, 2.5]
+    assert _get_cell(df, 1, "x") is None
+    assert _get_cells(df, "x", [0, 2]) == [[1.5, 2.5], [3.5]]
+
+
+def test_get_cells(df: DataFrameLike):
+    assert _get_cells(df, "col2", [2, 0]) == ["c", "a"]
+    assert _get_cells(df, "col3", []) == []
+
+
+def test_get_cells_matches_get_cell_pandas():
+    df = pd.DataFrame(
+        {
+            "f32": pd.array([0.1, None], dtype="float32"),
+            "dt": pd.to_datetime(["2020-01-01", None]),
+            "int": pd.array([1, None], dtype="Int64"),
+        }
+    )
+
+    for col in df.columns:
+        cells = _get_cells(df, col, [0, 1])
+        expected = [_get_cell(df, 0, col), _get_cell(df, 1, col)]
+
+        assert [type(x) for x in cells] == [type(x) for x in expected]
+        assert [str(x) for x in cells] == [str(x) for x in expected]
+
+
+def test_escape_string_cells():
+    data = {"s": ["a_b", None, "\\%"], "n": [1, 2, 3]}
+
+    for df in [pl.DataFrame(data), pa.table(data)]:
+        assert _escape_string_cells(df, "s", [0, 1, 2], chars="\\_%") == ["a\\_b", None, "\\\\\\%"]
+        assert _escape_string_cells(df, "s", [2], chars="%") == ["\\\\%"]
+        assert _escape_string_cells(df, "n", [0, 1, 2], chars="_") is None
+
+    assert _escape_string_cells(pd.DataFrame(data), "s", [0, 1, 2], chars="_") is None
+
+
 def test_set_cell(df: DataFrameLike):
     expected_data = {"col1": [1, 2, 3], "col2": ["a", "x", "c"], "col3": [4.0, 5.0, 6.0]}
     if isinstance(df, pa.Table):
@@ -188,6 +245,82 @@ def test_group_splits_pd(Frame):
     assert splits["c"] == [3]
 
 
+@pytest.mark.parametrize("Frame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_group_offsets(Frame):
+    df = Frame({"g": ["b", "a", "b", "c", "a"]})
+
+    keys, row_order, offsets = group_offsets(df, "g")
+    assert keys == ["b", "a", "c"]
+    assert row_order.tolist() == [0, 2, 1, 4, 3]
+    assert offsets.tolist() == [0, 2, 4, 5]
+
+
+@pytest.mark.parametrize("Frame", [pl.DataFrame, pa.table])
+def test_group_offsets_null(Frame):
+    df = Frame({"g": [None, "a", None, "b"]})
+
+    keys, row_order, offsets = group_offsets(df, "g")
+    assert keys == [None, "a", "b"]
+    assert row_order.tolist() == [0, 2, 1, 3]
+    assert offsets.tolist() == [0, 2, 3, 4]
+
+
+@pytest.mark.parametrize("pd_version", ["1.4.4", pd.__version__])
+def test_group_offsets_null_pandas(pd_version, monkeypatch):
+    factorize = pd.factorize
+
+    def factorize_compat(values, sort=False, **kwargs):
+        # pandas before 1.5 only has na_sentinel=, where None keeps missing values as a group
+        if pd_version < "1.5":
+            assert kwargs == {"na_sentinel": None}
+            kwargs = {"use_na_sentinel": False}
+
+        return factorize(values, sort=sort, **kwargs)
+
+    monkeypatch.setattr(pd, "__version__", pd_version)
+    monkeypatch.setattr(pd, "factorize", factorize_compat)
+
+    keys, row_order, offsets = group_offsets(pd.DataFrame({"g": ["b", None, "b", "a"]}), "g")
+
+    assert keys[0] == "b" and pd.isna(keys[1]) and keys[2] == "a"
+    assert row_order.tolist() == [0, 2, 1, 3]
+    assert offsets.tolist() == [0, 2, 3, 4]
+
+
+@pytest.mark.parametrize("Frame", [pd.DataFrame, pl.DataFrame, pa.table])
+def test_group_offsets_numeric_keys(Frame):
+    df = Frame({"g": [3, 1, 3, 2]})
+
+    keys, row_order, offsets = group_offsets(df, "g")
+    assert keys == [3, 1, 2]
+    assert row_order.tolist() == [0, 2, 1, 3]
+    assert offsets.tolist() == [0, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"g": pd.Series([], dtype=str)}),
+        pl.DataFrame({"g": pl.Series([], dtype=pl.String)}),
+        pa.table({"g": pa.array([], pa.string())}),
+    ],
+)
+def test_group_offsets_empty(df: DataFrameLike):
+    keys, row_order, offsets = group_offsets(df, "g")
+    assert keys == []
+    assert row_order.tolist() == []
+    assert offsets.tolist() == [0]
+
+
+def test_group_offsets_arrow_dictionary():
+    df = pa.table({"g": pa.array(["b", "a", "b"]).dictionary_encode()})
+    df = df.set_column(0, "g", df.column("g").cast(pa.dictionary(pa.int32(), pa.string())))
+
+    keys, row_order, offsets = group_offsets(df, "g")
+    assert keys == ["b", "a"]
+    assert row_order.tolist() == [0, 2, 1]
+
+
 def test_group_splits_pd_na():
     df = pd.DataFrame({"g": ["b", "a", None]})
 
@@ -239,6 +372,25 @@ def test_create_empty_frame(df: DataFrameLike):
     assert_frame_equal(res, dst)
 
 
+def test_create_string_frame(df: DataFrameLike):
+    res = create_string_frame(df, {"col2": ["x", None, "z"]})
+
+    assert get_column_names(res) == ["col1", "col2", "col3"]
+    assert [_get_cell(res, ii, "col2") for ii in range(3)] in (["x", None, "z"], ["x", pd.NA, "z"])
+    assert all(is_na(res, _get_cell(res, ii, "col1")) for ii in range(3))
+
+
+def test_create_string_frame_no_values(df: DataFrameLike):
+    assert_frame_equal(create_string_frame(df, {}), create_empty_frame(df))
+
+
+def test_select_columns(df: DataFrameLike):
+    res = select_columns(df, ["col3", "col1"])
+
+    assert get_column_names(res) == ["col3", "col1"]
+    assert to_list(res["col1"]) == [1, 2, 3]
+
+
 def test_validate_frame_dupe_cols():
     df = pd.DataFrame([[1, 2, 3]], columns=["x", "x", "y"])
 
@@ -278,6 +430,108 @@ def test_validate_frame_non_str_cols_result():
     assert list(res.columns) == ["x", "55", "y", "99"]
 
 
+def test_collect_frame_eager_unchanged(df: DataFrameLike):
+    assert collect_frame(df) is df
+
+
+def test_collect_frame_polars_lazy():
+    lazy = pl.LazyFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]}).filter(pl.col("x") > 1)
+
+    res = collect_frame(lazy)
+
+    assert isinstance(res, pl.DataFrame)
+    assert_frame_equal(res, pl.DataFrame({"x": [2, 3], "y": ["b", "c"]}))
+
+
+def test_collect_frame_duckdb_relation():
+    duckdb = pytest.importorskip("duckdb")
+
+    rel = duckdb.sql("SELECT * FROM range(4) t(x) WHERE x > 1")
+
+    res = collect_frame(rel)
+
+    assert isinstance(res, pl.DataFrame)
+    assert res["x"].to_list() == [2, 3]
+
+
+def test_gt_duckdb_relation_matches_eager():
+    duckdb = pytest.importorskip("duckdb")
+
+    df = pl.DataFrame({"x": [1, 2], "y": ["a", "b"]})
+    rel = duckdb.sql("SELECT * FROM df")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        gt_duckdb = GT(rel, rowname_col="y")
+
+    assert (
+        gt_duckdb.with_id("x").as_raw_html() == GT(df, rowname_col="y").with_id("x").as_raw_html()
+    )
+
+
+def test_gt_polars_lazy_matches_eager():
+    df = pl.DataFrame({"x": [1, 2], "y": ["a", "b"], "g": ["one", "two"]})
+
+    gt_lazy = GT(df.lazy(), rowname_col="y", groupname_col="g")
+    gt_eager = GT(df, rowname_col="y", groupname_col="g")
+
+    assert isinstance(gt_lazy._tbl_data, pl.DataFrame)
+    assert gt_lazy.with_id("x").as_raw_html() == gt_eager.with_id("x").as_raw_html()
+
+
+@pytest.fixture
+def collected_columns(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Record the columns of every lazy query that is collected."""
+
+    collected = []
+
+    def collect_spy(data):
+        res = collect_frame(data)
+        if res is not data:
+            collected.append(get_column_names(res))
+        return res
+
+    monkeypatch.setattr(great_tables._tbl_data, "collect_frame", collect_spy)
+
+    return collected
+
+
+@pytest.mark.parametrize("make_lazy", ["polars", "duckdb"])
+def test_gt_lazy_collects_used_columns(collected_columns: list[list[str]], make_lazy: str):
+    df = pl.DataFrame({"x": [1.5, 2.5], "y": ["a", "b"], "z": [1, 2], "unused": [3, 4]})
+
+    if make_lazy == "duckdb":
+        duckdb = pytest.importorskip("duckdb")
+        lazy = duckdb.sql("SELECT * FROM df")
+    else:
+        lazy = df.lazy()
+
+    gt_lazy = GT(lazy, rowname_col="y").fmt_number("x").cols_hide(["z", "unused"])
+    gt_eager = GT(df, rowname_col="y").fmt_number("x").cols_hide(["z", "unused"])
+
+    # creating the table only collects the stub
+    assert collected_columns == [["y"]]
+
+    html = gt_lazy.with_id("x").as_raw_html()
+
+    # rendering only collects the columns that are shown, and the whole query never is
+    assert collected_columns == [["y"], ["x", "y"]]
+    assert gt_lazy._tbl_source._frame is None
+    assert html == gt_eager.with_id("x").as_raw_html()
+
+
+def test_gt_lazy_collects_whole_query_once(collected_columns: list[list[str]]):
+    df = pl.DataFrame({"x": [1.5, 2.5], "y": ["a", "b"]})
+
+    gt_lazy = GT(df.lazy()).data_color("x")
+    gt_lazy.as_raw_html()
+    gt_lazy.as_raw_html()
+
+    # data_color() needs all of the data, and later renders reuse it
+    assert collected_columns == [["x"], ["x", "y"]]
+    assert_frame_equal(gt_lazy._tbl_data, df)
+
+
 def test_to_frame(ser: SeriesLike):
     df = to_frame(ser, name="x")
 
@@ -305,6 +559,50 @@ def test_to_list(ser: SeriesLike):
     assert pylist[:2] == [1.0, 2.0]
 
 
+def test_to_numeric_array(ser: SeriesLike):
+    res = to_numeric_array(ser)
+
+    if isinstance(ser, pd.Series):
+        # pandas float series hold missing values as NaN already
+        assert res[:2].tolist() == [1.0, 2.0]
+        assert math.isnan(res[2])
+    else:
+        assert res is None
+
+
+def test_to_numeric_array_no_nulls():
+    ser = pl.DataFrame({"x": [[1, 2, 3]]})["x"][0]
+    res = to_numeric_array(ser)
+
+    assert res.tolist() == [1, 2, 3]
+    assert not res.flags.owndata
+
+    assert to_numeric_array(pa.array([1, 2])).tolist() == [1, 2]
+    assert to_numeric_array(pd.Series([1, 2], dtype="Int64")).tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "ser",
+    [pd.Series(["a"]), pl.Series(["a"]), pa.array(["a"]), pd.Series([1, None], dtype="Int64")],
+)
+def test_to_numeric_array_not_numeric(ser: SeriesLike):
+    assert to_numeric_array(ser) is None
+
+
+@pytest.mark.parametrize("frame", [pl.DataFrame, pa.table])
+def test_flatten_list_column(frame):
+    df = frame({"x": [[1, 2], [3, None], None, []], "y": ["a", "b", "c", "d"]})
+
+    assert flatten_list_column(df, "x").tolist() == [1, 2, 3]
+    assert flatten_list_column(df, "y") is None
+
+
+def test_flatten_list_column_pandas():
+    df = pd.DataFrame({"x": [[1, 2], [3]]})
+
+    assert flatten_list_column(df, "x") is None
+
+
 def test_cast_frame_to_string_polars_list_col():
     df = pl.DataFrame({"x": [[1, 2], [3]], "y": [1, None], "z": [{"a": 1}, {"a": 2}]})
     new_df = cast_frame_to_string(df)
@@ -323,3 +621,32 @@ def test_copy_frame(df: DataFrameLike):
     copy_df = copy_frame(df)
     assert id(copy_df) != id(df)
     assert_frame_equal(copy_df, df)
+
+
+@pytest.mark.parametrize(
+    "vals, expected",
+    [
+        (["1", "2015-01-01", "12:30", "1.5", ""], True),
+        (["1", "x"], False),
+        (["1", 2, None, 3.5], True),
+        ([1, 2, 3], True),
+        ([], True),
+    ],
+)
+def test_is_number_like_pandas(vals: list, expected: bool):
+    ser = pd.Series(vals, dtype=object)
+
+    assert is_number_like(ser) is expected
+    assert is_number_like(ser, chunk_size=1) is expected
+
+
+def test_is_number_like_pandas_chunks():
+    ser = pd.Series(["1"] * 5 + ["a"] + [4] * 5, dtype=object)
+
+    assert not is_number_like(ser, chunk_size=2)
+    assert is_number_like(ser.head(5), chunk_size=2)
+
+
+def test_is_number_like_default():
+    assert is_number_like(pl.Series(["1", "2:30"], dtype=pl.Object))
+    assert not is_number_like(pl.Series(["1", "x"], dtype=pl.Object))
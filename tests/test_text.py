@@ -6,6 +6,7 @@ from great_tables._text import (
     Md,
     Html,
     _latex_escape,
+    _latex_escape_many,
     escape_pattern_str_latex,
     _process_text,
 )
@@ -37,6 +38,18 @@ def test_latex_escape():
     assert _latex_escape("a & b") == "a \\& b"
     assert _latex_escape("a & b & c") == "a \\& b \\& c"
     assert _latex_escape("\\a_\\d") == "\\\\a\\_\\\\d"
+    assert _latex_escape("#{~^}") == "\\#\\{\\~\\^\\}"
+
+
+def test_latex_escape_many():
+    texts = ["a & b", "", "50%", "\\a_\\d", "plain"]
+    assert _latex_escape_many(texts) == [_latex_escape(text) for text in texts]
+    assert _latex_escape_many([]) == []
+
+
+def test_latex_escape_many_separator_in_text():
+    texts = ["a\x00&", "b"]
+    assert _latex_escape_many(texts) == ["a\x00\\&", "b"]
 
 
 def test_escape_pattern_str_latex():
@@ -1,4 +1,7 @@
 from collections.abc import Generator
+
+import polars as pl
+import pyarrow as pa
 import pytest
 
 
@@ -201,6 +204,35 @@ def test_migrate_unformatted_to_output_latex():
     assert migrated._body.body["char"].tolist() == ["apricot", "banana"]
 
 
+def test_migrate_unformatted_to_output_latex_partial_rows():
+    gt_tbl = GT(exibble.head(3)).fmt_number(columns="num", rows=[1], decimals=3)
+
+    rendered = gt_tbl._render_formats(context="latex")
+    migrated = _migrate_unformatted_to_output(
+        data=rendered, data_tbl=rendered._tbl_data, formats=rendered._formats, context="latex"
+    )
+
+    assert migrated._body.body["num"].tolist() == ["0.1111", "2.222", "33.33"]
+    assert migrated._body.body["char"].tolist() == ["apricot", "banana", "coconut"]
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@pytest.mark.parametrize("frame", [pl.DataFrame, pa.table])
+def test_migrate_unformatted_to_output_latex_escapes_strings(frame):
+    # string columns are escaped by the backend, with missing values shown as in other columns
+    df = frame({"s": ["a_b", None, "50% & #1"], "n": [1.0, 2.0, None]})
+    gt_tbl = GT(df).fmt_number(columns="n", rows=[0])
+
+    rendered = gt_tbl._render_formats(context="latex")
+    migrated = _migrate_unformatted_to_output(
+        data=rendered, data_tbl=rendered._tbl_data, formats=rendered._formats, context="latex"
+    )
+
+    body = migrated._body.text_columns(rendered._tbl_data, ["s"])
+
+    assert body["s"] == ["a\\_b", "None", "50\\% \\& \\#1"]
+
+
 def test_migrate_unformatted_to_output_html():
     gt_tbl = GT(exibble.head(2)).fmt_number(columns="num", decimals=3)
 
@@ -3,6 +3,7 @@ import polars as pl
 from great_tables import GT, exibble, html, loc, md, style
 from great_tables._utils_render_html import (
     create_body_component_h,
+    create_body_rows_h,
     create_columns_component_h,
     create_heading_component_h,
     create_source_notes_component_h,
@@ -61,6 +62,26 @@ def test_render_groups_reordered(snapshot):
     assert_rendered_body(snapshot, new_gt)
 
 
+def test_body_rows_keys():
+    df = pd.DataFrame({"row": ["x", "y", "z"], "g": ["A", "B", "A"], "val": [1, 2, 3]})
+
+    keyed_rows = create_body_rows_h(
+        GT(df, rowname_col="row", groupname_col="g")._build_data("html")
+    )
+    assert [key for key, _ in keyed_rows] == ["group:A", "row:x", "row:z", "group:B", "row:y"]
+
+    keyed_rows = create_body_rows_h(GT(df)._build_data("html"))
+    assert [key for key, _ in keyed_rows] == ["row:0", "row:1", "row:2"]
+
+
+def test_body_rows_joined_in_body():
+    built = GT(small_exibble)._build_data("html")
+    body = create_body_component_h(built)
+
+    for _, row in create_body_rows_h(built):
+        assert row in body
+
+
 def test_body_multiple_locations(snapshot):
     new_gt = GT(small_exibble).tab_style(
         style=style.fill(color="red"),
@@ -193,6 +214,25 @@ def test_multiple_spanners_pads_for_stubhead_label(snapshot):
     assert_rendered_columns(snapshot, gt)
 
 
+def test_multiple_spanners_with_column_label_styles():
+    gt = (
+        GT(pl.DataFrame({"a": [1], "b": [2], "c": [3]}))
+        .tab_spanner("inner", ["a", "b"])
+        .tab_spanner("outer", spanners=["inner"])
+        .tab_style(style.fill("yellow"), loc.column_labels(columns="a"))
+        .tab_style(style.text(color="red"), loc.column_header())
+    )
+
+    el = create_columns_component_h(gt._build_data("html"))
+    outer_row = el.split("</tr>")[0]
+
+    # the higher spanner rows only get the styles shared by all column labels
+    assert "outer" in outer_row
+    assert "color: red;" in outer_row
+    assert "background-color: yellow;" not in outer_row
+    assert el.count("background-color: yellow;") == 1
+
+
 # Location style rendering -------------------------------------------------------------------------
 # these tests focus on location classes being correctly picked up
 def test_loc_column_labels():
@@ -201,9 +241,11 @@ def test_loc_column_labels():
     new_gt = gt.tab_style(style.fill("yellow"), loc.column_labels(columns=["x"]))
     el = create_columns_component_h(new_gt._build_data("html"))
 
-    assert el.name == "tr"
-    assert el.children[0].attrs["style"] == "background-color: yellow;"
-    assert "style" not in el.children[1].attrs
+    x_th, y_th = el.split("\n")[1:3]
+
+    assert el.startswith("<tr ")
+    assert 'style="background-color: yellow;"' in x_th
+    assert "style" not in y_th
 
 
 def test_loc_kitchen_sink(snapshot):
@@ -1,3 +1,4 @@
+import io
 import pytest
 from unittest import mock
 import pandas as pd
@@ -6,6 +7,7 @@ import os
 from great_tables import GT, exibble
 from great_tables.data import gtcars
 
+from great_tables._tbl_data import cast_frame_to_string
 from great_tables._utils_render_latex import (
     is_css_length_string,
     is_number_without_units,
@@ -18,6 +20,7 @@ from great_tables._utils_render_latex import (
     create_fontsize_statement_l,
     create_heading_component_l,
     create_body_component_l,
+    _iter_body_rows_l,
     create_columns_component_l,
     create_footer_component_l,
     create_wrap_end_l,
@@ -252,6 +255,21 @@ def test_create_body_component_l_simple(gt_tbl: GT):
     assert create_body_component_l(data=gt_tbl) == "1 & 4 \\\\\n2 & 5 \\\\"
 
 
+def test_iter_body_rows_l_chunks():
+    df = pd.DataFrame({"g": ["a", "b", "a", "b", "a"], "x": [1, 2, 3, 4, 5]})
+    gt_tbl = GT(df, groupname_col="g").fmt_integer(columns="x", rows=[0, 1], pattern="<{x}>")
+    data = gt_tbl._build_data(context="default")
+
+    with mock.patch(
+        "great_tables._gt_data.cast_frame_to_string", wraps=cast_frame_to_string
+    ) as cast:
+        rows = list(_iter_body_rows_l(data, chunk_size=2))
+
+    # the rows are in group order, and only the rows of each chunk are cast to strings
+    assert rows == ["<1> \\\\", "3 \\\\", "5 \\\\", "<2> \\\\", "4 \\\\"]
+    assert [len(call.args[0]) for call in cast.call_args_list] == [2, 2, 1]
+
+
 def test_create_footer_component_one_note(gt_tbl: GT):
     gt_tbl_new = gt_tbl.tab_source_note(source_note="Source Note.")
 
@@ -511,3 +529,44 @@ def test_render_as_latex_rowgroup_raises():
         _render_as_latex(data=gt_tbl._build_data(context="latex"))
 
     assert "Row groups are not yet supported in LaTeX output." in exc_info.value.args[0]
+
+
+@pytest.mark.parametrize("use_longtable", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_write_latex_matches_as_latex(use_longtable: bool, chunk_size: int):
+    gt_tbl = (
+        GT(exibble[["num", "char", "fctr", "currency"]])
+        .tab_header(title="Title", subtitle="Subtitle")
+        .tab_source_note("A source note")
+        .fmt_number(columns="num", decimals=1)
+    )
+
+    stream = io.StringIO()
+    gt_tbl.write_latex(stream, use_longtable=use_longtable, chunk_size=chunk_size)
+
+    assert stream.getvalue() == gt_tbl.as_latex(use_longtable=use_longtable)
+
+
+def test_write_latex_no_rows():
+    gt_tbl = GT(pd.DataFrame({"x": pd.Series([], dtype="int64")}))
+
+    stream = io.StringIO()
+    gt_tbl.write_latex(stream)
+
+    assert stream.getvalue() == gt_tbl.as_latex()
+
+
+def test_write_latex_to_file(tmp_path):
+    gt_tbl = GT(pd.DataFrame({"x": ["a_b", "c%d"]}))
+
+    path = tmp_path / "table.tex"
+    gt_tbl.write_latex(path, use_longtable=True)
+
+    assert path.read_text(encoding="utf-8") == gt_tbl.as_latex(use_longtable=True)
+    assert "a_b" not in path.read_text(encoding="utf-8")
+    assert "a\\_b \\\\\nc\\%d \\\\" in path.read_text(encoding="utf-8")
+
+
+def test_write_latex_chunk_size_raises(gt_tbl: GT):
+    with pytest.raises(ValueError, match="chunk_size"):
+        gt_tbl.write_latex(io.StringIO(), chunk_size=0)